@@ -0,0 +1,311 @@
+import os
+
+# 렌더링 측정도 창 없이 돌 수 있도록 pygame을 불러오기 전에 더미 비디오 드라이버를 지정
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+# pygame이 import 시 stdout에 찍는 인사말이 JSON 보고서 앞에 섞이지 않도록 끔
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import contextlib
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import pygame
+
+from board import BoardFinite, BoardInfinite
+from constants import *
+from renderer import Renderer
+from replay import SessionLog, replay
+
+BASE_SEED = 20240601  # 모든 측정의 기준 시드 (반복 i회차는 BASE_SEED + i)
+SRC_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+def _measure(setup, run, repeat):
+    """(내부용) 반복마다 `setup(seed)`으로 새 상태를 만들고 `run(state)` 시간만 잽니다. 초 단위 목록을 반환합니다."""
+    times = []
+    for i in range(repeat):
+        state = setup(BASE_SEED + i)
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _generated_board(width, height, mines, seed):
+    """(내부용) 가운데를 첫 클릭으로 해서 지뢰를 배치한 보드 (풀이 가능성 검사 없음)."""
+    board = BoardFinite(width, height, mines, solvable=False, seed=seed)
+    board.generate(width // 2, height // 2)
+    return board
+
+
+def generation_cases():
+    for width, height, mines in ((30, 16, 99), (100, 100, 1500), (200, 200, 8000)):
+        def setup(seed, width=width, height=height, mines=mines):
+            return BoardFinite(width, height, mines, solvable=False, vectorized=False, seed=seed)
+        yield ('generate_standard_board', {'width': width, 'height': height, 'mines': mines},
+               setup, lambda board: board._generate_standard_board(board.width // 2, board.height // 2))
+
+    for width, height, mines in ((9, 9, 10), (16, 16, 40), (30, 16, 99), (50, 50, 400)):
+        def setup(seed, width=width, height=height, mines=mines):
+            return _generated_board(width, height, mines, seed)
+        yield ('is_solvable', {'width': width, 'height': height, 'mines': mines},
+               setup, lambda board: board._is_solvable(board.width // 2, board.height // 2))
+
+    # 밀도별 '추측 없는' 생성과 큰 보드의 단순 생성 (병렬 워커와 보드 풀은 쓰지 않음)
+    for width, height, mines, solvable in ((9, 9, 10, True), (16, 16, 40, True), (30, 16, 99, True),
+                                           (200, 200, 4000, False), (200, 200, 10000, False)):
+        def setup(seed, width=width, height=height, mines=mines, solvable=solvable):
+            return BoardFinite(width, height, mines, solvable=solvable, seed=seed)
+        yield ('generate', {'width': width, 'height': height, 'mines': mines, 'solvable': solvable},
+               setup, lambda board: board.generate(board.width // 2, board.height // 2))
+
+
+def play_cases():
+    for size, density in ((100, 0.01), (300, 0.01), (300, 0.05)):
+        def setup(seed, size=size, density=density):
+            return _generated_board(size, size, int(size * size * density), seed)
+        yield ('reveal_cell_flood', {'width': size, 'height': size, 'density': density},
+               setup, lambda board: board.reveal_cell(board.width // 2, board.height // 2))
+
+    def chord_setup(seed):
+        # 연 칸 주변의 지뢰에 모두 깃발을 꽂아 두고, 숫자 칸마다 코드를 누름
+        board = _generated_board(100, 100, 1500, seed)
+        board.reveal_cell(50, 50)
+        targets = []
+        for y in range(board.height):
+            for x in range(board.width):
+                cell = board.get_cell(x, y)
+                if cell.is_revealed and cell.adjacent_mines:
+                    for n in board.get_neighbors(x, y):
+                        if n.is_mine and not n.is_flagged:
+                            board.toggle_flag(n.x, n.y)
+                    targets.append((x, y))
+        return board, targets
+
+    def chord_run(state):
+        board, targets = state
+        for x, y in targets:
+            board.chord(x, y)
+    yield 'chord', {'width': 100, 'height': 100, 'mines': 1500}, chord_setup, chord_run
+
+    def chunk_setup(seed, solvable=False):
+        return BoardInfinite(seed=seed, solvable=solvable)
+
+    def chunk_run(board):
+        size = board.CHUNK_SIZE
+        for cy in range(10, 18):
+            for cx in range(10, 18):
+                board._ensure_chunk_generated(cx * size, cy * size)
+    yield 'ensure_chunk_generated', {'chunks': 64}, chunk_setup, chunk_run
+    yield ('ensure_chunk_generated', {'chunks': 64, 'solvable': True},
+           lambda seed: chunk_setup(seed, solvable=True), chunk_run)
+
+
+def render_cases():
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, UI_FONT_SIZE)
+    sprites = {}
+    for name, color in (('flag_img', 'yellow'), ('mine_img', 'black'), ('mine_bomb_img', 'red')):
+        sprites[name] = pygame.Surface((TILE_SIZE_DEFAULT, TILE_SIZE_DEFAULT))
+        sprites[name].fill(pygame.Color(color))
+
+    def make_board(kind, seed):
+        if kind == 'infinite':
+            return BoardInfinite(seed=seed)
+        board = _generated_board(200, 200, 6000, seed)
+        board.reveal_cell(100, 100)
+        return board
+
+    for kind in ('finite', 'infinite'):
+        for tile_size in (TILE_SIZE_MIN, TILE_SIZE_DETAIL_MIN, TILE_SIZE_MAX):
+            def setup(seed, kind=kind, tile_size=tile_size):
+                renderer = Renderer(screen, font, dict(sprites), None)
+                renderer.set_tile_size(tile_size)
+                board = make_board(kind, seed)
+                camera = (100 * tile_size - SCREEN_WIDTH // 2, 100 * tile_size - SCREEN_HEIGHT // 2)
+                if kind == 'infinite':
+                    camera = (-SCREEN_WIDTH // 2, -SCREEN_HEIGHT // 2)
+                # 화면 가운데에서 가까운 가려진 칸 7개에 깃발을 꽂았다 뺌
+                center_x = (camera[0] + SCREEN_WIDTH // 2) // tile_size
+                center_y = (camera[1] + SCREEN_HEIGHT // 2) // tile_size
+                targets = [(x, y) for y in range(center_y - 10, center_y + 11) for x in range(center_x - 10, center_x + 11)
+                           if board.get_cell(x, y) and not board.get_cell(x, y).is_revealed][:7]
+                return renderer, board, camera, targets
+
+            def warm_setup(seed, setup=setup):
+                # 첫 프레임(블록 캐시 채우기)은 제외하고 이후 프레임만 잼
+                state = setup(seed)
+                state[0].draw_board(state[1], state[2])
+                return state
+
+            def cold(state):
+                renderer, board, camera, _ = state
+                renderer.draw_board(board, camera)
+
+            def pan(state):
+                renderer, board, (cam_x, cam_y), _ = state
+                for i in range(1, 61):
+                    renderer.draw_board(board, (cam_x + i * 15, cam_y + i * 9))
+
+            def flag(state):
+                renderer, board, camera, targets = state
+                for i in range(60):
+                    board.toggle_flag(*targets[i % len(targets)])
+                    renderer.draw_board(board, camera)
+
+            params = {'board': kind, 'tile_size': tile_size}
+            yield 'draw_board_first_frame', params, setup, cold
+            yield 'draw_board_pan_60_frames', params, warm_setup, pan
+            yield 'draw_board_flag_60_frames', params, warm_setup, flag
+
+
+def startup_cases(executable=None):
+    """새 프로세스를 띄워 재는 시작 시간. `executable`을 주면 그 실행 파일(PyInstaller 빌드)의 첫 메뉴 프레임을 잽니다."""
+    def run(command):
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    core = [sys.executable, '-c', f"import sys; sys.path.insert(0, {SRC_PATH!r}); import board, solver; "
+                                  "sys.exit('pygame' in sys.modules)"]
+    yield 'startup_import_core', {'modules': 'board,solver'}, lambda seed: core, run
+
+    if executable:
+        command, params = [executable, '--frames', '1'], {'build': 'executable'}
+    else:
+        command, params = [sys.executable, os.path.join(SRC_PATH, 'main.py'), '--frames', '1'], {'build': 'source'}
+    yield 'startup_first_menu_frame', params, lambda seed: command, run
+
+
+def replay_cases(paths=()):
+    """기록된 세션(`replay.py`)을 최대한 빠르게 다시 실행하는 측정. 보드 조작만, 그리고 그리기까지 포함해 잽니다."""
+    if not paths:
+        return
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, UI_FONT_SIZE)
+    sprites = {}
+    for name, color in (('flag_img', 'yellow'), ('mine_img', 'black'), ('mine_bomb_img', 'red')):
+        sprites[name] = pygame.Surface((TILE_SIZE_DEFAULT, TILE_SIZE_DEFAULT))
+        sprites[name].fill(pygame.Color(color))
+
+    for path in paths:
+        log = SessionLog.load(path)
+        params = {'file': os.path.basename(path), 'board_ops': log.board_ops, 'frames': log.frames}
+        yield 'replay_session', dict(params, render=False), lambda seed, log=log: log, replay
+        yield ('replay_session', dict(params, render=True),
+               lambda seed, log=log: (log, Renderer(screen, font, dict(sprites), None)),
+               lambda state: replay(*state))
+
+
+SUITES = {
+    'generation': generation_cases,
+    'play': play_cases,
+    'render': render_cases,
+    'startup': startup_cases,
+    'replay': replay_cases,
+}
+
+
+def run_suite(names, repeat, pattern=None, log=None):
+    """선택한 묶음의 측정을 실행하고 결과 사전 목록을 반환합니다."""
+    results = []
+    for suite in names:
+        for case, params, setup, run in SUITES[suite]():
+            if pattern and pattern not in case:
+                continue
+            times = _measure(setup, run, repeat)
+            result = {
+                'suite': suite,
+                'case': case,
+                'params': params,
+                'repeat': repeat,
+                'min_ms': round(min(times) * 1000, 3),
+                'median_ms': round(statistics.median(times) * 1000, 3),
+                'mean_ms': round(statistics.fmean(times) * 1000, 3),
+                'max_ms': round(max(times) * 1000, 3),
+            }
+            results.append(result)
+            if log:
+                log(f"{case} {json.dumps(params, sort_keys=True)}: median {result['median_ms']} ms")
+    return results
+
+
+def _result_key(result):
+    return result['case'], json.dumps(result['params'], sort_keys=True)
+
+
+def compare(results, baseline, tolerance):
+    """기준 결과와 중앙값을 비교해 `tolerance` 비율보다 느려진 측정 목록을 반환합니다."""
+    previous = {_result_key(r): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        old = previous.get(_result_key(result))
+        if old is None or old['median_ms'] <= 0:
+            continue
+        ratio = result['median_ms'] / old['median_ms']
+        result['baseline_median_ms'] = old['median_ms']
+        result['ratio'] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressions.append(result)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the headless benchmark suite and print JSON results.")
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES),
+                        help="suite to run (repeatable, default: all)")
+    parser.add_argument('--filter', help="only run cases whose name contains this text")
+    parser.add_argument('--exe', help="built executable to time in the startup suite instead of src/main.py")
+    parser.add_argument('--replay', action='append', default=[],
+                        help="session recording (.msrec) to time in the replay suite (repeatable)")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per case, each with its own fixed seed")
+    parser.add_argument('--output', help="write the JSON report to this file instead of stdout")
+    parser.add_argument('--baseline', help="JSON report to compare against; exits with status 1 on regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown of the median before it counts as a regression (default 0.25)")
+    args = parser.parse_args()
+
+    if args.exe:
+        SUITES['startup'] = lambda: startup_cases(args.exe)
+    SUITES['replay'] = lambda: replay_cases(args.replay)
+    pygame.init()
+    log = lambda message: print(message, file=sys.stderr)
+    # 보드 생성 중 안내 메시지가 JSON 출력에 섞이지 않도록 측정 중의 표준 출력은 표준 오류로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run_suite(args.suite or list(SUITES), args.repeat, args.filter, log)
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'seed': BASE_SEED,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for result in regressions:
+            log(f"REGRESSION {result['case']} {json.dumps(result['params'], sort_keys=True)}: "
+                f"{result['baseline_median_ms']} -> {result['median_ms']} ms (x{result['ratio']})")
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    pygame.quit()
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,214 @@
+import operator
 import random
-from collections import deque
-from cell import Cell
+from collections import OrderedDict, deque
+from functools import lru_cache
+from cell import CellView
+from chunk import Chunk, ChunkSpill, hashed_mine_mask, pack_cell_states
+from solver import NEIGHBOR_TABLE_LIMIT, Solver, TIER_NAMES, UNKNOWN_NUMBER, neighbor_counts, neighbor_table
+
+# 지뢰 마스크(0/1) -> 지뢰가 아닌 칸만 남기는 바이트 마스크(0xFF/0)
+_NOT_MINE = bytes.maketrans(b'\x00\x01', b'\xff\x00')
+
+NO_CELL = 0xFF  # cell_states에서 칸이 없는 자리의 값
+
+
+@lru_cache(maxsize=16)
+def _edge_masks(width, height):
+    """(내부용) 칸당 1바이트 정수 표현에서 첫 열/마지막 열을 제외하는 마스크를 반환합니다."""
+    not_first = int.from_bytes((b'\x00' + b'\xff' * (width - 1)) * height, 'little')
+    not_last = int.from_bytes((b'\xff' * (width - 1) + b'\x00') * height, 'little')
+    return not_first, not_last
+
+
+def _neighbor_sums(mask, width, height):
+    """(내부용) 0/1 마스크의 칸별 3x3 이웃 합(자기 자신 제외)을 칸당 1바이트인 큰 정수로 반환합니다."""
+    size = width * height
+    full = (1 << (size * 8)) - 1
+    not_first, not_last = _edge_masks(width, height)
+    m = int.from_bytes(mask, 'little')
+    # 가로 3칸 합 (행 경계를 넘는 값은 마스크로 제거)
+    row_sum = m + ((m << 8) & not_first) + ((m >> 8) & not_last)
+    # 세로 3줄 합
+    stride = width * 8
+    total = row_sum + ((row_sum << stride) & full) + (row_sum >> stride)
+    return total - m
+
+
+def count_adjacent_mines(mines, width, height):
+    """0/1 지뢰 마스크에 3x3 이웃 합을 한 번에 적용해 칸별 인접 지뢰 수를 계산합니다.
+
+    마스크를 칸당 1바이트인 큰 정수로 보고 시프트/덧셈으로 합을 구하므로 합(최대 9)이
+    바이트 밖으로 넘치지 않습니다. 지뢰 칸의 값은 0이며, 결과는 새 `bytearray`입니다.
+    """
+    size = width * height
+    full = (1 << (size * 8)) - 1
+    # 지뢰 칸은 0으로
+    total = _neighbor_sums(mines, width, height) & (full ^ (int.from_bytes(mines, 'little') * 0xFF))
+    return bytearray(total.to_bytes(size, 'little'))
+
+
+# 청크 주변 8방향 (변으로 닿는 청크 먼저)
+_CHUNK_NEIGHBORS = ((0, -1), (-1, 0), (1, 0), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1))
+
+
+@lru_cache(maxsize=4)
+def _chunk_window(size, margin):
+    """(내부용) 청크와 둘레 `margin`칸으로 이루어진 풀이 창의 인덱스 표.
+
+    (창 너비, 청크 칸별 창 인덱스, 가장 바깥 둘레의 창 인덱스, 방향별 이웃 청크 부분의 창 인덱스,
+    방향별로 그 이웃에서 `margin`칸 안에 있는 청크 칸)을 반환합니다.
+    """
+    width = size + 2 * margin
+    inner = [(y + margin) * width + x + margin for y in range(size) for x in range(size)]
+    outer = [y * width + x for y in range(width) for x in range(width)
+             if x in (0, width - 1) or y in (0, width - 1)]
+    spans = {-1: range(margin), 0: range(margin, margin + size), 1: range(margin + size, width)}
+    bands = {-1: range(margin), 0: range(size), 1: range(size - margin, size)}
+    regions, near = {}, {}
+    for dx, dy in _CHUNK_NEIGHBORS:
+        regions[dx, dy] = [y * width + x for y in spans[dy] for x in spans[dx]]
+        near[dx, dy] = [y * size + x for y in bands[dy] for x in bands[dx]]
+    return width, inner, outer, regions, near
+
+
+_generation_stop = None
+_generation_counter = None
+
+
+def _init_generation_worker(stop, counter):
+    """(내부용) 병렬 생성 워커 프로세스에 공유 중단 이벤트와 시도 횟수 카운터를 전달합니다."""
+    global _generation_stop, _generation_counter
+    _generation_stop = stop
+    _generation_counter = counter
+
+
+def _is_cancelled(cancel):
+    """(내부용) 생성 중단 요청이 있는지 확인합니다."""
+    return cancel is not None and cancel.is_set()
+
+
+def _search_solvable_layout(width, height, mine_count, first_click_x, first_click_y, seed, attempts, vectorized):
+    """(내부용) 워커 프로세스에서 '추측 없는' 보드를 찾습니다.
+
+    `(시도 횟수, 지뢰 마스크 또는 None, 규칙 단계)`를 반환하며, 다른 워커가 먼저 찾아
+    중단 이벤트가 설정되면 즉시 멈춥니다.
+    """
+    board = BoardFinite(width, height, mine_count, vectorized=vectorized, seed=seed)
+    for attempt in range(1, attempts + 1):
+        if _generation_stop is not None and _generation_stop.is_set():
+            return attempt - 1, None, None
+        board._generate_board(first_click_x, first_click_y)
+        if _generation_counter is not None:
+            with _generation_counter.get_lock():
+                _generation_counter.value += 1
+        if board._is_solvable(first_click_x, first_click_y):
+            return attempt, bytes(board.mines), board.solve_tier
+    return attempts, None, None
+
+class BoardDelta:
+    """보드 조작으로 바뀐 칸과 카운터 변화.
+
+    `cells`는 바뀐 칸의 (x, y) 목록이고 `states`는 같은 순서의 새 칸 상태 바이트
+    (`pack_cell_states`와 같은 비트 배치)입니다. `revealed`와 `flags`는 열린 칸 수와 깃발 수의
+    변화량이며, `game_over`와 `win`은 조작 후의 값입니다.
+    """
+    __slots__ = ('cells', 'states', 'revealed', 'flags', 'game_over', 'win')
+
+    def __init__(self, cells, states, revealed, flags, game_over, win):
+        self.cells = cells
+        self.states = states
+        self.revealed = revealed
+        self.flags = flags
+        self.game_over = game_over
+        self.win = win
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        """`((x, y), 상태 바이트)` 쌍을 차례로 내보냅니다."""
+        return zip(self.cells, self.states)
+
 
 class Board:
-    """지뢰찾기 보드의 기본 동작을 정의하는 추상 클래스."""
+    """지뢰찾기 보드의 기본 동작을 정의하는 추상 클래스.
+
+    칸을 바꾸는 동작(`reveal_cells`, `reveal_cell`, `chord`, `toggle_flag`)은 그 동작으로 바뀐 칸의
+    `BoardDelta`를 반환하고, 같은 변경을 내부 기록에도 쌓아 `pop_changes`/`pop_changed_cells`로
+    한꺼번에 꺼낼 수 있게 합니다. `add_observer`로 등록한 함수도 동작마다 같은 `BoardDelta`를 받습니다.
+    """
+    CHANGE_LOG_LIMIT = 1 << 16  # 이보다 많이 쌓이면 개별 칸 대신 전체가 바뀐 것으로 처리
+
     def __init__(self):
         self.game_over = False
         self.win = False
+        self.revealed_count = 0
+        self.flag_count = 0
+        self._changed = []  # 마지막으로 꺼내 간 뒤 모양이 바뀐 칸 (None이면 전체)
+        self._popped_counts = (0, 0)  # 마지막으로 꺼내 갈 때의 (열린 칸 수, 깃발 수)
+        self._observers = []
+
+    def add_observer(self, callback):
+        """칸을 바꾸는 동작마다 `callback(BoardDelta)`를 부르도록 등록합니다.
+
+        보드 전체가 바뀌었을 때(유한 보드 생성)는 `callback(None)`을 부르며, 이 호출은 보드를
+        생성하는 스레드에서 올 수 있습니다.
+        """
+        self._observers.append(callback)
+
+    def _notify(self, delta):
+        for callback in self._observers:
+            callback(delta)
+
+    def pop_changed_cells(self):
+        """마지막 호출 이후 모양이 바뀐 칸의 (x, y) 목록을 꺼냅니다.
+
+        변경이 너무 많이 쌓였으면 None을 반환하며, 이때는 보이는 칸 전체를 다시 그려야 합니다.
+        `pop_changes`와 같은 기록을 꺼내므로 둘 중 하나만 씁니다.
+        """
+        changed = self._changed
+        self._changed = []
+        self._popped_counts = (self.revealed_count, self.flag_count)
+        return changed
+
+    def pop_changes(self):
+        """마지막 호출 이후 쌓인 변경을 `BoardDelta` 하나로 꺼냅니다. 상태 바이트는 지금 값입니다.
+
+        변경이 너무 많이 쌓였으면 None을 반환하며, 이때는 보이는 칸 전체를 다시 그려야 합니다.
+        """
+        before = self._popped_counts
+        changed = Board.pop_changed_cells(self)
+        if changed is None:
+            return None
+        return self._delta(changed, before)
+
+    def _counts(self):
+        return self.revealed_count, self.flag_count
+
+    def _delta(self, changed, before):
+        """(내부용) 내부 기록 형식의 바뀐 칸 목록과 조작 전 카운터로 `BoardDelta`를 만듭니다."""
+        cells, states = self._changed_states(changed)
+        return BoardDelta(cells, states, self.revealed_count - before[0], self.flag_count - before[1],
+                          self.game_over, self.win)
+
+    def _changed_states(self, changed):
+        """(내부용) 내부 기록 형식의 바뀐 칸 목록을 `((x, y) 목록, 상태 바이트)`로 바꿉니다."""
+        raise NotImplementedError
+
+    def _commit(self, changed, before):
+        """(내부용) 한 동작으로 바뀐 칸을 내부 기록에 쌓고 그 동작의 `BoardDelta`를 반환합니다."""
+        if self._changed is not None:
+            self._changed.extend(changed)
+            self._limit_changes()
+        delta = self._delta(changed, before)
+        if changed:
+            self._notify(delta)
+        return delta
+
+    def _limit_changes(self):
+        """(내부용) 변경 기록이 한도를 넘으면 '전체 변경'으로 바꿉니다. 공개 동작 끝에서 호출합니다."""
+        if self._changed is not None and len(self._changed) > self.CHANGE_LOG_LIMIT:
+            self._changed = None
 
     def get_cell(self, x, y):
         raise NotImplementedError
@@ -14,9 +216,27 @@ class Board:
     def get_neighbors(self, x, y):
         raise NotImplementedError
 
-    def reveal_cell(self, x, y):
+    def cell_states(self, x, y, width, height):
+        """(x, y)에서 시작하는 사각형 영역의 칸 상태를 행 우선 바이트 배열로 한 번에 반환합니다.
+
+        칸 하나가 1바이트이며 비트 배치는 `pack_cell_states`와 같고, 칸이 없는 자리는 `NO_CELL`입니다.
+        """
         raise NotImplementedError
 
+    def known_cells(self):
+        """열렸거나 깃발이 꽂힌 칸의 (x, y) 목록을 반환합니다."""
+        raise NotImplementedError
+
+    def reveal_cells(self, cells):
+        """여러 칸을 한 번의 확장(BFS)으로 열고 `BoardDelta`를 반환합니다.
+
+        칸은 주어진 순서로 보며, 지뢰 칸을 만나면 그 앞의 칸까지만 열고 그 지뢰를 터뜨린 뒤 멈춥니다.
+        """
+        raise NotImplementedError
+
+    def reveal_cell(self, x, y):
+        return self.reveal_cells([(x, y)])
+
     def toggle_flag(self, x, y):
         raise NotImplementedError
 
@@ -24,23 +244,52 @@ class Board:
         raise NotImplementedError
 
 class BoardFinite(Board):
-    """유한 크기 보드 클래스."""
-    def __init__(self, width, height, mine_count, solvable=True):
+    """유한 크기 보드 클래스.
+
+    셀 상태는 `Cell` 객체 격자 대신 행 우선(row-major) 순서의 평면 바이트 배열
+    (`mines`, `revealed`, `flagged`, `adjacent`)에 저장되며, `get_cell`은 해당 위치를
+    가리키는 `CellView`를 반환합니다. 칸별 닫힌 이웃 수(`hidden_around`)와 깃발 이웃 수
+    (`flags_around`)는 칸을 열거나 깃발을 바꿀 때 함께 고쳐 둡니다.
+    """
+    MAX_ATTEMPTS = 100          # 워커 하나당 '추측 없는' 보드 생성 시도 횟수
+    PARALLEL_WARMUP_ATTEMPTS = 3  # 프로세스 풀을 띄우기 전에 직접 시도해 볼 횟수
+    COUNTER_BULK_CELLS = 1024   # 한 번에 이보다 많이 열리면 닫힌 이웃 수를 3x3 합으로 한꺼번에 고침
+
+    def __init__(self, width, height, mine_count, solvable=True, vectorized=True, seed=None, workers=1, pool=None):
         super().__init__()
         self.width = width
         self.height = height
         self.mine_count = mine_count
         self.solvable = solvable
-        self.cells = [[Cell(x, y) for x in range(width)] for y in range(height)]
+        self.vectorized = vectorized  # True면 배열 연산 기반 생성 경로 사용
+        self.seed = random.randrange(10 ** 9) if seed is None else seed  # 같은 시드면 같은 배치 (풀/병렬 생성 제외)
+        self.rng = random.Random(self.seed)
+        self.workers = workers  # 2 이상이면 여러 프로세스에서 병렬로 생성
+        self.pool = pool  # 미리 검증된 배치를 꺼내 올 BoardPool (없으면 None)
+        if width * height <= NEIGHBOR_TABLE_LIMIT:
+            self._neighbor_indices = neighbor_table(width, height).__getitem__
+        self._reset_storage()
         self.is_generated = False
+        self.total_safe_cells = width * height - mine_count
+        self.generation_attempts = 0
+        self.solve_tier = None
+
+    def _reset_storage(self):
+        """(내부용) 셀 상태 배열과 카운터를 초기화합니다."""
+        size = self.width * self.height
+        self.mines = bytearray(size)
+        self.revealed = bytearray(size)
+        self.flagged = bytearray(size)
+        self.adjacent = bytearray(size)
+        self.hidden_around = bytearray(neighbor_counts(self.width, self.height))  # 칸별로 닫혀 있고 깃발도 없는 이웃 수
+        self.flags_around = bytearray(size)  # 칸별로 깃발이 꽂힌 이웃 수
         self.revealed_count = 0
         self.flag_count = 0
-        self.total_safe_cells = width * height - mine_count
         self.exploded_mine_pos = None
 
     def get_cell(self, x, y):
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.cells[y][x]
+            return CellView(self, y * self.width + x, x, y)
         return None
 
     def get_neighbors(self, x, y):
@@ -51,36 +300,216 @@ class BoardFinite(Board):
                     continue
                 nx, ny = x + dx, y + dy
                 if 0 <= nx < self.width and 0 <= ny < self.height:
-                    neighbors.append(self.cells[ny][nx])
+                    neighbors.append(CellView(self, ny * self.width + nx, nx, ny))
         return neighbors
 
-    def generate(self, first_click_x, first_click_y):
-        """보드 생성 로직을 제어합니다. solvable 플래그에 따라 '추측 없는' 보드 생성을 시도합니다."""
+    def cell_states(self, x, y, width, height):
+        states = bytearray([NO_CELL]) * (width * height)
+        left, right = max(x, 0), min(x + width, self.width)
+        top, bottom = max(y, 0), min(y + height, self.height)
+        if left >= right or top >= bottom:
+            return states
+        span = right - left
+        starts = [row * self.width + left for row in range(top, bottom)]
+        packed = pack_cell_states(*(b''.join(array[start:start + span] for start in starts)
+                                    for array in (self.mines, self.revealed, self.flagged, self.adjacent)))
+        for i, row in enumerate(range(top, bottom)):
+            dst = (row - y) * width + (left - x)
+            states[dst:dst + span] = packed[i * span:(i + 1) * span]
+        return states
+
+    def known_cells(self):
+        width = self.width
+        known = bytes(map(operator.or_, self.revealed, self.flagged))
+        cells = []
+        index = known.find(1)
+        while index >= 0:
+            cells.append((index % width, index // width))
+            index = known.find(1, index + 1)
+        return cells
+
+    def _changed_states(self, changed):
+        # 유한 보드는 변경을 평면 인덱스로 기록
+        width = self.width
+        cells = [(index % width, index // width) for index in changed]
+        states = pack_cell_states(*(bytes(map(array.__getitem__, changed))
+                                    for array in (self.mines, self.revealed, self.flagged, self.adjacent)))
+        return cells, states
+
+    def _neighbor_indices(self, index):
+        """(내부용) 평면 인덱스 기준으로 주변 8칸의 인덱스 목록을 반환합니다. 작은 보드는 미리 만든 표를 씁니다."""
+        width = self.width
+        y, x = divmod(index, width)
+        if 0 < x < width - 1 and 0 < y < self.height - 1:
+            above, below = index - width, index + width
+            return (above - 1, above, above + 1, index - 1, index + 1, below - 1, below, below + 1)
+        indices = []
+        for ny in range(max(0, y - 1), min(self.height, y + 2)):
+            row = ny * width
+            for nx in range(max(0, x - 1), min(width, x + 2)):
+                if nx != x or ny != y:
+                    indices.append(row + nx)
+        return indices
+
+    def generate(self, first_click_x, first_click_y, cancel=None):
+        """보드 생성 로직을 제어합니다. solvable 플래그에 따라 '추측 없는' 보드 생성을 시도합니다.
+
+        다른 스레드에서 실행할 때는 `cancel`(threading.Event)로 중단할 수 있으며, 진행 상황은
+        `generation_attempts`로 확인할 수 있습니다. 중단되면 `is_generated`는 False로 남습니다.
+        """
+        self._generate(first_click_x, first_click_y, cancel)
+        # 생성 중 상태 배열을 초기화하므로(생성 전에 꽂은 깃발 포함) 보이는 칸 전체가 바뀐 것으로 처리
+        self._changed = None
+        self._notify(None)
+
+    def _generate(self, first_click_x, first_click_y, cancel):
         if not self.solvable:
-            self._generate_standard_board(first_click_x, first_click_y)
+            self._generate_board(first_click_x, first_click_y)
+            self.is_generated = True
+            return
+
+        # 풀에 클릭 위치와 맞는 검증된 배치가 있으면 바로 사용
+        if self._take_from_pool(first_click_x, first_click_y):
+            print("Solvable board taken from the board pool.")
             self.is_generated = True
             return
 
         # '추측 없는' 보드 생성 시도
-        max_attempts = 100  # 무한 루프 방지
         print("Generating a solvable board... this may take a moment.")
-        for i in range(max_attempts):
-            self._generate_standard_board(first_click_x, first_click_y)
+        if self.workers > 1:
+            # 쉬운 보드는 보통 처음 몇 번 안에 찾으므로 풀 기동 비용을 아끼기 위해 먼저 직접 시도
+            found = self._search_serial(first_click_x, first_click_y, self.PARALLEL_WARMUP_ATTEMPTS, cancel)
+            if not found and not _is_cancelled(cancel):
+                found = self._search_parallel(first_click_x, first_click_y, cancel)
+            max_attempts = self.MAX_ATTEMPTS * self.workers
+        else:
+            max_attempts = self.MAX_ATTEMPTS  # 무한 루프 방지
+            found = self._search_serial(first_click_x, first_click_y, max_attempts, cancel)
+
+        if _is_cancelled(cancel):
+            print("Board generation cancelled.")
+            return
+        if found:
+            print(f"Solvable board found after {self.generation_attempts} attempt(s) (deduction tier: {TIER_NAMES[self.solve_tier]}).")
+        else:
+            print(f"Warning: Failed to generate a solvable board after {max_attempts} attempts. The board may require guessing.")
+        self.is_generated = True
+
+    def _take_from_pool(self, first_click_x, first_click_y):
+        """(내부용) 보드 풀에서 첫 클릭 위치에 맞게 변환된 배치를 꺼내 적용합니다."""
+        if self.pool is None:
+            return False
+        found = self.pool.take(self.width, self.height, self.mine_count, first_click_x, first_click_y)
+        if found is None:
+            return False
+        mines, tier = found
+        self._apply_layout(mines)
+        self.solve_tier = tier
+        return True
+
+    def _search_serial(self, first_click_x, first_click_y, attempts, cancel=None):
+        """(내부용) 현재 프로세스에서 최대 `attempts`번 생성/검증을 반복합니다."""
+        for _ in range(attempts):
+            if _is_cancelled(cancel):
+                return False
+            self.generation_attempts += 1
+            self._generate_board(first_click_x, first_click_y)
             if self._is_solvable(first_click_x, first_click_y):
-                print(f"Solvable board found after {i + 1} attempt(s).")
-                self.is_generated = True
-                return
-        
-        print(f"Warning: Failed to generate a solvable board after {max_attempts} attempts. The board may require guessing.")
+                return True
+        return False
+
+    def _search_parallel(self, first_click_x, first_click_y, cancel=None):
+        """(내부용) 프로세스 풀의 워커마다 독립 시드로 후보를 만들고, 먼저 검증된 보드를 채택합니다.
+
+        검증에 성공한 배치가 오거나 `cancel`이 설정되면 공유 이벤트로 나머지 워커를 멈추고
+        대기 중인 작업은 취소합니다. 실패하면 마지막으로 시도한 (검증되지 않은) 보드가 그대로 남습니다.
+        """
+        # 프로세스 관련 모듈은 불러오는 데 시간이 걸리므로 병렬 생성을 실제로 할 때만 불러옴
+        import multiprocessing
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        stop = multiprocessing.Event()
+        counter = multiprocessing.Value('i', 0)
+        base_attempts = self.generation_attempts
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_generation_worker,
+                                       initargs=(stop, counter))
+        try:
+            pending = {
+                executor.submit(_search_solvable_layout, self.width, self.height, self.mine_count,
+                                first_click_x, first_click_y, self.rng.getrandbits(64),
+                                self.MAX_ATTEMPTS, self.vectorized)
+                for _ in range(self.workers)
+            }
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                self.generation_attempts = base_attempts + counter.value
+                if _is_cancelled(cancel):
+                    return False
+                for future in done:
+                    _, layout, tier = future.result()
+                    if layout is not None:
+                        stop.set()
+                        self._apply_layout(layout)
+                        self.solve_tier = tier
+                        return True
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+        return False
+
+    def load_layout(self, mines):
+        """주어진 지뢰 마스크(0/1 바이트 배열)로 보드를 생성된 상태로 만듭니다. 기록된 세션을 재생할 때 씁니다."""
+        self._apply_layout(mines)
         self.is_generated = True
+        self._changed = None
+        self._notify(None)
+
+    def _apply_layout(self, mines):
+        """(내부용) 지뢰 마스크로 보드를 다시 구성하고 인접 수를 계산합니다."""
+        self._reset_storage()
+        self.mines = bytearray(mines)
+        self.adjacent = count_adjacent_mines(self.mines, self.width, self.height)
+
+    def _generate_board(self, first_click_x, first_click_y):
+        """(내부용) `vectorized` 설정에 따라 보드 생성 경로를 선택합니다."""
+        if self.vectorized:
+            self._generate_vectorized_board(first_click_x, first_click_y)
+        else:
+            self._generate_standard_board(first_click_x, first_click_y)
+
+    def _generate_vectorized_board(self, first_click_x, first_click_y):
+        """(내부용) 배열 연산으로 지뢰를 배치하고 인접 수를 한 번의 3x3 합으로 계산합니다.
+
+        후보 칸(3x3 안전 구역 제외)을 행 우선 순서로 나열해 표본을 뽑으므로
+        `_generate_standard_board`와 같은 분포(같은 난수 상태에서는 같은 배치)를 만듭니다.
+        """
+        self._reset_storage()
+        width, height = self.width, self.height
+
+        # 보드 안에 걸친 안전 구역 사각형
+        x0, x1 = max(0, first_click_x - 1), min(width - 1, first_click_x + 1)
+        y0, y1 = max(0, first_click_y - 1), min(height - 1, first_click_y + 1)
+        safe_w = max(0, x1 - x0 + 1)
+        safe_rows = range(y0, y1 + 1) if safe_w else range(0)
+
+        candidates = width * height - safe_w * len(safe_rows)
+        mines = bytearray(candidates)
+        for i in self.rng.sample(range(candidates), self.mine_count):
+            mines[i] = 1
+
+        # 후보 마스크에 안전 구역(0)을 끼워 넣어 전체 마스크로 확장
+        safe_gap = bytes(safe_w)
+        for y in safe_rows:
+            pos = y * width + x0
+            mines[pos:pos] = safe_gap
+
+        self.mines = mines
+        self.adjacent = count_adjacent_mines(mines, width, height)
 
     def _generate_standard_board(self, first_click_x, first_click_y):
         """(내부용) 첫 클릭 후 지뢰를 무작위로 배치하고 인접 지뢰 수를 계산합니다."""
         # 보드 초기화
-        self.cells = [[Cell(x, y) for x in range(self.width)] for y in range(self.height)]
-        self.revealed_count = 0
-        self.flag_count = 0
-        self.exploded_mine_pos = None
+        self._reset_storage()
 
         safe_zone = set()
         for dy in range(-1, 2):
@@ -91,150 +520,152 @@ class BoardFinite(Board):
         for y in range(self.height):
             for x in range(self.width):
                 if (x, y) not in safe_zone:
-                    possible_mine_positions.append((x, y))
+                    possible_mine_positions.append(y * self.width + x)
 
-        mine_positions = random.sample(possible_mine_positions, self.mine_count)
+        mine_positions = self.rng.sample(possible_mine_positions, self.mine_count)
 
-        for x, y in mine_positions:
-            self.cells[y][x].is_mine = True
+        mines, adjacent = self.mines, self.adjacent
+        for i in mine_positions:
+            mines[i] = 1
+            for n in self._neighbor_indices(i):
+                adjacent[n] += 1
+
+        # 지뢰 칸 자체의 인접 수는 0으로 유지
+        for i in mine_positions:
+            adjacent[i] = 0
 
-        for y in range(self.height):
-            for x in range(self.width):
-                if not self.cells[y][x].is_mine:
-                    count = 0
-                    for neighbor in self.get_neighbors(x, y):
-                        if neighbor.is_mine:
-                            count += 1
-                    self.cells[y][x].adjacent_mines = count
-    
     def _is_solvable(self, start_x, start_y):
-        """(내부용) 현재 보드가 논리적으로만 풀 수 있는지 검증하는 솔버입니다."""
-        # 시뮬레이션을 위한 상태 복사
-        sim_revealed = [[False for _ in range(self.width)] for _ in range(self.height)]
-        sim_flagged = [[False for _ in range(self.width)] for _ in range(self.height)]
-        
-        # 첫 클릭 지점 열기
-        q = deque([(start_x, start_y)])
-        revealed_count = 0
-        
-        # Flood-fill for the first click
-        while q:
-            x, y = q.popleft()
-            if sim_revealed[y][x]: continue
-            sim_revealed[y][x] = True
-            revealed_count += 1
-            if self.cells[y][x].adjacent_mines == 0:
-                for n in self.get_neighbors(x, y):
-                    if not sim_revealed[n.y][n.x]:
-                        q.append((n.x, n.y))
-
-        # 논리적 솔버 루프
-        while True:
-            made_progress = False
-            
-            for y in range(self.height):
-                for x in range(self.width):
-                    if not sim_revealed[y][x] or self.cells[y][x].adjacent_mines == 0:
-                        continue
-
-                    cell = self.cells[y][x]
-                    neighbors = self.get_neighbors(x, y)
-                    
-                    hidden_neighbors = [n for n in neighbors if not sim_revealed[n.y][n.x]]
-                    flagged_count = sum(1 for n in hidden_neighbors if sim_flagged[n.y][n.x])
-                    unknown_count = len(hidden_neighbors) - flagged_count
-
-                    if unknown_count == 0:
-                        continue
-
-                    # 규칙 1: 주변 깃발 수 == 칸의 숫자 -> 나머지 칸은 안전
-                    if cell.adjacent_mines == flagged_count:
-                        for n in hidden_neighbors:
-                            if not sim_flagged[n.y][n.x]:
-                                if sim_revealed[n.y][n.x]: continue # 이미 열렸으면 무시
-                                sim_revealed[n.y][n.x] = True
-                                revealed_count += 1
-                                made_progress = True
-                                # 0이면 주변을 또 열어야 함 (Flood fill)
-                                if self.cells[n.y][n.x].adjacent_mines == 0:
-                                    q_ff = deque([(n.x, n.y)])
-                                    visited_ff = {(n.x, n.y)}
-                                    while q_ff:
-                                        cx, cy = q_ff.popleft()
-                                        for neighbor_ff in self.get_neighbors(cx,cy):
-                                            if not sim_revealed[neighbor_ff.y][neighbor_ff.x] and (neighbor_ff.x, neighbor_ff.y) not in visited_ff:
-                                                sim_revealed[neighbor_ff.y][neighbor_ff.x] = True
-                                                revealed_count += 1
-                                                visited_ff.add((neighbor_ff.x, neighbor_ff.y))
-                                                if self.cells[neighbor_ff.y][neighbor_ff.x].adjacent_mines == 0:
-                                                    q_ff.append((neighbor_ff.x, neighbor_ff.y))
-
-                    # 규칙 2: (주변의 닫힌 칸 수) == (칸의 숫자) -> 닫힌 칸은 모두 지뢰
-                    if cell.adjacent_mines == flagged_count + unknown_count:
-                        for n in hidden_neighbors:
-                            if not sim_flagged[n.y][n.x]:
-                                sim_flagged[n.y][n.x] = True
-                                made_progress = True
-
-            if not made_progress:
-                break # 더 이상 논리적으로 진행할 수 없음
-        
-        # 모든 안전한 칸이 열렸는지 확인
-        return revealed_count == self.total_safe_cells
+        """(내부용) 현재 보드가 논리적으로만 풀 수 있는지 검증하는 솔버입니다.
 
-    def reveal_cell(self, x, y):
-        if not self.is_generated:
-            self.generate(x, y)
+        첫 클릭 지점을 연 뒤 `Solver`로 단일 칸 규칙부터 부분집합/겹침, 남은 지뢰 수,
+        작은 성분 완전 열거 순으로 추론하며, 필요했던 최고 규칙 단계를 `solve_tier`에 기록합니다.
+        """
+        solver = Solver(self.width, self.height, self.adjacent, self.mine_count)
+        solver.open(start_y * self.width + start_x)
+        solved = solver.solve()
+        self.solve_tier = solver.tier
+        return solved
 
-        cell = self.get_cell(x, y)
-        if not cell or cell.is_revealed or cell.is_flagged:
-            return
+    def reveal_cells(self, cells):
+        """여러 칸을 한 번의 확장(BFS)으로 열고 `BoardDelta`를 반환합니다.
 
-        if cell.is_mine:
-            self.game_over = True
-            self.exploded_mine_pos = (x, y)
-            cell.is_revealed = True
-            return
+        칸은 주어진 순서로 보며, 지뢰 칸을 만나면 그 앞의 칸까지만 열고 그 지뢰를 터뜨린 뒤 멈춥니다
+        (그 앞의 칸으로 이미 이겼으면 터뜨리지 않음). 보드가 아직 생성되지 않았으면 첫 칸을 기준으로 생성합니다.
+        """
+        cells = list(cells)
+        before = self._counts()
+        if cells and not self.is_generated:
+            self.generate(*cells[0])
+        changed = []
+        width, height = self.width, self.height
+        mines, revealed, flagged = self.mines, self.revealed, self.flagged
+        starts = []
+        for x, y in cells:
+            if not (0 <= x < width and 0 <= y < height):
+                continue
+            index = y * width + x
+            if revealed[index] or flagged[index]:
+                continue
+            if mines[index]:
+                self._flood(starts, changed)
+                starts = []
+                if self.revealed_count < self.total_safe_cells:
+                    self.game_over = True
+                    self.exploded_mine_pos = (x, y)
+                    revealed[index] = 1
+                    changed.append(index)
+                    self._uncover([index])
+                break
+            starts.append(index)
+        self._flood(starts, changed)
+        if not self.game_over:
+            self.check_win_condition()
+        return self._commit(changed, before)
 
-        q = deque([cell])
-        visited = {cell}
+    def _flood(self, starts, changed):
+        """(내부용) 시작 칸들을 열고 인접 지뢰가 0인 칸에서 주변으로 넓힙니다. 연 칸은 `changed`에 더합니다.
 
+        열린 칸 배열 자체를 방문 표시로 사용하는 BFS이며, 시작 칸이 여러 개여도 한 번에 진행합니다.
+        """
+        revealed, flagged, adjacent = self.revealed, self.flagged, self.adjacent
+        neighbors = self._neighbor_indices
+        first = len(changed)
+        q = deque()
+        for index in starts:
+            if not revealed[index]:
+                revealed[index] = 1
+                changed.append(index)
+                q.append(index)
+        opened = len(q)
         while q:
-            current_cell = q.popleft()
-            if not current_cell.is_revealed and not current_cell.is_flagged:
-                current_cell.is_revealed = True
-                self.revealed_count += 1
-
-                if current_cell.adjacent_mines == 0:
-                    for neighbor in self.get_neighbors(current_cell.x, current_cell.y):
-                        if neighbor not in visited:
-                            q.append(neighbor)
-                            visited.add(neighbor)
-        
-        self.check_win_condition()
+            current = q.popleft()
+            if adjacent[current] == 0:
+                for n in neighbors(current):
+                    if not revealed[n] and not flagged[n]:
+                        revealed[n] = 1
+                        changed.append(n)
+                        opened += 1
+                        q.append(n)
+        self.revealed_count += opened
+        if opened:
+            self._uncover(changed[first:])
+
+    def _uncover(self, opened):
+        """(내부용) 새로 열린 칸들의 이웃에서 닫힌 이웃 수를 줄입니다."""
+        hidden = self.hidden_around
+        if len(opened) < self.COUNTER_BULK_CELLS:
+            neighbors = self._neighbor_indices
+            for index in opened:
+                for n in neighbors(index):
+                    hidden[n] -= 1
+            return
+        width, height = self.width, self.height
+        mask = bytearray(width * height)
+        for index in opened:
+            mask[index] = 1
+        # 열린 칸은 모두 닫힌 이웃으로 세어져 있었으므로 바이트마다 빌림(borrow) 없이 뺄 수 있음
+        total = int.from_bytes(hidden, 'little') - _neighbor_sums(mask, width, height)
+        hidden[:] = total.to_bytes(len(hidden), 'little')
+
+    def pop_changed_cells(self):
+        # 유한 보드는 변경을 인덱스로 기록하므로 좌표로 바꿔서 반환
+        changed = super().pop_changed_cells()
+        if changed is None:
+            return None
+        width = self.width
+        return [(index % width, index // width) for index in changed]
 
     def toggle_flag(self, x, y):
+        before = self._counts()
+        changed = []
         cell = self.get_cell(x, y)
         if cell and cell.toggle_flag():
-            if cell.is_flagged:
-                self.flag_count += 1
-            else:
-                self.flag_count -= 1
+            index = y * self.width + x
+            step = 1 if cell.is_flagged else -1
+            self.flag_count += step
+            hidden, flags = self.hidden_around, self.flags_around
+            for n in self._neighbor_indices(index):
+                hidden[n] -= step
+                flags[n] += step
+            changed.append(index)
+        return self._commit(changed, before)
 
     def chord(self, x, y):
-        cell = self.get_cell(x, y)
-        if not cell or not cell.is_revealed or cell.adjacent_mines == 0:
-            return
-
-        neighbors = self.get_neighbors(x, y)
-        flagged_neighbors = sum(1 for n in neighbors if n.is_flagged)
+        """열린 숫자 칸 주변의 깃발 수가 숫자와 같으면 나머지 닫힌 이웃을 한 번에 엽니다.
 
-        if flagged_neighbors == cell.adjacent_mines:
-            for neighbor in neighbors:
-                if not neighbor.is_flagged and not neighbor.is_revealed:
-                    self.reveal_cell(neighbor.x, neighbor.y)
-                    if self.game_over:
-                        break
+        조건은 유지되는 이웃 카운터로 바로 판단하므로, 이웃을 훑는 것은 실제로 열 칸이 있을 때뿐입니다.
+        """
+        width = self.width
+        if not (0 <= x < width and 0 <= y < self.height):
+            return self._commit([], self._counts())
+        index = y * width + x
+        number = self.adjacent[index]
+        if (not self.revealed[index] or number == 0 or self.flags_around[index] != number
+                or not self.hidden_around[index]):
+            return self._commit([], self._counts())
+        revealed, flagged = self.revealed, self.flagged
+        return self.reveal_cells([(n % width, n // width) for n in self._neighbor_indices(index)
+                                  if not revealed[n] and not flagged[n]])
 
     def check_win_condition(self):
         if self.revealed_count == self.total_safe_cells:
@@ -242,151 +673,516 @@ class BoardFinite(Board):
             self.game_over = True
 
 class BoardInfinite(Board):
-    """무한맵 보드 클래스."""
+    """무한맵 보드 클래스.
+
+    셀 상태는 청크 좌표를 키로 하는 `Chunk` 객체에 칸당 1바이트 배열로 저장하며,
+    셀 접근은 청크 조회 후 배열 인덱싱으로 이루어집니다. 지뢰 배치는 월드 시드와 좌표만으로
+    정해지므로(아직 생성되지 않은 곳을 클릭했을 때 비우는 안전 구역 제외) 청크 경계의 인접 수도
+    이웃 청크를 기다리지 않고 바로 정확하게 계산됩니다. 메모리에 올라와 있는 청크 수는
+    `memory_budget`에 맞춰 제한합니다. 한도를 넘으면 화면 영역에서 떨어진 청크부터
+    가장 오래 쓰이지 않은 순서로 임시 파일에 내보내고, 다시 접근할 때 읽어 들입니다.
+    `solvable`이면 새 청크마다 이웃 청크에서 논리만으로 풀리는지 검사해 지뢰를 고칩니다('추측 없는' 무한맵).
+    """
     CHUNK_SIZE = 16
     SAFE_RADIUS = 1
+    MEMORY_BUDGET = 64 * 1024 * 1024  # 상주 청크에 쓸 메모리 예산 (바이트)
+    CHUNK_MEMORY_ESTIMATE = 1664  # 상주 청크 하나의 대략적인 메모리 사용량 (바이트, 측정값)
+    ACTIVE_MARGIN = 1  # 화면 영역 밖으로 내보내지 않고 유지할 청크 여유분
+    SOLVABLE_MARGIN = 2  # '추측 없는' 검사에서 청크 둘레로 함께 푸는 칸 수
+    SOLVABLE_RUNS = 12  # 청크 하나에 돌리는 솔버의 최대 횟수 (넘으면 가장 많이 풀린 배치를 쓰고 남은 칸을 기록)
 
-    def __init__(self, mine_density=0.15):
+    def __init__(self, mine_density=0.15, memory_budget=None, spill_path=None, seed=None, solvable=False):
         super().__init__()
         self.mine_density = mine_density
-        self.cells = {}
+        self.seed = random.randrange(10 ** 9) if seed is None else seed  # 같은 시드면 같은 월드
+        self.chunks = OrderedDict()  # 메모리에 있는 청크 (오래 쓰이지 않은 순서)
         self.generated_chunks = set()
         self.revealed_count = 0
         self.flag_count = 0
         self.exploded_mine_pos = None
+        budget = self.MEMORY_BUDGET if memory_budget is None else memory_budget
+        self.max_resident_chunks = max(9, budget // self.CHUNK_MEMORY_ESTIMATE)
+        self.spill = ChunkSpill(self.CHUNK_SIZE * self.CHUNK_SIZE, spill_path)
+        self.active_region = None  # 내보내지 않을 청크 범위 (min_cx, min_cy, max_cx, max_cy)
+        self.solvable = solvable
+        self.unresolved = {}  # '추측 없는' 검사에서 정해지지 않은 칸 (청크 좌표 -> 칸 좌표 집합)
         # Start with an initial safe area
-        self._ensure_chunk_generated(0, 0, is_initial=True)
+        self._ensure_chunk_generated(0, 0, safe_center=(0, 0))
         self.reveal_cell(0, 0)
 
     def _get_chunk_coord(self, x, y):
         return x // self.CHUNK_SIZE, y // self.CHUNK_SIZE
 
+    def _chunk_at(self, coord):
+        """(내부용) 청크 좌표의 청크를 반환합니다. 내보낸 청크는 다시 읽어 들이고, 없으면 None."""
+        chunk = self.chunks.get(coord)
+        if chunk is None and coord in self.spill:
+            chunk = self._load_chunk(coord)
+        return chunk
+
+    def _locate(self, x, y):
+        """(내부용) (x, y)가 속한 청크와 청크 안의 인덱스를 반환합니다. 청크가 없으면 (None, 인덱스)."""
+        size = self.CHUNK_SIZE
+        return self._chunk_at((x // size, y // size)), (y % size) * size + x % size
+
     def get_cell(self, x, y):
-        return self.cells.get((x, y))
+        size = self.CHUNK_SIZE
+        chunk = self._chunk_at((x // size, y // size))
+        if chunk is None:
+            return None
+        return CellView(chunk, (y % size) * size + x % size, x, y)
+
+    def set_active_region(self, min_x, min_y, max_x, max_y):
+        """화면에 보이는 셀 범위를 알려 줍니다. 이 범위의 청크는 내보내지 않습니다."""
+        min_cx, min_cy = self._get_chunk_coord(min_x, min_y)
+        max_cx, max_cy = self._get_chunk_coord(max_x, max_y)
+        margin = self.ACTIVE_MARGIN
+        self.active_region = (min_cx - margin, min_cy - margin, max_cx + margin, max_cy + margin)
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                if (cx, cy) in self.chunks:
+                    self.chunks.move_to_end((cx, cy))
+        self._enforce_memory_budget()
+
+    def _is_active(self, coord):
+        if self.active_region is None:
+            return False
+        min_cx, min_cy, max_cx, max_cy = self.active_region
+        return min_cx <= coord[0] <= max_cx and min_cy <= coord[1] <= max_cy
+
+    def _touch_chunk(self, coord):
+        """(내부용) 청크가 메모리에 있도록 보장하고 최근 사용으로 표시합니다."""
+        if coord in self.chunks:
+            self.chunks.move_to_end(coord)
+        elif coord in self.spill:
+            self._load_chunk(coord)
+
+    def _enforce_memory_budget(self):
+        """(내부용) 상주 청크가 한도를 넘으면 화면 밖의 오래된 청크부터 내보냅니다.
+
+        진행 중인 동작이 잡고 있는 청크가 사라지지 않도록 공개 동작이 끝난 뒤에만 호출합니다.
+        """
+        excess = len(self.chunks) - self.max_resident_chunks
+        if excess <= 0:
+            return
+        victims = []
+        for coord in self.chunks:
+            if not self._is_active(coord):
+                victims.append(coord)
+                if len(victims) == excess:
+                    break
+        for coord in victims:
+            self.spill.write(coord, self.chunks.pop(coord).to_record())
+
+    def _load_chunk(self, coord):
+        """(내부용) 내보낸 청크를 파일에서 읽어 메모리로 복원합니다."""
+        chunk = Chunk.from_record(coord[0], coord[1], self.spill.read(coord))
+        self.chunks[coord] = chunk
+        return chunk
 
     def get_neighbors(self, x, y):
+        size = self.CHUNK_SIZE
+        local_x, local_y = x % size, y % size
+        if 0 < local_x < size - 1 and 0 < local_y < size - 1:
+            # 이웃이 모두 같은 청크 안에 있으면 청크를 한 번만 찾음
+            chunk = self._chunk_at((x // size, y // size))
+            if chunk is None:
+                return []
+            index = local_y * size + local_x
+            return [CellView(chunk, index + dy * size + dx, x + dx, y + dy)
+                    for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+        get_cell = self.get_cell
         neighbors = []
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                if dx == 0 and dy == 0:
+        for ny in range(y - 1, y + 2):
+            for nx in range(x - 1, x + 2):
+                if nx == x and ny == y:
                     continue
-                nx, ny = x + dx, y + dy
-                cell = self.get_cell(nx, ny)
+                cell = get_cell(nx, ny)
                 if cell:
                     neighbors.append(cell)
         return neighbors
 
-    def _ensure_surrounding_chunks(self, x, y):
-        """(x, y)를 중심으로 3x3 청크 그리드의 생성을 보장합니다."""
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                self._ensure_chunk_generated(x + dx * self.CHUNK_SIZE, y + dy * self.CHUNK_SIZE)
+    def cell_states(self, x, y, width, height):
+        size = self.CHUNK_SIZE
+        states = bytearray([NO_CELL]) * (width * height)
+        records = {}
+        for row in range(height):
+            chunk_y, local_y = divmod(y + row, size)
+            col = 0
+            while col < width:
+                chunk_x, local_x = divmod(x + col, size)
+                span = min(size - local_x, width - col)
+                coord = (chunk_x, chunk_y)
+                if coord not in records:
+                    chunk = self._chunk_at(coord)
+                    records[coord] = chunk.to_record() if chunk is not None else None
+                record = records[coord]
+                if record is not None:
+                    src = local_y * size + local_x
+                    dst = row * width + col
+                    states[dst:dst + span] = record[src:src + span]
+                col += span
+        return states
+
+    def _ensure_surrounding_chunks(self, x, y, safe_center=None):
+        """(x, y)를 중심으로 3x3 청크 그리드의 생성을 보장합니다. 가운데, 변, 모서리 순으로 만듭니다.
+
+        `solvable`이면 이미 생성된 청크와 변으로 맞닿은 청크부터 만들고, 끝내 이어지지 않는 청크는
+        검사할 수 없으므로 만들지 않습니다(탐험하지 않은 먼 곳에 깃발을 꽂은 경우).
+        """
+        size = self.CHUNK_SIZE
+        if not self.solvable:
+            self._ensure_chunk_generated(x, y, safe_center)
+            for dx, dy in _CHUNK_NEIGHBORS:
+                self._ensure_chunk_generated(x + dx * size, y + dy * size, safe_center)
+            return
 
-    def _ensure_chunk_generated(self, x, y, safe_center=None, is_initial=False):
+        chunk_x, chunk_y = self._get_chunk_coord(x, y)
+        remaining = [(chunk_x + dx, chunk_y + dy) for dx, dy in ((0, 0),) + _CHUNK_NEIGHBORS]
+        while remaining:
+            for coord in remaining:
+                if coord in self.generated_chunks or any(
+                        (coord[0] + dx, coord[1] + dy) in self.generated_chunks for dx, dy in _CHUNK_NEIGHBORS[:4]):
+                    break
+            else:
+                return
+            remaining.remove(coord)
+            self._ensure_chunk_generated(coord[0] * size, coord[1] * size, safe_center)
+
+    def _pristine_mines(self, chunk_x, chunk_y, salt=0):
+        """(내부용) 월드 시드로 정해지는 청크의 지뢰 마스크. 시작 지점 주변 5x5는 항상 비어 있습니다.
+
+        `salt`를 주면 같은 청크의 다른 배치를 만듭니다('추측 없는' 검사의 다시 뽑기).
+        """
+        size = self.CHUNK_SIZE
+        seed = f"{self.seed}/{salt}" if salt else self.seed
+        mines = hashed_mine_mask(seed, chunk_x, chunk_y, size, self.mine_density)
+        start_x = chunk_x * size
+        start_y = chunk_y * size
+        for y in range(max(start_y, -2), min(start_y + size, 3)):
+            for x in range(max(start_x, -2), min(start_x + size, 3)):
+                mines[(y - start_y) * size + (x - start_x)] = 0
+        return mines
+
+    def _mine_window(self, start_x, start_y, width, height):
+        """(내부용) 주어진 사각형 영역의 지뢰 마스크를 행 우선 바이트 배열로 모읍니다.
+
+        생성된 청크는 저장된 지뢰를, 아직 생성되지 않은 청크는 월드 시드로 정해지는 지뢰를 사용합니다.
+        """
+        size = self.CHUNK_SIZE
+        # 열 방향으로 청크 경계에서 나뉘는 구간은 모든 행에서 같음
+        segments = []
+        x = start_x
+        while x < start_x + width:
+            chunk_x, local_x = divmod(x, size)
+            span = min(size - local_x, start_x + width - x)
+            segments.append((chunk_x, local_x, span, x - start_x))
+            x += span
+
+        masks = {}
+        window = bytearray(width * height)
+        for row in range(height):
+            chunk_y, local_y = divmod(start_y + row, size)
+            for chunk_x, local_x, span, offset in segments:
+                coord = (chunk_x, chunk_y)
+                mines = masks.get(coord)
+                if mines is None:
+                    if coord in self.generated_chunks:
+                        mines = self._chunk_at(coord).mines
+                    else:
+                        mines = self._pristine_mines(chunk_x, chunk_y)
+                    masks[coord] = mines
+                src = local_y * size + local_x
+                dst = row * width + offset
+                window[dst:dst + span] = mines[src:src + span]
+        return window
+
+    def _ensure_chunk_generated(self, x, y, safe_center=None):
         chunk_x, chunk_y = self._get_chunk_coord(x, y)
         if (chunk_x, chunk_y) in self.generated_chunks:
+            self._touch_chunk((chunk_x, chunk_y))
             return
 
+        # 경계 인접 수를 갱신할 수 있도록 주변 청크를 먼저 메모리로 불러옴
+        for dy in range(-1, 2):
+            for dx in range(-1, 2):
+                self._touch_chunk((chunk_x + dx, chunk_y + dy))
+
         # Generate this chunk
+        size = self.CHUNK_SIZE
+        chunk = Chunk(chunk_x, chunk_y, size)
+        chunk.mines = self._pristine_mines(chunk_x, chunk_y)
         self.generated_chunks.add((chunk_x, chunk_y))
-        
-        # Use chunk coordinates for a consistent seed
-        seed = f"{chunk_x},{chunk_y}"
-        rng = random.Random(seed)
-
-        start_x = chunk_x * self.CHUNK_SIZE
-        start_y = chunk_y * self.CHUNK_SIZE
-
-        # Create cells and place mines
-        for cy in range(start_y, start_y + self.CHUNK_SIZE):
-            for cx in range(start_x, start_x + self.CHUNK_SIZE):
-                if (cx, cy) not in self.cells:
-                    self.cells[(cx, cy)] = Cell(cx, cy)
-                
-                # Check safe zone around the first click in this generation
-                is_safe = False
-                if safe_center:
-                    if abs(cx - safe_center[0]) <= self.SAFE_RADIUS and abs(cy - safe_center[1]) <= self.SAFE_RADIUS:
-                        is_safe = True
-                if is_initial and abs(cx) <= 2 and abs(cy) <= 2: # Initial safe area
-                     is_safe = True
-
-                if not is_safe and rng.random() < self.mine_density:
-                    self.cells[(cx, cy)].is_mine = True
-
-        # Calculate adjacent mines for the new chunk and its borders
-        for cy in range(start_y - 1, start_y + self.CHUNK_SIZE + 1):
-            for cx in range(start_x - 1, start_x + self.CHUNK_SIZE + 1):
-                if (cx, cy) in self.cells and not self.cells[(cx, cy)].is_mine:
-                    count = 0
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            if dx == 0 and dy == 0: continue
-                            neighbor_pos = (cx + dx, cy + dy)
-                            if self.cells.get(neighbor_pos, Cell(0,0)).is_mine:
-                                count += 1
-                    self.cells[(cx, cy)].adjacent_mines = count
+        self.chunks[(chunk_x, chunk_y)] = chunk
 
+        start_x = chunk_x * size
+        start_y = chunk_y * size
+        if self._changed is not None:
+            self._changed.extend((cx, cy) for cy in range(start_y, start_y + size)
+                                 for cx in range(start_x, start_x + size))
 
-    def reveal_cell(self, x, y):
+        # 아직 생성되지 않은 곳을 클릭했다면 이 청크 안의 클릭 주변을 비움
+        cleared = False
+        if safe_center:
+            center_x, center_y = safe_center
+            radius = self.SAFE_RADIUS
+            for cy in range(max(start_y, center_y - radius), min(start_y + size, center_y + radius + 1)):
+                for cx in range(max(start_x, center_x - radius), min(start_x + size, center_x + radius + 1)):
+                    index = (cy - start_y) * size + (cx - start_x)
+                    cleared = cleared or chunk.mines[index] == 1
+                    chunk.mines[index] = 0
+        if self.solvable and self._make_solvable(chunk, safe_center):
+            cleared = True
+
+        # 이 청크의 인접 수는 주변 청크의 생성 여부와 관계없이 바로 정확함
+        if not cleared:
+            window_size = size + 2
+            counts = count_adjacent_mines(self._mine_window(start_x - 1, start_y - 1, window_size, window_size),
+                                          window_size, window_size)
+            inner = b''.join(counts[row * window_size + 1:row * window_size + 1 + size] for row in range(1, size + 1))
+            value = int.from_bytes(inner, 'little') & int.from_bytes(chunk.mines.translate(_NOT_MINE), 'little')
+            chunk.adjacent = bytearray(value.to_bytes(size * size, 'little'))
+            return
+
+        # 비우거나 고친 칸이 있으면 이미 생성된 이웃 청크의 테두리 한 줄도 다시 계산
+        window_size = size + 4
+        window_x = start_x - 2
+        window_y = start_y - 2
+        counts = count_adjacent_mines(self._mine_window(window_x, window_y, window_size, window_size),
+                                      window_size, window_size)
+        for row in range(1, window_size - 1):
+            chunk_y, local_y = divmod(window_y + row, size)
+            for col in range(1, window_size - 1):
+                chunk_x, local_x = divmod(window_x + col, size)
+                target = self.chunks.get((chunk_x, chunk_y))
+                index = local_y * size + local_x
+                if target is not None and not target.mines[index]:
+                    target.adjacent[index] = counts[row * window_size + col]
+
+    def _make_solvable(self, chunk, safe_center):
+        """(내부용) 새 청크를 이미 생성된 이웃에서 논리만으로 풀 수 있게 고칩니다. 배치를 바꿨으면 True.
+
+        청크와 둘레 `SOLVABLE_MARGIN`칸의 창에서 생성된 이웃 청크의 칸은 (같은 검사를 거쳤으므로)
+        아는 칸으로, 그중 미뤄 둔 칸(`unresolved`)과 생성되지 않은 쪽은 모르는 칸으로 두고 클릭한 칸을
+        더해 솔버를 돌립니다. 고칠 수 없는 테두리 칸 중 생성되지 않은 청크 가까이의 칸은 그 청크가 생길 때 마저 풉니다.
+        나머지 칸이 다 정해지지 않으면 이웃의 검사가 본 테두리와 클릭 주변은 두고 그 밖의 칸만
+        새로 뽑아 다시 풀며, `SOLVABLE_RUNS`번 안에 통과하지 못하면 가장 많이 풀린 배치를 씁니다.
+        정해지지 않은 칸은 모두 `unresolved`에 남겨, 이후 이웃 청크가 아는 칸으로 쓰지 않고 풀어야 할 칸으로 다룹니다.
+        """
+        size = self.CHUNK_SIZE
+        margin = self.SOLVABLE_MARGIN
+        width, inner, outer, regions, near = _chunk_window(size, margin)
+        chunk_x, chunk_y = chunk.cx, chunk.cy
+        start_x = chunk_x * size - margin
+        start_y = chunk_y * size - margin
+
+        free = bytearray(b'\x01') * (size * size)  # 고칠 수 있는 칸
+        known = set()
+        neighbors = []
+        missing = []
+        for dx, dy in _CHUNK_NEIGHBORS:
+            if (chunk_x + dx, chunk_y + dy) in self.generated_chunks:
+                neighbors.append((chunk_x + dx, chunk_y + dy))
+                known.update(regions[dx, dy])
+                for local in near[dx, dy]:
+                    free[local] = 0
+            else:
+                missing.append((dx, dy))
+        # 이웃이 미뤄 둔 칸은 모르는 칸이며, 이제 미룰 수 없으면 이번에 풀어야 함
+        pending = {}
+        for coord in neighbors:
+            for x, y in self.unresolved.get(coord, ()):
+                if start_x <= x < start_x + width and start_y <= y < start_y + width:
+                    index = (y - start_y) * width + x - start_x
+                    known.discard(index)
+                    pending[index] = (x, y)
+        seeds = []
+        if safe_center:
+            center_x, center_y = safe_center
+            radius = self.SAFE_RADIUS
+            for y in range(max(start_y + margin, center_y - radius), min(start_y + margin + size, center_y + radius + 1)):
+                for x in range(max(start_x + margin, center_x - radius), min(start_x + margin + size, center_x + radius + 1)):
+                    free[(y - start_y - margin) * size + x - start_x - margin] = 0
+            if start_x <= center_x < start_x + width and start_y <= center_y < start_y + width:
+                seeds.append((center_y - start_y) * width + center_x - start_x)
+        if not known and not seeds:
+            return False  # 아는 칸이 없으면 검사할 것이 없음
+        # 고칠 수 없는 칸 중 생성되지 않은 청크 가까이의 칸은 그 청크가 생길 때 마저 풂
+        deferred = bytearray(size * size)
+        for direction in missing:
+            for local in near[direction]:
+                if not free[local]:
+                    deferred[local] = 1
+        required = [index for local, index in enumerate(inner) if not deferred[local]]
+        required += [index for index, cell in pending.items() if not self._near_ungenerated(*cell)]
+
+        window = self._mine_window(start_x, start_y, width, width)
+        if safe_center:
+            # 안전 구역 중 아직 생성되지 않은 청크의 칸은 그 청크가 생길 때 비워짐
+            for y in range(max(start_y, center_y - radius), min(start_y + width, center_y + radius + 1)):
+                for x in range(max(start_x, center_x - radius), min(start_x + width, center_x + radius + 1)):
+                    if (x // size, y // size) not in self.generated_chunks:
+                        window[(y - start_y) * width + x - start_x] = 0
+        known_mines = [index for index in known if window[index]]
+        known_safe = [index for index in known if not window[index]]
+        mines = chunk.mines
+        original = bytes(mines)
+        best = None
+        for run in range(self.SOLVABLE_RUNS):
+            for row in range(size):
+                offset = (row + margin) * width + margin
+                window[offset:offset + size] = mines[row * size:(row + 1) * size]
+            numbers = count_adjacent_mines(window, width, width)
+            for index in outer:
+                numbers[index] = UNKNOWN_NUMBER  # 창 밖에 이웃이 있는 칸
+            solver = Solver(width, width, numbers)
+            for index in known_mines:
+                solver.flag(index)
+            for index in known_safe:
+                solver.open(index)
+            for index in seeds:
+                solver.open(index)
+            solver.solve()
+            revealed, flagged = solver.revealed, solver.flagged
+            stuck = sum(1 for index in required if not revealed[index] and not flagged[index])
+            if best is None or stuck < best[0]:
+                best = (stuck, bytes(mines), solver)
+            if not stuck:
+                break
+
+            fresh = self._pristine_mines(chunk_x, chunk_y, salt=run + 1)
+            for local in range(size * size):
+                if free[local]:
+                    mines[local] = fresh[local]
+
+        _, layout, solver = best
+        mines[:] = layout
+        resolved = bytes(map(operator.or_, solver.revealed, solver.flagged))
+        for index, cell in pending.items():
+            if resolved[index]:
+                owner = (cell[0] // size, cell[1] // size)
+                cells = self.unresolved[owner]
+                cells.discard(cell)
+                if not cells:
+                    del self.unresolved[owner]
+        # 미룬 칸뿐 아니라 끝내 정해지지 않은 칸도 모두 기록해 다음 청크가 아는 칸으로 쓰지 않게 함
+        cells = {(start_x + index % width, start_y + index // width)
+                 for index in inner if not resolved[index]}
+        if cells:
+            self.unresolved[(chunk_x, chunk_y)] = cells
+        return mines != original
+
+    def _near_ungenerated(self, x, y):
+        """(내부용) (x, y)에서 `SOLVABLE_MARGIN`칸 안에 아직 생성되지 않은 청크가 있는지 반환합니다."""
+        size = self.CHUNK_SIZE
+        margin = self.SOLVABLE_MARGIN
+        return any((cx, cy) not in self.generated_chunks
+                   for cx in {(x - margin) // size, (x + margin) // size}
+                   for cy in {(y - margin) // size, (y + margin) // size})
+
+    def reveal_cells(self, cells):
+        before = self._counts()
+        changed = []
+        for x, y in cells:
+            self._reveal_cell(x, y, changed)
+            if self.game_over:
+                break
+        delta = self._commit(changed, before)
+        self._enforce_memory_budget()
+        return delta
+
+    def known_cells(self):
+        size = self.CHUNK_SIZE
+        cells = []
+        for coord in list(self.generated_chunks):
+            chunk = self._chunk_at(coord)
+            known = bytes(map(operator.or_, chunk.revealed, chunk.flagged))
+            start_x, start_y = coord[0] * size, coord[1] * size
+            index = known.find(1)
+            while index >= 0:
+                cells.append((start_x + index % size, start_y + index // size))
+                index = known.find(1, index + 1)
+        self._enforce_memory_budget()
+        return cells
+
+    def _changed_states(self, changed):
+        # 바뀐 칸은 모두 생성된 청크 안에 있음 (내보낸 청크는 다시 읽어 들임). 청크마다 한 번 묶어서 읽음
+        size = self.CHUNK_SIZE
+        records = {}
+        states = bytearray(len(changed))
+        for i, (x, y) in enumerate(changed):
+            coord = (x // size, y // size)
+            record = records.get(coord)
+            if record is None:
+                record = records[coord] = self._chunk_at(coord).to_record()
+            states[i] = record[(y % size) * size + x % size]
+        return changed, bytes(states)
+
+    def _reveal_cell(self, x, y, changed):
+        """(내부용) 메모리 예산 정리 없이 칸을 열고 연 칸을 `changed`에 더합니다. 다른 동작 중간에 사용합니다."""
         # 클릭된 셀이 포함된 청크는 안전 클릭을 보장하며 먼저 생성
+        safe_center = None
         if not self.get_cell(x, y):
-            self._ensure_chunk_generated(x, y, safe_center=(x, y))
-        # 그 후 주변 청크들을 일관되게 생성
-        self._ensure_surrounding_chunks(x, y)
-        
-        cell = self.get_cell(x, y)
-        if not cell or cell.is_revealed or cell.is_flagged:
+            safe_center = (x, y)
+            self._ensure_chunk_generated(x, y, safe_center=safe_center)
+        # 그 후 주변 청크들을 일관되게 생성 ('추측 없는' 무한맵은 청크 경계에 걸친 안전 구역도 비움)
+        self._ensure_surrounding_chunks(x, y, safe_center if self.solvable else None)
+
+        chunk, index = self._locate(x, y)
+        if chunk is None or chunk.revealed[index] or chunk.flagged[index]:
             return
 
-        if cell.is_mine:
+        if chunk.mines[index]:
             self.game_over = True
             self.exploded_mine_pos = (x, y)
-            cell.is_revealed = True
+            chunk.revealed[index] = 1
+            changed.append((x, y))
             return
 
-        q = deque([cell])
-        visited = {cell}
-        
+        # 열린 칸 배열 자체를 방문 표시로 사용하는 BFS
+        locate = self._locate
+        chunk.revealed[index] = 1
+        changed.append((x, y))
+        opened = 1
+        q = deque([(x, y)])
         while q:
-            current_cell = q.popleft()
-            if not current_cell.is_revealed and not current_cell.is_flagged:
-                current_cell.is_revealed = True
-                self.revealed_count += 1
-
-                if current_cell.adjacent_mines == 0:
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            if dx == 0 and dy == 0: continue
-                            nx, ny = current_cell.x + dx, current_cell.y + dy
-                            neighbor = self.get_cell(nx, ny)
-                            if neighbor and neighbor not in visited:
-                                q.append(neighbor)
-                                visited.add(neighbor)
+            cx, cy = q.popleft()
+            chunk, index = locate(cx, cy)
+            if chunk.adjacent[index]:
+                continue
+            for ny in range(cy - 1, cy + 2):
+                for nx in range(cx - 1, cx + 2):
+                    neighbor, n_index = locate(nx, ny)
+                    if neighbor is not None and not neighbor.revealed[n_index] and not neighbor.flagged[n_index]:
+                        neighbor.revealed[n_index] = 1
+                        changed.append((nx, ny))
+                        opened += 1
+                        q.append((nx, ny))
+        self.revealed_count += opened
 
     def toggle_flag(self, x, y):
         self._ensure_surrounding_chunks(x, y)
-        
+
+        before = self._counts()
+        changed = []
         cell = self.get_cell(x, y)
         if cell and cell.toggle_flag():
             if cell.is_flagged:
                 self.flag_count += 1
             else:
                 self.flag_count -= 1
+            changed.append((x, y))
+        delta = self._commit(changed, before)
+        self._enforce_memory_budget()
+        return delta
 
     def chord(self, x, y):
         self._ensure_surrounding_chunks(x, y)
-        
-        cell = self.get_cell(x, y)
-        if not cell or not cell.is_revealed or cell.adjacent_mines == 0:
-            return
 
-        neighbors = self.get_neighbors(x, y)
-        flagged_neighbors = sum(1 for n in neighbors if n.is_flagged)
-
-        if flagged_neighbors == cell.adjacent_mines:
-            for neighbor in neighbors:
-                if not neighbor.is_flagged and not neighbor.is_revealed:
-                    self.reveal_cell(neighbor.x, neighbor.y)
-                    if self.game_over:
-                        break
+        cell = self.get_cell(x, y)
+        targets = []
+        if cell and cell.is_revealed and cell.adjacent_mines:
+            neighbors = self.get_neighbors(x, y)
+            if sum(1 for n in neighbors if n.is_flagged) == cell.adjacent_mines:
+                targets = [(n.x, n.y) for n in neighbors if not n.is_flagged and not n.is_revealed]
+        return self.reveal_cells(targets)
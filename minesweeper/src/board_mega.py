@@ -0,0 +1,428 @@
+import math
+import mmap
+import random
+import tempfile
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import accumulate, compress
+
+from board import NO_CELL, Board, count_adjacent_mines
+from chunk import SPILL_ADJACENT_SHIFT, SPILL_FLAGGED, SPILL_MINE, SPILL_REVEALED, pack_cell_states
+
+_CLOSED = SPILL_REVEALED | SPILL_FLAGGED  # 이 비트가 하나라도 있으면 열 수 없는 칸
+_KNOWN = bytes(1 if v & _CLOSED else 0 for v in range(256))
+# 칸 상태 바이트를 이진수 문자 b'0'/b'1'로 바꾸는 변환표 (타일을 칸당 1비트 정수로 만들 때 사용)
+_OPENABLE_BITS = bytes(0x30 if v & _CLOSED else 0x31 for v in range(256))
+_ZERO_BITS = bytes(0x31 if v >> SPILL_ADJACENT_SHIFT == 0 and not v & SPILL_MINE else 0x30 for v in range(256))
+_BITS_TO_CELLS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def _split_mines(rng, mines, left, right):
+    """(내부용) `left`칸과 `right`칸에 지뢰 `mines`개를 나눌 때 왼쪽 몫을 초기하 분포의 정규 근사로 뽑습니다."""
+    if not mines or not left:
+        return 0
+    if not right:
+        return mines
+    total = left + right
+    mean = mines * left / total
+    variance = mean * (right / total) * (total - mines) / max(total - 1, 1)
+    low, high = max(0, mines - right), min(mines, left)
+    return min(high, max(low, round(rng.gauss(mean, math.sqrt(variance)))))
+
+
+@lru_cache(maxsize=32)
+def _tile_links(size, width, height, left, right, top, bottom):
+    """(내부용) `width`x`height` 타일(행 간격 `size`)의 가장자리 칸별로 옆 타일에 있는 이웃 목록.
+
+    이웃은 `(타일 x 변화량, 타일 y 변화량, 그 타일 안의 인덱스)`이며, `left`~`bottom`은 그 방향에
+    타일이 있는지입니다. 가장자리가 아닌 칸은 빈 튜플입니다.
+    """
+    links = [()] * (size * size)
+    edge = {(x, y) for x in range(width) for y in (0, height - 1)} | {(x, y) for y in range(height) for x in (0, width - 1)}
+    for x, y in edge:
+        far = []
+        for ny in range(y - 1, y + 2):
+            for nx in range(x - 1, x + 2):
+                dx = -1 if nx < 0 else 1 if nx >= width else 0
+                dy = -1 if ny < 0 else 1 if ny >= height else 0
+                if not dx and not dy:
+                    continue
+                if (dx < 0 and not left) or (dx > 0 and not right) or (dy < 0 and not top) or (dy > 0 and not bottom):
+                    continue
+                far.append((dx, dy, (ny - dy * size) * size + nx - dx * size))
+        links[y * size + x] = tuple(far)
+    return links
+
+
+@lru_cache(maxsize=8)
+def _tile_bits(size, width, height):
+    """(내부용) `width`x`height` 타일의 칸당 1비트 마스크 `(타일 안 칸, 첫 열 제외, 끝 열 제외, 가장자리 칸)`."""
+    valid = first = last = edge = 0
+    for y in range(height):
+        for x in range(width):
+            bit = 1 << (y * size + x)
+            valid |= bit
+            if x:
+                first |= bit
+            if x < width - 1:
+                last |= bit
+            if x in (0, width - 1) or y in (0, height - 1):
+                edge |= bit
+    return valid, first, last, edge
+
+
+def _to_bits(cells, table):
+    """(내부용) 칸당 1바이트 배열을 변환표로 0/1을 정해 칸당 1비트 정수로 만듭니다 (인덱스 0이 최하위 비트)."""
+    return int(cells.translate(table)[::-1], 2)
+
+
+class BoardMega(Board):
+    """수천~1만 칸 너비의 유한 보드를 위한 타일 보드 클래스.
+
+    칸 상태는 `TILE_SIZE`x`TILE_SIZE` 타일마다 칸당 1바이트(`pack_cell_states`와 같은 비트 배치)로
+    메모리 매핑한 임시 파일에 저장하므로, 실제로 메모리에 올라오는 것은 건드린 타일뿐입니다.
+    첫 클릭 때 전체 지뢰 수를 타일별로 정확히 나눠 두고, 타일의 지뢰 배치는 시드와 타일 좌표만으로
+    정해지므로 처음 필요할 때 만듭니다. 빈 영역 확장은 타일 단위로 진행하며, 한 번에 정해진 예산
+    (`FLOOD_TILE_BUDGET`, `FLOOD_CELL_BUDGET`)만큼만 처리하고 나머지는 `advance`로 이어 갑니다. `CellView`는 없고 칸은 `cell_states`로 읽습니다.
+    """
+    TILE_SIZE = 64
+    TILE_SHIFT = 6  # TILE_SIZE == 1 << TILE_SHIFT
+    MASK_CACHE_SIZE = 64  # 기억해 둘 타일 지뢰 배치 수
+    FLOOD_TILE_BUDGET = 8  # reveal_cells/advance 한 번에 확장할 최대 타일 수
+    FLOOD_CELL_BUDGET = 2048  # reveal_cells/advance 한 번에 이보다 많이 열었으면 다음 호출로 미룸
+    SAFE_RADIUS = 1  # 첫 클릭 주변에서 지뢰를 두지 않는 반경
+
+    def __init__(self, width, height, mine_count, seed=None, path=None):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.mine_count = mine_count
+        self.solvable = False
+        self.seed = random.randrange(10 ** 9) if seed is None else seed  # 같은 시드와 첫 클릭이면 같은 배치
+        self.rng = random.Random(self.seed)
+        self.total_safe_cells = width * height - mine_count
+        self.is_generated = False
+        self.generation_attempts = 0
+        self.exploded_mine_pos = None
+        size = self.TILE_SIZE
+        self.tiles_x = -(-width // size)
+        self.tiles_y = -(-height // size)
+        tiles = self.tiles_x * self.tiles_y
+        self.tile_mines = None  # 타일별 지뢰 수 (첫 클릭 때 정함)
+        self._ready = bytearray(tiles)  # 칸 상태를 파일에 써 둔 타일
+        self._masks = OrderedDict()  # 타일 번호 -> 지뢰 마스크 (최근에 쓴 순서)
+        self._safe = None  # 첫 클릭 안전 구역 (min_x, min_y, max_x, max_y)
+        self._flood = OrderedDict()  # 확장을 기다리는 타일 번호 -> 타일 안 인덱스 목록
+        self._cells = {}  # 타일 모양 -> 타일 안 칸 인덱스 목록
+        self._file = open(path, 'w+b') if path else tempfile.TemporaryFile()
+        self._file.truncate(tiles * size * size)
+        self._map = mmap.mmap(self._file.fileno(), tiles * size * size)
+
+    def close(self):
+        """매핑과 임시 파일을 닫습니다."""
+        self._map.close()
+        self._file.close()
+
+    @property
+    def flooding(self):
+        """아직 끝나지 않은 빈 영역 확장이 있는지."""
+        return bool(self._flood)
+
+    def _tile_shape(self, tile):
+        """(내부용) 타일의 `(tx, ty, 너비, 높이)`. 오른쪽/아래 끝 타일은 작을 수 있습니다."""
+        ty, tx = divmod(tile, self.tiles_x)
+        size = self.TILE_SIZE
+        return tx, ty, min(size, self.width - tx * size), min(size, self.height - ty * size)
+
+    def _safe_cells(self, tx, ty):
+        """(내부용) 타일 안에 있는 첫 클릭 안전 구역 칸의 인덱스 집합."""
+        size = self.TILE_SIZE
+        min_x, min_y, max_x, max_y = self._safe
+        left, top = tx * size, ty * size
+        return {(y - top) * size + x - left
+                for y in range(max(min_y, top), min(max_y, top + size - 1) + 1)
+                for x in range(max(min_x, left), min(max_x, left + size - 1) + 1)}
+
+    def generate(self, first_click_x, first_click_y, cancel=None):
+        """전체 지뢰 수를 타일별로 나눕니다. 첫 클릭 주변 3x3에는 지뢰가 없습니다.
+
+        구간을 반씩 나누며 각 쪽의 칸 수에 맞춰 지뢰를 뽑으므로 합은 항상 `mine_count`입니다.
+        `cancel`은 `BoardFinite.generate`와 맞추기 위한 인자이며 쓰지 않습니다(금방 끝남).
+        """
+        radius = self.SAFE_RADIUS
+        self._safe = (first_click_x - radius, first_click_y - radius, first_click_x + radius, first_click_y + radius)
+        tiles = self.tiles_x * self.tiles_y
+        capacity = [width * height for _, _, width, height in map(self._tile_shape, range(tiles))]
+        for y in range(max(0, first_click_y - radius), min(self.height, first_click_y + radius + 1)):
+            for x in range(max(0, first_click_x - radius), min(self.width, first_click_x + radius + 1)):
+                capacity[self._locate(x, y)[0]] -= 1
+        prefix = list(accumulate(capacity, initial=0))
+        counts = array('H', bytes(2 * tiles))
+        stack = [(0, tiles, self.mine_count)]
+        while stack:
+            low, high, mines = stack.pop()
+            if high - low == 1:
+                counts[low] = mines
+                continue
+            middle = (low + high) // 2
+            left = _split_mines(self.rng, mines, prefix[middle] - prefix[low], prefix[high] - prefix[middle])
+            stack.append((low, middle, left))
+            stack.append((middle, high, mines - left))
+        self.tile_mines = counts
+        self.generation_attempts = 1
+        self.is_generated = True
+        self._notify(None)
+
+    def _mask(self, tile):
+        """(내부용) 타일의 0/1 지뢰 마스크. 시드와 타일 좌표로 정해지며 최근 것은 기억해 둡니다."""
+        mask = self._masks.get(tile)
+        if mask is not None:
+            self._masks.move_to_end(tile)
+            return mask
+        tx, ty, width, height = self._tile_shape(tile)
+        size = self.TILE_SIZE
+        cells = self._cells.get((width, height))
+        if cells is None:
+            cells = self._cells[(width, height)] = [y * size + x for y in range(height) for x in range(width)]
+        safe = self._safe_cells(tx, ty)
+        if safe:
+            cells = [index for index in cells if index not in safe]
+        mask = bytearray(size * size)
+        for index in random.Random(f"{self.seed}:{tx},{ty}").sample(cells, self.tile_mines[tile]):
+            mask[index] = 1
+        self._masks[tile] = mask
+        while len(self._masks) > self.MASK_CACHE_SIZE:
+            self._masks.popitem(last=False)
+        return mask
+
+    def _ensure_tile(self, tile):
+        """(내부용) 타일의 지뢰와 인접 수를 파일에 써 둡니다. 경계의 인접 수는 옆 타일 배치로 바로 계산합니다."""
+        if self._ready[tile]:
+            return
+        size = self.TILE_SIZE
+        span = size + 2
+        tx, ty = tile % self.tiles_x, tile // self.tiles_x
+        window = bytearray(span * span)
+        # 방향별 (원본 시작, 원본 끝, 창 안 시작)
+        ranges = ((-1, size - 1, size, 0), (0, 0, size, 1), (1, 0, 1, size + 1))
+        for dy, src_top, src_bottom, dst_top in ranges:
+            if not 0 <= ty + dy < self.tiles_y:
+                continue
+            for dx, src_left, src_right, dst_left in ranges:
+                if not 0 <= tx + dx < self.tiles_x:
+                    continue
+                mask = self._mask(tile + dy * self.tiles_x + dx)
+                for row in range(src_top, src_bottom):
+                    dst = (dst_top + row - src_top) * span + dst_left
+                    window[dst:dst + src_right - src_left] = mask[row * size + src_left:row * size + src_right]
+        counts = count_adjacent_mines(window, span, span)
+        adjacent = b''.join(counts[row * span + 1:row * span + 1 + size] for row in range(1, size + 1))
+        empty = bytes(size * size)
+        offset = tile * size * size
+        self._map[offset:offset + size * size] = pack_cell_states(self._mask(tile), empty, empty, adjacent)
+        self._ready[tile] = 1
+
+    def _locate(self, x, y):
+        """(내부용) (x, y)가 속한 타일 번호와 타일 안 인덱스."""
+        shift = self.TILE_SHIFT
+        low = self.TILE_SIZE - 1
+        return (y >> shift) * self.tiles_x + (x >> shift), ((y & low) << shift) | (x & low)
+
+    def cell_states(self, x, y, width, height):
+        states = bytearray([NO_CELL]) * (width * height)
+        left, right = max(x, 0), min(x + width, self.width)
+        top, bottom = max(y, 0), min(y + height, self.height)
+        if left >= right or top >= bottom:
+            return states
+        size = self.TILE_SIZE
+        area = size * size
+        ready = self._ready
+        data = self._map
+        for row in range(top, bottom):
+            ty, local_y = divmod(row, size)
+            col = left
+            while col < right:
+                tx, local_x = divmod(col, size)
+                span = min(size - local_x, right - col)
+                tile = ty * self.tiles_x + tx
+                if not ready[tile] and self.game_over:
+                    # 게임이 끝나면 보이는 곳의 지뢰를 보여야 하므로 그 타일만 만듦
+                    self._ensure_tile(tile)
+                dst = (row - y) * width + (col - x)
+                if ready[tile]:
+                    src = tile * area + local_y * size + local_x
+                    states[dst:dst + span] = data[src:src + span]
+                else:
+                    states[dst:dst + span] = bytes(span)  # 아직 만들지 않은 타일은 모두 닫힌 칸
+                col += span
+        return states
+
+    def known_cells(self):
+        size = self.TILE_SIZE
+        area = size * size
+        cells = []
+        for tile in range(len(self._ready)):
+            if not self._ready[tile]:
+                continue
+            left, top = (tile % self.tiles_x) * size, (tile // self.tiles_x) * size
+            known = self._map[tile * area:(tile + 1) * area].translate(_KNOWN)
+            index = known.find(1)
+            while index >= 0:
+                cells.append((left + index % size, top + index // size))
+                index = known.find(1, index + 1)
+        return cells
+
+    def _changed_states(self, changed):
+        shift = self.TILE_SHIFT
+        low = self.TILE_SIZE - 1
+        tiles_x = self.tiles_x
+        data = self._map
+        return changed, bytes([data[((((y >> shift) * tiles_x + (x >> shift)) << shift | (y & low)) << shift) | (x & low)]
+                               for x, y in changed])
+
+    def _queue(self, tile, index):
+        """(내부용) 타일 안의 칸 하나를 확장 대기열에 넣습니다."""
+        waiting = self._flood.get(tile)
+        if waiting is None:
+            self._flood[tile] = [index]
+        else:
+            waiting.append(index)
+
+    def _run_flood(self, changed):
+        """(내부용) 대기 중인 확장을 먼저 들어온 타일부터 예산만큼 처리합니다. 연 칸은 `changed`에 더합니다.
+
+        `FLOOD_TILE_BUDGET`개 타일을 처리했거나 `FLOOD_CELL_BUDGET`칸 넘게 열었으면 멈춥니다.
+
+        타일 하나는 칸당 1비트 정수로 바꿔 인접 수 0인 칸에서 한 겹씩 넓히고(비트 시프트로 3x3 팽창),
+        타일 가장자리의 0인 칸에서 이어지는 옆 타일 칸은 그 타일의 대기열에 넣습니다.
+        """
+        size, shift = self.TILE_SIZE, self.TILE_SHIFT
+        low = size - 1
+        area = size * size
+        flood = self._flood
+        data = self._map
+        opened = 0
+        tiles = self.FLOOD_TILE_BUDGET
+        while flood and tiles > 0 and opened < self.FLOOD_CELL_BUDGET:
+            tiles -= 1
+            tile, starts = flood.popitem(last=False)
+            self._ensure_tile(tile)
+            tx, ty, width, height = self._tile_shape(tile)
+            valid, not_first, not_last, edge = _tile_bits(size, width, height)
+            offset = tile * area
+            cells = data[offset:offset + area]
+            openable = _to_bits(cells, _OPENABLE_BITS) & valid
+            zero = _to_bits(cells, _ZERO_BITS) & valid
+            region = 0
+            for index in starts:
+                region |= 1 << index
+            region &= openable
+            frontier = region
+            while frontier:
+                grow = frontier & zero
+                grow |= ((grow << 1) & not_first) | ((grow >> 1) & not_last)
+                grow |= (grow << size) | (grow >> size)
+                frontier = grow & openable & ~region
+                region |= frontier
+            if not region:
+                continue
+            spread = region & zero & edge
+            if spread:
+                outer = _tile_links(size, width, height, tx > 0, tx < self.tiles_x - 1, ty > 0, ty < self.tiles_y - 1)
+                while spread:
+                    bit = spread & -spread
+                    spread ^= bit
+                    for dx, dy, n in outer[bit.bit_length() - 1]:
+                        self._queue(tile + dy * self.tiles_x + dx, n)
+            marks = format(region, f'0{area}b')[::-1].encode().translate(_BITS_TO_CELLS)
+            data[offset:offset + area] = (int.from_bytes(cells, 'little')
+                                          | int.from_bytes(marks, 'little') << 1).to_bytes(area, 'little')
+            left, top = tx * size, ty * size
+            changed.extend([(left + (index & low), top + (index >> shift)) for index in compress(range(area), marks)])
+            opened += region.bit_count()
+        self.revealed_count += opened
+
+    def advance(self):
+        """남은 빈 영역 확장을 한 번의 예산만큼 이어서 하고 `BoardDelta`를 반환합니다.
+
+        게임은 프레임마다 한 번 부르며, 처리 순서가 정해져 있어 같은 입력이면 같은 프레임에 같은 칸이 열립니다.
+        """
+        before = self._counts()
+        changed = []
+        if self._flood:
+            self._run_flood(changed)
+            if not self.game_over:
+                self.check_win_condition()
+        return self._commit(changed, before)
+
+    def reveal_cells(self, cells):
+        """여러 칸을 열고 `BoardDelta`를 반환합니다. 넓은 빈 영역은 다음 `advance` 호출로 이어서 엽니다.
+
+        지뢰 칸을 만나면 그 앞의 칸까지만 열고 그 지뢰를 터뜨린 뒤 멈춥니다. 보드가 아직 생성되지
+        않았으면 첫 칸을 기준으로 생성합니다.
+        """
+        cells = list(cells)
+        before = self._counts()
+        if cells and not self.is_generated:
+            self.generate(*cells[0])
+        changed = []
+        area = self.TILE_SIZE * self.TILE_SIZE
+        for x, y in cells:
+            if self.game_over:
+                break
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                continue
+            tile, index = self._locate(x, y)
+            self._ensure_tile(tile)
+            state = self._map[tile * area + index]
+            if state & _CLOSED:
+                continue
+            if state & SPILL_MINE:
+                self._run_flood(changed)
+                self.check_win_condition()
+                if not self.game_over:
+                    self.game_over = True
+                    self.exploded_mine_pos = (x, y)
+                    self._map[tile * area + index] = state | SPILL_REVEALED
+                    changed.append((x, y))
+                    self._flood.clear()
+                break
+            self._queue(tile, index)
+        self._run_flood(changed)
+        if not self.game_over:
+            self.check_win_condition()
+        return self._commit(changed, before)
+
+    def toggle_flag(self, x, y):
+        before = self._counts()
+        changed = []
+        # 생성 전에는 타일이 없으므로 깃발을 꽂지 않음
+        if self.is_generated and 0 <= x < self.width and 0 <= y < self.height:
+            tile, index = self._locate(x, y)
+            self._ensure_tile(tile)
+            offset = tile * self.TILE_SIZE * self.TILE_SIZE + index
+            state = self._map[offset]
+            if not state & SPILL_REVEALED:
+                self._map[offset] = state ^ SPILL_FLAGGED
+                self.flag_count += -1 if state & SPILL_FLAGGED else 1
+                changed.append((x, y))
+        return self._commit(changed, before)
+
+    def chord(self, x, y):
+        """열린 숫자 칸 주변의 깃발 수가 숫자와 같으면 나머지 닫힌 이웃을 한 번에 엽니다."""
+        states = self.cell_states(x - 1, y - 1, 3, 3)
+        center = states[4]
+        number = center >> SPILL_ADJACENT_SHIFT
+        targets = []
+        if center != NO_CELL and center & SPILL_REVEALED and number:
+            flags = sum(1 for state in states if state != NO_CELL and state & SPILL_FLAGGED)
+            if flags == number:
+                targets = [(x - 1 + i % 3, y - 1 + i // 3) for i, state in enumerate(states)
+                           if state != NO_CELL and not state & _CLOSED]
+        return self.reveal_cells(targets)
+
+    def check_win_condition(self):
+        if not self._flood and self.revealed_count == self.total_safe_cells:
+            self.win = True
+            self.game_over = True
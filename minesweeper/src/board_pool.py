@@ -0,0 +1,245 @@
+import argparse
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+
+from board import BoardFinite
+
+# 0/1 바이트 배열 <-> '0'/'1' 문자열 변환표 (비트 압축을 C 수준 연산으로 처리하기 위해 사용)
+_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_ASCII = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack_mask(mask):
+    """0/1 바이트 마스크를 칸당 1비트로 압축합니다."""
+    if not mask:
+        return b''
+    value = int(bytes(mask).translate(_TO_ASCII)[::-1], 2)
+    return value.to_bytes((len(mask) + 7) // 8, 'little')
+
+
+def unpack_mask(data, size):
+    """`pack_mask`로 압축한 데이터를 길이 `size`의 0/1 바이트 배열로 복원합니다."""
+    if size == 0:
+        return bytearray()
+    bits = format(int.from_bytes(data, 'little'), f'0{size}b')[::-1]
+    return bytearray(bits.encode('ascii').translate(_FROM_ASCII))
+
+
+def opening_region(board, x, y):
+    """(x, y)를 클릭했을 때 같은 영역이 열리는 칸(연결된 0칸)의 마스크를 반환합니다.
+
+    이 영역 안의 어느 칸을 첫 클릭으로 골라도 열리는 영역이 같으므로 풀이 가능성도 같습니다.
+    """
+    width = board.width
+    region = bytearray(width * board.height)
+    start = y * width + x
+    if board.mines[start] or board.adjacent[start]:
+        return region
+    region[start] = 1
+    q = deque([start])
+    while q:
+        current = q.popleft()
+        for n in board._neighbor_indices(current):
+            if not region[n] and not board.mines[n] and board.adjacent[n] == 0:
+                region[n] = 1
+                q.append(n)
+    return region
+
+
+def _transforms(width, height):
+    """(내부용) 보드 크기를 유지하는 대칭 변환 `(가로 반전, 세로 반전, 전치)` 목록."""
+    result = [(False, False, False), (True, False, False), (False, True, False), (True, True, False)]
+    if width == height:
+        result += [(fx, fy, True) for fx, fy, _ in result]
+    return result
+
+
+def _transform_mask(mask, width, height, transform):
+    """(내부용) 마스크에 대칭 변환을 적용합니다. 전치는 정사각형 보드에서만 사용됩니다."""
+    flip_x, flip_y, transpose = transform
+    if transpose:
+        mask = bytearray(mask[x * width + y] for y in range(height) for x in range(width))
+    rows = [mask[y * width:(y + 1) * width] for y in range(height)]
+    if flip_x:
+        rows = [row[::-1] for row in rows]
+    if flip_y:
+        rows.reverse()
+    return bytearray(b''.join(rows))
+
+
+class BoardPool:
+    """검증된 '추측 없는' 보드 배치를 (가로, 세로, 지뢰 수)별로 디스크에 보관하는 풀.
+
+    각 배치는 비트 압축한 지뢰 마스크와, 첫 클릭 시 같은 영역이 열리는 안전 영역 마스크로
+    저장됩니다. `take`는 클릭한 칸이 안전 영역에 들어오도록 대칭 변환한 배치를 꺼내며,
+    키별/전체 개수 제한을 넘으면 오래된 배치부터 지웁니다.
+    """
+    MAX_FILL_FAILURES = 10  # 채우기를 포기하기 전 연속 생성 실패 횟수 (한 번에 MAX_ATTEMPTS * workers개 시도)
+
+    def __init__(self, path, max_per_key=200, max_total=5000):
+        self.path = path
+        self.max_per_key = max_per_key
+        self.max_total = max_total
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS layouts ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " width INTEGER NOT NULL, height INTEGER NOT NULL, mines INTEGER NOT NULL,"
+                " mine_bits BLOB NOT NULL, safe_bits BLOB NOT NULL, tier INTEGER,"
+                " created REAL NOT NULL)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS layouts_key ON layouts (width, height, mines, id)")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def count(self, width, height, mine_count):
+        """해당 설정으로 보관 중인 배치 수."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM layouts WHERE width = ? AND height = ? AND mines = ?",
+                (width, height, mine_count)).fetchone()
+        return row[0]
+
+    def add_board(self, board, click_x, click_y):
+        """(click_x, click_y)에서 풀이 가능함이 검증된 생성 완료 보드를 풀에 추가합니다."""
+        safe = opening_region(board, click_x, click_y)
+        self.add(board.width, board.height, board.mine_count, board.mines, safe, board.solve_tier)
+
+    def add(self, width, height, mine_count, mines, safe_region, tier=None):
+        """지뢰 마스크와 안전 영역 마스크를 풀에 추가하고 개수 제한을 적용합니다."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO layouts (width, height, mines, mine_bits, safe_bits, tier, created)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (width, height, mine_count, pack_mask(mines), pack_mask(safe_region), tier, time.time()))
+            # 키별 제한: 가장 오래된 배치부터 제거
+            self._conn.execute(
+                "DELETE FROM layouts WHERE id IN (SELECT id FROM layouts"
+                " WHERE width = ? AND height = ? AND mines = ? ORDER BY id DESC LIMIT -1 OFFSET ?)",
+                (width, height, mine_count, self.max_per_key))
+            # 전체 제한
+            self._conn.execute(
+                "DELETE FROM layouts WHERE id IN (SELECT id FROM layouts ORDER BY id DESC LIMIT -1 OFFSET ?)",
+                (self.max_total,))
+
+    def take(self, width, height, mine_count, click_x, click_y):
+        """클릭한 칸이 안전 영역에 들어오는 배치를 찾아 풀에서 꺼냅니다.
+
+        `(지뢰 마스크, 규칙 단계)`를 반환하며, 맞는 배치가 없으면 None을 반환합니다.
+        """
+        # 변환마다 클릭 위치에 놓이는 원래 배치의 칸 (비트 위치로 바로 검사)
+        candidates = []
+        for transform in _transforms(width, height):
+            sx, sy = _inverse_point(click_x, click_y, width, height, transform)
+            candidates.append((sy * width + sx, transform))
+
+        try:
+            return self._take(width, height, mine_count, candidates)
+        except sqlite3.Error as e:
+            print(f"Warning: Board pool lookup failed ({e}).")
+            return None
+
+    def _take(self, width, height, mine_count, candidates):
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, safe_bits FROM layouts WHERE width = ? AND height = ? AND mines = ? ORDER BY id",
+                (width, height, mine_count))
+            for row_id, safe_bits in rows:
+                for index, transform in candidates:
+                    if safe_bits[index >> 3] >> (index & 7) & 1:
+                        mine_bits, tier = self._conn.execute(
+                            "SELECT mine_bits, tier FROM layouts WHERE id = ?", (row_id,)).fetchone()
+                        self._conn.execute("DELETE FROM layouts WHERE id = ?", (row_id,))
+                        mines = unpack_mask(mine_bits, width * height)
+                        return _transform_mask(mines, width, height, transform), tier
+        return None
+
+    def fill(self, width, height, mine_count, target, workers=1, stop=None, log=None):
+        """해당 설정의 배치가 `target`개가 될 때까지 '추측 없는' 보드를 생성해 채웁니다.
+
+        생성이 `MAX_FILL_FAILURES`번 연속 실패하면 (풀기 가능한 배치가 드문 설정) 포기하고 False를 반환합니다.
+        """
+        rng = random.Random()
+        failures = 0
+        while self.count(width, height, mine_count) < target:
+            if stop is not None and stop.is_set():
+                return False
+            board = BoardFinite(width, height, mine_count, workers=workers, seed=rng.getrandbits(64))
+            x, y = rng.randrange(width), rng.randrange(height)
+            board.generate(x, y, cancel=stop)
+            if board.is_generated and board._is_solvable(x, y):
+                failures = 0
+                self.add_board(board, x, y)
+                if log:
+                    log(f"pool {width}x{height}/{mine_count}: {self.count(width, height, mine_count)}/{target}")
+            elif board.is_generated:
+                failures += 1
+                if failures >= self.MAX_FILL_FAILURES:
+                    print(f"Warning: Stopped filling the board pool for {width}x{height}/{mine_count} "
+                          f"after {failures} failed generations in a row.")
+                    return False
+        return True
+
+def _inverse_point(x, y, width, height, transform):
+    """(내부용) 변환 후 (x, y)에 놓이는 원래 배치의 좌표를 반환합니다."""
+    flip_x, flip_y, transpose = transform
+    if flip_x:
+        x = width - 1 - x
+    if flip_y:
+        y = height - 1 - y
+    if transpose:
+        x, y = y, x
+    return x, y
+
+
+def _fill_worker(path, width, height, mine_count, target):
+    """(내부용) 백그라운드 프로세스에서 풀을 채웁니다."""
+    pool = BoardPool(path)
+    try:
+        filled = pool.fill(width, height, mine_count, target)
+    finally:
+        pool.close()
+    if not filled:
+        raise SystemExit(1)  # 게임이 같은 설정으로 다시 채우기를 시작하지 않도록 종료 코드로 알림
+
+
+def start_background_fill(path, width, height, mine_count, target):
+    """게임과 GIL을 다투지 않도록 별도 데몬 프로세스에서 풀을 채우기 시작합니다."""
+    import multiprocessing  # 게임 시작 시간을 줄이기 위해 처음 채울 때 불러옴
+
+    process = multiprocessing.Process(target=_fill_worker, args=(path, width, height, mine_count, target),
+                                      daemon=True)
+    process.start()
+    return process
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill the on-disk pool of verified no-guess boards.")
+    parser.add_argument('--path', required=True, help="pool database file")
+    parser.add_argument('--width', type=int, required=True)
+    parser.add_argument('--height', type=int, required=True)
+    parser.add_argument('--mines', type=int, required=True)
+    parser.add_argument('--count', type=int, default=50, help="target number of stored layouts")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    pool = BoardPool(args.path)
+    try:
+        pool.fill(args.width, args.height, args.mines, args.count, workers=args.workers, log=print)
+    finally:
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -15,3 +15,67 @@ class Cell:
             self.is_flagged = not self.is_flagged
             return True
         return False
+
+
+class CellView:
+    """배열 기반 보드의 한 칸을 가리키는 가벼운 뷰. Cell과 같은 속성을 제공합니다.
+
+    `store`는 `mines`, `revealed`, `flagged`, `adjacent` 바이트 배열을 가진 객체이며,
+    뷰를 통한 읽기/쓰기는 모두 해당 배열의 `index` 위치에 반영됩니다.
+    """
+    __slots__ = ('_store', '_index', 'x', 'y')
+
+    def __init__(self, store, index, x, y):
+        self._store = store
+        self._index = index
+        self.x = x
+        self.y = y
+
+    @property
+    def is_mine(self):
+        return self._store.mines[self._index] != 0
+
+    @is_mine.setter
+    def is_mine(self, value):
+        self._store.mines[self._index] = 1 if value else 0
+
+    @property
+    def is_revealed(self):
+        return self._store.revealed[self._index] != 0
+
+    @is_revealed.setter
+    def is_revealed(self, value):
+        self._store.revealed[self._index] = 1 if value else 0
+
+    @property
+    def is_flagged(self):
+        return self._store.flagged[self._index] != 0
+
+    @is_flagged.setter
+    def is_flagged(self, value):
+        self._store.flagged[self._index] = 1 if value else 0
+
+    @property
+    def adjacent_mines(self):
+        return self._store.adjacent[self._index]
+
+    @adjacent_mines.setter
+    def adjacent_mines(self, value):
+        self._store.adjacent[self._index] = value
+
+    @property
+    def is_chunk_boundary(self):
+        return False
+
+    def toggle_flag(self):
+        """깃발 상태를 토글합니다."""
+        if not self.is_revealed:
+            self.is_flagged = not self.is_flagged
+            return True
+        return False
+
+    def __eq__(self, other):
+        return isinstance(other, CellView) and self._store is other._store and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._store), self._index))
@@ -0,0 +1,130 @@
+import hashlib
+import tempfile
+from functools import lru_cache
+
+# 청크를 파일로 내보낼 때 칸 하나를 1바이트로 표현하는 비트 배치
+SPILL_MINE = 0x01
+SPILL_REVEALED = 0x02
+SPILL_FLAGGED = 0x04
+SPILL_ADJACENT_SHIFT = 4
+
+
+class ChunkSpill:
+    """메모리에서 내보낸 청크의 셀 상태를 임시 파일에 보관하는 저장소.
+
+    레코드 크기가 고정되어 있어 청크 좌표별 슬롯 번호만 메모리에 두고,
+    다시 읽어 들인 슬롯은 이후 내보내는 청크가 재사용합니다.
+    """
+    def __init__(self, record_size, path=None):
+        self.record_size = record_size
+        self._file = open(path, 'w+b') if path else tempfile.TemporaryFile()
+        self._slots = {}
+        self._free = []
+        self._next_slot = 0
+
+    def __contains__(self, coord):
+        return coord in self._slots
+
+    def __len__(self):
+        return len(self._slots)
+
+    def write(self, coord, data):
+        """청크 레코드를 빈 슬롯에 기록합니다."""
+        if len(data) != self.record_size:
+            raise ValueError(f"Chunk record must be {self.record_size} bytes, got {len(data)}.")
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = self._next_slot
+            self._next_slot += 1
+        self._file.seek(slot * self.record_size)
+        self._file.write(data)
+        self._slots[coord] = slot
+
+    def read(self, coord):
+        """청크 레코드를 읽고 슬롯을 비웁니다."""
+        slot = self._slots.pop(coord)
+        self._file.seek(slot * self.record_size)
+        data = self._file.read(self.record_size)
+        self._free.append(slot)
+        return data
+
+    def close(self):
+        self._file.close()
+
+
+def pack_cell_states(mines, revealed, flagged, adjacent):
+    """칸 상태 배열 네 개를 칸당 1바이트(`SPILL_*` 비트 배치)로 묶습니다."""
+    value = (int.from_bytes(mines, 'little')
+             | int.from_bytes(revealed, 'little') << 1
+             | int.from_bytes(flagged, 'little') << 2
+             | int.from_bytes(adjacent, 'little') << SPILL_ADJACENT_SHIFT)
+    return value.to_bytes(len(mines), 'little')
+
+
+# 레코드 바이트에서 각 상태를 꺼내는 변환표
+_MINE_TABLE = bytes(v & SPILL_MINE for v in range(256))
+_REVEALED_TABLE = bytes((v & SPILL_REVEALED) >> 1 for v in range(256))
+_FLAGGED_TABLE = bytes((v & SPILL_FLAGGED) >> 2 for v in range(256))
+_ADJACENT_TABLE = bytes(v >> SPILL_ADJACENT_SHIFT for v in range(256))
+
+
+class Chunk:
+    """무한맵의 정사각형 청크 하나. 셀 상태를 칸당 1바이트인 배열 네 개에 저장합니다.
+
+    배열은 청크 안에서 행 우선 순서이며, `CellView`가 이 배열을 직접 읽고 씁니다.
+    """
+    __slots__ = ('cx', 'cy', 'mines', 'revealed', 'flagged', 'adjacent')
+
+    def __init__(self, cx, cy, size):
+        area = size * size
+        self.cx = cx
+        self.cy = cy
+        self.mines = bytearray(area)
+        self.revealed = bytearray(area)
+        self.flagged = bytearray(area)
+        self.adjacent = bytearray(area)
+
+    def to_record(self):
+        """`ChunkSpill`에 기록할 칸당 1바이트 레코드로 묶습니다."""
+        return pack_cell_states(self.mines, self.revealed, self.flagged, self.adjacent)
+
+    @classmethod
+    def from_record(cls, cx, cy, record):
+        """`to_record`로 묶은 레코드에서 청크를 복원합니다."""
+        chunk = cls.__new__(cls)
+        chunk.cx = cx
+        chunk.cy = cy
+        chunk.mines = bytearray(record.translate(_MINE_TABLE))
+        chunk.revealed = bytearray(record.translate(_REVEALED_TABLE))
+        chunk.flagged = bytearray(record.translate(_FLAGGED_TABLE))
+        chunk.adjacent = bytearray(record.translate(_ADJACENT_TABLE))
+        return chunk
+
+
+@lru_cache(maxsize=None)
+def _threshold_tables(threshold):
+    """(내부용) 16비트 값 < threshold 비교를 상위/하위 바이트 변환표 세 개로 나눕니다."""
+    high, low = divmod(threshold, 256)
+    below = bytes(1 if v < high else 0 for v in range(256))
+    equal = bytes(1 if v == high else 0 for v in range(256))
+    low_below = bytes(1 if v < low else 0 for v in range(256))
+    return below, equal, low_below
+
+
+def hashed_mine_mask(seed, chunk_x, chunk_y, size, density):
+    """월드 시드와 청크 좌표만으로 정해지는 청크의 지뢰 마스크(행 우선 0/1 바이트 배열).
+
+    칸마다 (시드, 청크 좌표)로 만든 SHAKE-128 출력에서 16비트 값을 하나씩 꺼내
+    `density * 65536`보다 작으면 지뢰로 정합니다. 비교는 변환표와 정수 비트 연산으로
+    청크 전체를 한 번에 처리합니다.
+    """
+    area = size * size
+    stream = hashlib.shake_128(f"{seed}:{chunk_x},{chunk_y}".encode()).digest(area * 2)
+    below, equal, low_below = _threshold_tables(min(65536, max(0, round(density * 65536))))
+    high_bytes = stream[0::2]
+    low_bytes = stream[1::2]
+    value = (int.from_bytes(high_bytes.translate(below), 'little')
+             | int.from_bytes(high_bytes.translate(equal), 'little')
+             & int.from_bytes(low_bytes.translate(low_below), 'little'))
+    return bytearray(value.to_bytes(area, 'little'))
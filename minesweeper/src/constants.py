@@ -1,4 +1,4 @@
-import pygame
+import os
 
 # 화면 크기 및 프레임
 SCREEN_WIDTH = 1280
@@ -7,33 +7,34 @@ FPS = 60
 
 # 타일 크기
 TILE_SIZE_DEFAULT = 24
-TILE_SIZE_MIN = 8
+TILE_SIZE_MIN = 1
+TILE_SIZE_DETAIL_MIN = 8  # 이보다 작은 타일은 칸 상태 색만 칠하는 개요 모드로 그림
 TILE_SIZE_MAX = 64
 
-# 색상
-COLOR_WHITE = pygame.Color(255, 255, 255)
-COLOR_BLACK = pygame.Color(0, 0, 0)
-COLOR_GRAY = pygame.Color(128, 128, 128)
-COLOR_DARK_GRAY = pygame.Color(50, 50, 50)
-COLOR_LIGHT_GRAY = pygame.Color(192, 192, 192)
-COLOR_REVEALED = pygame.Color(220, 220, 220)
-COLOR_REVEALED_INNER = pygame.Color(235, 235, 235) # 내부 칸 색상
-COLOR_GRID = pygame.Color(160, 160, 160)
-COLOR_RED = pygame.Color(255, 50, 50)
-COLOR_BLUE = pygame.Color(0, 0, 255)
-COLOR_GREEN = pygame.Color(0, 128, 0)
-COLOR_INCORRECT_FLAG = pygame.Color(255, 100, 100)
+# 색상 (RGB 튜플: pygame 없이도 이 모듈을 불러올 수 있도록 pygame.Color를 쓰지 않음)
+COLOR_WHITE = (255, 255, 255)
+COLOR_BLACK = (0, 0, 0)
+COLOR_GRAY = (128, 128, 128)
+COLOR_DARK_GRAY = (50, 50, 50)
+COLOR_LIGHT_GRAY = (192, 192, 192)
+COLOR_REVEALED = (220, 220, 220)
+COLOR_REVEALED_INNER = (235, 235, 235) # 내부 칸 색상
+COLOR_GRID = (160, 160, 160)
+COLOR_RED = (255, 50, 50)
+COLOR_BLUE = (0, 0, 255)
+COLOR_GREEN = (0, 128, 0)
+COLOR_INCORRECT_FLAG = (255, 100, 100)
 
 # 숫자 색상
 NUMBER_COLORS = {
-    1: pygame.Color(0, 0, 255),
-    2: pygame.Color(0, 128, 0),
-    3: pygame.Color(255, 0, 0),
-    4: pygame.Color(0, 0, 128),
-    5: pygame.Color(128, 0, 0),
-    6: pygame.Color(0, 128, 128),
-    7: pygame.Color(0, 0, 0),
-    8: pygame.Color(128, 128, 128)
+    1: (0, 0, 255),
+    2: (0, 128, 0),
+    3: (255, 0, 0),
+    4: (0, 0, 128),
+    5: (128, 0, 0),
+    6: (0, 128, 128),
+    7: (0, 0, 0),
+    8: (128, 128, 128)
 }
 
 # UI
@@ -43,3 +44,24 @@ INPUT_BOX_WIDTH = 140
 INPUT_BOX_HEIGHT = 40
 BUTTON_WIDTH = 150
 BUTTON_HEIGHT = 50
+
+# 보드 생성
+GENERATION_WORKERS = os.cpu_count() or 1  # '추측 없는' 보드 병렬 생성에 쓸 프로세스 수
+BOARD_POOL_PATH = os.path.join(os.path.expanduser('~'), '.minesweeper', 'board_pool.sqlite3')
+BOARD_POOL_FILL_TARGET = 20  # 설정별로 미리 채워 둘 검증된 배치 수
+BOARD_SIZE_MAX = 200  # 일반 유한 보드의 최대 너비/높이
+MEGA_BOARD_SIZE_MAX = 10000  # 이보다 작거나 같으면 BOARD_SIZE_MAX를 넘어도 메가 보드로 시작
+
+# 프로파일러
+PROFILE_TRACE_DIR = os.path.join(os.path.expanduser('~'), '.minesweeper', 'traces')  # 프레임 기록을 내보낼 폴더
+
+# 세션 기록
+SESSION_RECORD_DIR = os.path.join(os.path.expanduser('~'), '.minesweeper', 'sessions')  # 게임마다 입력 기록을 저장할 폴더
+SESSION_RECORD_KEEP = 50  # 보관할 최근 기록 수
+
+# 힌트
+HINT_FRAME_BUDGET = 0.004  # 프레임마다 지뢰 확률 계산에 쓸 최대 시간(초)
+HINT_SAFE_COLOR = (0, 170, 0)  # 지뢰 확률 0%의 힌트 색
+HINT_MINE_COLOR = (220, 0, 0)  # 지뢰 확률 100%의 힌트 색
+HINT_ALPHA = 110  # 힌트 타일의 불투명도 (0~255)
+HINT_TEXT_TILE_MIN = 24  # 힌트 타일에 백분율 숫자를 쓰는 최소 타일 크기
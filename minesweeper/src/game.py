@@ -1,15 +1,58 @@
 import pygame
+import sqlite3
 import sys
 import os
+import threading
 import time
 
 from constants import *
-from board import BoardFinite, BoardInfinite
+from board import NO_CELL, BoardFinite, BoardInfinite
+from board_mega import BoardMega
+from board_pool import BoardPool, start_background_fill
+from chunk import SPILL_REVEALED
+from hints import HintEngine
+from profiler import FrameProfiler
 from renderer import Renderer
+from replay import CAMERA, CHORD, FLAG, REVEAL, ZOOM, SessionLog, apply_board_event, save_session
 from ui import InputBox, Button, MessageBox
 
+class BoardGenerationJob:
+    """첫 클릭 시 유한 보드 생성을 별도 스레드에서 수행하는 작업.
+
+    메인 루프는 `done`을 확인하며 계속 그리기를 진행하고, 완료되면 클릭한 칸을 엽니다.
+    """
+    def __init__(self, board, x, y):
+        self.board = board
+        self.click = (x, y)
+        self.start_time = time.time()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=board.generate, args=(x, y, self.cancel_event), daemon=True)
+        self.thread.start()
+
+    @property
+    def done(self):
+        return not self.thread.is_alive()
+
+    @property
+    def attempts(self):
+        return self.board.generation_attempts
+
+    @property
+    def elapsed(self):
+        return time.time() - self.start_time
+
+    def cancel(self):
+        """생성을 중단하도록 요청합니다. 워커 정리는 생성 스레드에서 이루어집니다."""
+        self.cancel_event.set()
+
+
 class Game:
-    def __init__(self, asset_path):
+    """메인 루프와 장면(메뉴/게임) 전환, 입력 처리를 맡는 클래스.
+
+    게임 세션마다 시드와 입력(칸 조작, 카메라, 확대)을 `SessionLog`로 기록해 세션이 끝나면
+    `SESSION_RECORD_DIR`에 저장합니다. `replay`를 주면 메뉴 없이 그 기록을 실시간으로 재생합니다.
+    """
+    def __init__(self, asset_path, replay=None):
         pygame.init()
         pygame.font.init()
 
@@ -19,6 +62,7 @@ class Game:
         self.running = True
         self.scene = 'menu'  # 'menu', 'game'
 
+        self.asset_path = asset_path
         self.font_path = os.path.join(asset_path, 'assets', 'font', 'D2Coding.ttf')
         try:
             self.ui_font = pygame.font.Font(self.font_path, UI_FONT_SIZE)
@@ -26,11 +70,29 @@ class Game:
             print(f"Warning: Font not found at {self.font_path}. Falling back to default font.")
             self.ui_font = pygame.font.Font(None, UI_FONT_SIZE)
 
-        self.assets = self._load_assets(asset_path)
+        # 보드 풀과 이미지는 메뉴 표시에 필요 없으므로 게임을 처음 시작할 때 준비
+        self.board_pool = None
+        self._board_pool_opened = False
+        self.pool_filler = None  # (설정 키, 프로세스)
+
+        self.assets = {}
         self.renderer = Renderer(self.screen, self.ui_font, self.assets, self.font_path)
+        self.profiler = FrameProfiler()  # F3으로 켜고 끄는 프레임 계측
         
         self.game_state = {}
         self._init_menu()
+        if replay is not None:
+            self._start_game(replay.settings, replay)
+
+    def _open_board_pool(self):
+        """(내부용) 보드 풀을 처음 필요할 때 한 번 엽니다. 열 수 없으면 None을 반환합니다."""
+        if not self._board_pool_opened:
+            self._board_pool_opened = True
+            try:
+                self.board_pool = BoardPool(BOARD_POOL_PATH)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: Board pool unavailable ({e}). Boards will be generated on the first click.")
+        return self.board_pool
 
     def _load_assets(self, asset_path):
         tile_size = TILE_SIZE_DEFAULT
@@ -56,13 +118,6 @@ class Game:
             'mine_bomb_img_scaled': pygame.transform.scale(mine_bomb_img, (tile_size, tile_size)),
         }
     
-    def _update_scaled_assets(self):
-        tile_size = self.renderer.tile_size
-        self.assets['flag_img_scaled'] = pygame.transform.scale(self.assets['flag_img'], (tile_size, tile_size))
-        self.assets['mine_img_scaled'] = pygame.transform.scale(self.assets['mine_img'], (tile_size, tile_size))
-        self.assets['mine_bomb_img_scaled'] = pygame.transform.scale(self.assets['mine_bomb_img'], (tile_size, tile_size))
-
-
     def _init_menu(self):
         self.scene = 'menu'
         center_x = SCREEN_WIDTH / 2
@@ -88,26 +143,45 @@ class Game:
                 'rect': pygame.Rect(center_x - 240, input_y + 70, 80, 40)
             },
             'mines_input': InputBox(center_x - 150, input_y + 70, INPUT_BOX_WIDTH, INPUT_BOX_HEIGHT, self.ui_font, "100"),
+            'seed_label': {
+                'surface': label_font.render("Seed:", True, COLOR_WHITE),
+                'rect': pygame.Rect(center_x + 20, input_y + 70, 90, 40)
+            },
+            # 세션 시드: 유한 보드의 배치와 무한맵 월드를 정함 (비워 두면 무작위)
+            'seed_input': InputBox(center_x + 120, input_y + 70, INPUT_BOX_WIDTH, INPUT_BOX_HEIGHT, self.ui_font, ""),
             
             'start_button': Button(center_x - BUTTON_WIDTH - 10, 450, BUTTON_WIDTH, BUTTON_HEIGHT, self.ui_font, "Start Finite"),
             'infinite_button': Button(center_x + 10, 450, BUTTON_WIDTH, BUTTON_HEIGHT, self.ui_font, "Start Infinite"),
+            # 새 청크마다 논리만으로 풀리는지 검사하는 '추측 없는' 무한맵
+            'solvable_infinite_button': Button(center_x - BUTTON_WIDTH - 10, 450 + BUTTON_HEIGHT + 20, BUTTON_WIDTH * 2 + 20,
+                                               BUTTON_HEIGHT, self.ui_font, "Start Infinite (No-Guess)"),
             'message_box': MessageBox(600, 250, label_font)
         }
         self.game_state = {'ui_elements': ui_elements}
 
-    def _start_game(self, settings):
+    def _start_game(self, settings, replay=None):
+        """새 게임 세션을 시작합니다. `replay`(SessionLog)를 주면 그 기록의 보드로 시작해 입력 대신 기록을 재생합니다."""
         self.scene = 'game'
-        self.renderer.tile_size = TILE_SIZE_DEFAULT
-        self.renderer.update_font_size()
-        self._update_scaled_assets()
+        if not self.assets:
+            self.assets.update(self._load_assets(self.asset_path))
+        self.renderer.set_tile_size(TILE_SIZE_DEFAULT)
         
         is_infinite = settings.get('infinite', False)
+        is_mega = settings.get('mega', False)
         
-        if is_infinite:
-            board = BoardInfinite()
+        if replay is not None:
+            # 기록된 배치를 쓰므로 풀과 병렬 생성은 필요 없음
+            board = replay.new_board()
+        elif is_infinite:
+            board = BoardInfinite(seed=settings.get('seed'), solvable=settings.get('solvable', False))
+        elif is_mega:
+            board = BoardMega(settings['width'], settings['height'], settings['mines'], seed=settings.get('seed'))
         else:
             solvable = settings.get('solvable', True)
-            board = BoardFinite(settings['width'], settings['height'], settings['mines'], solvable)
+            board = BoardFinite(settings['width'], settings['height'], settings['mines'], solvable,
+                                seed=settings.get('seed'), workers=GENERATION_WORKERS, pool=self._open_board_pool() if solvable else None)
+            if solvable:
+                self._start_pool_fill(settings['width'], settings['height'], settings['mines'])
 
         self.game_state = {
             'board': board,
@@ -115,12 +189,95 @@ class Game:
             'start_time': time.time(),
             'game_active': True,
             'is_infinite': is_infinite,
+            'is_mega': is_mega,
             'camera_offset': (0, 0),
             'dragging': False,
             'drag_start_pos': (0, 0),
             'reset_button': Button(SCREEN_WIDTH - 170, SCREEN_HEIGHT - UI_PANEL_HEIGHT + 5, 150, 50, self.ui_font, "Reset/Menu"),
+            'frame': 0,  # 게임 시작부터 센 프레임 (기록의 시각)
+            'session_log': SessionLog.for_board(board) if replay is None else None,
+            'recorded_camera': (0, 0),
+            'replay': replay,
+            'replay_pos': 0,
+            'hints': None,  # H를 처음 누를 때 만드는 HintEngine
+            'show_hints': False,
         }
 
+    def _start_pool_fill(self, width, height, mines):
+        """이번 설정의 보드 풀을 백그라운드 프로세스에서 채웁니다. 다음 게임의 첫 클릭이 빨라집니다."""
+        if self.board_pool is None:
+            return
+        key = (width, height, mines)
+        if self.pool_filler:
+            running_key, process = self.pool_filler
+            # 종료 코드가 0이 아니면 이 설정은 채우기를 포기했으므로 다시 시작하지 않음
+            if running_key == key and (process.is_alive() or process.exitcode):
+                return
+            process.terminate()
+        self.pool_filler = (key, start_background_fill(BOARD_POOL_PATH, width, height, mines, BOARD_POOL_FILL_TARGET))
+
+    def _needs_generation(self, board, x, y):
+        """첫 클릭으로 유한 보드를 생성해야 하는지 확인합니다."""
+        return (not self.game_state['is_infinite'] and not board.is_generated
+                and 0 <= x < board.width and 0 <= y < board.height)
+
+    def _cancel_generation(self):
+        """진행 중인 보드 생성 작업이 있으면 중단합니다."""
+        job = self.game_state.get('generation_job')
+        if job:
+            job.cancel()
+
+    def _record(self, kind, *args):
+        """(내부용) 현재 프레임에 입력 이벤트를 기록합니다. 유한 보드가 막 생성됐으면 배치를 먼저 기록합니다."""
+        log = self.game_state['session_log']
+        if log is None:
+            return
+        frame = self.game_state['frame']
+        board = self.game_state['board']
+        if (not self.game_state['is_infinite'] and not self.game_state['is_mega'] and board.is_generated
+                and not self.game_state.get('layout_recorded')):
+            # 풀이나 병렬 생성에서 온 배치는 시드만으로 다시 만들 수 없으므로 배치 자체를 남김 (메가 보드는 시드와 첫 클릭으로 정해짐)
+            log.add_layout(frame, board)
+            self.game_state['layout_recorded'] = True
+        log.add(frame, kind, *args)
+
+    def _board_action(self, kind, x, y):
+        """(내부용) 칸 조작 하나를 보드에 적용하고 기록합니다."""
+        apply_board_event(self.game_state['board'], kind, (x, y))
+        self._record(kind, x, y)
+
+    def _end_session(self):
+        """(내부용) 진행 중인 게임 세션의 기록을 저장합니다. 칸 조작이 하나도 없었으면 저장하지 않습니다."""
+        log = self.game_state.get('session_log')
+        if log is None or not log.board_ops:
+            return
+        log.frames = self.game_state['frame']
+        self.game_state['session_log'] = None
+        try:
+            print(f"Session recorded to {save_session(log, SESSION_RECORD_DIR, SESSION_RECORD_KEEP)}")
+        except OSError as e:
+            print(f"Warning: Could not save the session recording ({e}).")
+
+    def _feed_replay(self):
+        """(내부용) 재생 중이면 현재 프레임까지의 기록된 이벤트를 적용합니다."""
+        replay = self.game_state['replay']
+        events = replay.events
+        pos = self.game_state['replay_pos']
+        frame = self.game_state['frame']
+        while pos < len(events) and events[pos][0] <= frame:
+            _, kind, args = events[pos]
+            pos += 1
+            if kind == CAMERA:
+                cam_x, cam_y = self.game_state['camera_offset']
+                self.game_state['camera_offset'] = (cam_x + args[0], cam_y + args[1])
+            elif kind == ZOOM:
+                self.renderer.set_tile_size(args[0])
+            else:
+                apply_board_event(self.game_state['board'], kind, args)
+        self.game_state['replay_pos'] = pos
+        if frame == replay.frames:
+            print("Replay finished.")
+
     def _validate_and_start(self):
         ui = self.game_state['ui_elements']
         msg_box = ui['message_box']
@@ -129,35 +286,68 @@ class Game:
             w = int(ui['width_input'].text)
             h = int(ui['height_input'].text)
             m = int(ui['mines_input'].text)
+            seed = int(ui['seed_input'].text) if ui['seed_input'].text else None
         except ValueError:
-            msg_box.show("Width, Height, and Mines must be valid numbers.")
+            msg_box.show("Width, Height, Mines, and Seed must be valid numbers.")
             return
 
-        if not (10 <= w <= 200 and 10 <= h <= 200):
-            msg_box.show("Width and Height must be between 10 and 200.")
+        if not (10 <= w <= MEGA_BOARD_SIZE_MAX and 10 <= h <= MEGA_BOARD_SIZE_MAX):
+            msg_box.show(f"Width and Height must be between 10 and {MEGA_BOARD_SIZE_MAX}.")
             return
+        mega = w > BOARD_SIZE_MAX or h > BOARD_SIZE_MAX
         
         max_mines = w * h - 9  # 9 = 3x3 safe zone for first click
         if not (0 <= m <= max_mines):
             msg_box.show(f"For this board size, Mines must be between 0 and {max_mines}\\n to guarantee a safe first click area.", True)
-            self.game_state['pending_start_settings'] = {'width': w, 'height': h, 'mines': m, 'infinite': False}
+            self.game_state['pending_start_settings'] = {'width': w, 'height': h, 'mines': m, 'infinite': False,
+                                                         'mega': mega, 'seed': seed}
+            return
+
+        if mega:
+            # 큰 보드는 타일 단위로 필요한 곳만 만드는 메가 보드로 시작 ('추측 없는' 생성은 하지 않음)
+            msg_box.show(f"Boards larger than {BOARD_SIZE_MAX}x{BOARD_SIZE_MAX} use mega-board mode without\n'No-Guess' generation. Proceed?", True)
+            self.game_state['pending_start_settings'] = {'width': w, 'height': h, 'mines': m, 'infinite': False,
+                                                         'mega': True, 'seed': seed}
             return
 
         # Mine density check for solvable board generation
         density = m / (w * h)
         if density > 0.25:
             msg_box.show("'No-Guess' generation is disabled for mine density > 25%.\nThe board may require guessing. Proceed?", True)
-            self.game_state['pending_start_settings'] = {'width': w, 'height': h, 'mines': m, 'infinite': False, 'solvable': False}
+            self.game_state['pending_start_settings'] = {'width': w, 'height': h, 'mines': m, 'infinite': False,
+                                                         'solvable': False, 'seed': seed}
             return
 
-        self._start_game({'width': w, 'height': h, 'mines': m, 'infinite': False, 'solvable': True})
+        self._start_game({'width': w, 'height': h, 'mines': m, 'infinite': False, 'solvable': True, 'seed': seed})
 
-    def run(self):
+    def run(self, max_frames=None):
+        """메인 루프를 실행합니다. `max_frames`를 주면 그만큼 그린 뒤 종료합니다(시작 시간 측정용)."""
+        profiler = self.profiler
+        frames = 0
         while self.running:
+            profiler.begin_frame()
             self.clock.tick(FPS)
+            profiler.mark('wait')
             self._handle_events()
+            profiler.mark('events')
             self._update()
+            profiler.mark('update')
             self._draw()
+            profiler.mark('draw')
+            if self.scene == 'game':
+                # 확대/축소할 때 멈칫하지 않도록 남는 프레임 시간에 타일 크기별 폰트와 스프라이트를 준비
+                self.renderer.warm_zoom_cache()
+                profiler.mark('warm')
+            profiler.count('cells_drawn', self.renderer.cells_drawn)
+            profiler.end_frame()
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                self.running = False
+        self._cancel_generation()
+        if self.scene == 'game':
+            self._end_session()
+        if self.pool_filler:
+            self.pool_filler[1].terminate()
         pygame.quit()
         sys.exit()
 
@@ -165,12 +355,27 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
-            
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # 창이 다시 보이면 화면 내용이 지워졌을 수 있으므로 전체를 다시 그림
+                self.renderer.invalidate()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and self.profiler.enabled:
+                self._dump_profile('csv' if event.mod & pygame.KMOD_SHIFT else 'json')
+
             if self.scene == 'menu':
                 self._handle_menu_events(event)
             elif self.scene == 'game':
                 self._handle_game_events(event)
 
+    def _dump_profile(self, extension):
+        """(내부용) 최근 프레임 기록을 `PROFILE_TRACE_DIR`에 JSON 또는 CSV로 내보냅니다."""
+        path = os.path.join(PROFILE_TRACE_DIR, time.strftime('frames-%Y%m%d-%H%M%S.') + extension)
+        try:
+            print(f"Frame trace written to {self.profiler.dump(path)}")
+        except OSError as e:
+            print(f"Warning: Could not write frame trace ({e}).")
+
     def _handle_menu_events(self, event):
         ui = self.game_state['ui_elements']
         msg_box = ui['message_box']
@@ -191,17 +396,33 @@ class Game:
         if ui['start_button'].is_clicked(event):
             self._validate_and_start()
 
-        if ui['infinite_button'].is_clicked(event):
-            self._start_game({'infinite': True})
+        solvable_infinite = ui['solvable_infinite_button'].is_clicked(event)
+        if ui['infinite_button'].is_clicked(event) or solvable_infinite:
+            seed_text = ui['seed_input'].text
+            try:
+                seed = int(seed_text) if seed_text else None
+            except ValueError:
+                msg_box.show("Seed must be a valid number.")
+                return
+            self._start_game({'infinite': True, 'solvable': solvable_infinite, 'seed': seed})
 
     def _handle_game_events(self, event):
         board = self.game_state['board']
 
         if self.game_state['reset_button'].is_clicked(event):
+            self._cancel_generation()
+            self._end_session()
             self._init_menu()
             return
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_h:
+            # 지뢰 확률 힌트 켜고 끄기. 엔진은 처음 켤 때 만들어 그 뒤의 보드 변경을 따라감
+            if self.game_state['hints'] is None:
+                self.game_state['hints'] = HintEngine(board)
+            self.game_state['show_hints'] = not self.game_state['show_hints']
             
-        if not self.game_state['game_active']:
+        # 재생 중에는 기록된 입력만 적용
+        if not self.game_state['game_active'] or self.game_state['replay']:
             return
 
         cam_x, cam_y = self.game_state['camera_offset']
@@ -213,9 +434,9 @@ class Game:
             world_x_before_zoom = (cam_x + mouse_x) / ts
             world_y_before_zoom = (cam_y + mouse_y) / ts
             
-            self.renderer.tile_size = max(TILE_SIZE_MIN, min(TILE_SIZE_MAX, ts + event.y))
-            self.renderer.update_font_size()
-            self._update_scaled_assets()
+            self.renderer.set_tile_size(max(TILE_SIZE_MIN, min(TILE_SIZE_MAX, ts + event.y)))
+            if self.renderer.tile_size != ts:
+                self._record(ZOOM, self.renderer.tile_size)
             ts = self.renderer.tile_size # update ts
             
             new_cam_x = world_x_before_zoom * ts - mouse_x
@@ -231,23 +452,34 @@ class Game:
             world_x = (event.pos[0] + cam_x) // ts
             world_y = (event.pos[1] + cam_y) // ts
 
+            # 보드 생성 중에는 카메라 조작만 허용
+            if self.game_state.get('generation_job') and event.button != 2:
+                return
+
+            # 보드 조작에 걸린 시간은 이벤트 처리와 따로 잼
+            self.profiler.mark('events')
             if event.button == 1:  # Left click
                 shift_pressed = pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT]
                 if shift_pressed:
-                    board.chord(world_x, world_y)
+                    self._board_action(CHORD, world_x, world_y)
+                elif self._needs_generation(board, world_x, world_y):
+                    self.game_state['generation_job'] = BoardGenerationJob(board, world_x, world_y)
                 else:
-                    board.reveal_cell(world_x, world_y)
+                    self._board_action(REVEAL, world_x, world_y)
             elif event.button == 3:  # Right click
-                cell = board.get_cell(world_x, world_y)
-                if cell and cell.is_revealed:
-                    board.chord(world_x, world_y)
+                state = board.cell_states(world_x, world_y, 1, 1)[0]
+                if state != NO_CELL and state & SPILL_REVEALED:
+                    self._board_action(CHORD, world_x, world_y)
                 else:
-                    board.toggle_flag(world_x, world_y)
+                    self._board_action(FLAG, world_x, world_y)
             elif event.button == 2:  # Middle click (drag)
                 self.game_state['dragging'] = True
                 self.game_state['drag_start_pos'] = event.pos
                 self.game_state['drag_start_cam'] = self.game_state['camera_offset']
-        
+            if event.button in (1, 3):
+                self.profiler.count('board_ops')
+            self.profiler.mark('board')
+
         if event.type == pygame.MOUSEBUTTONUP:
             if event.button == 2:
                 self.game_state['dragging'] = False
@@ -261,21 +493,48 @@ class Game:
     def _update(self):
         if self.scene == 'game':
             board = self.game_state['board']
-            
-            # Camera movement with keys
-            keys = pygame.key.get_pressed()
-            cam_speed = 15
+
+            if self.game_state['replay']:
+                self._feed_replay()
+            else:
+                # Camera movement with keys
+                keys = pygame.key.get_pressed()
+                cam_speed = 15
+                cam_x, cam_y = self.game_state['camera_offset']
+                if keys[pygame.K_w] or keys[pygame.K_UP]: cam_y -= cam_speed
+                if keys[pygame.K_s] or keys[pygame.K_DOWN]: cam_y += cam_speed
+                if keys[pygame.K_a] or keys[pygame.K_LEFT]: cam_x -= cam_speed
+                if keys[pygame.K_d] or keys[pygame.K_RIGHT]: cam_x += cam_speed
+                self.game_state['camera_offset'] = (cam_x, cam_y)
             cam_x, cam_y = self.game_state['camera_offset']
-            if keys[pygame.K_w] or keys[pygame.K_UP]: cam_y -= cam_speed
-            if keys[pygame.K_s] or keys[pygame.K_DOWN]: cam_y += cam_speed
-            if keys[pygame.K_a] or keys[pygame.K_LEFT]: cam_x -= cam_speed
-            if keys[pygame.K_d] or keys[pygame.K_RIGHT]: cam_x += cam_speed
-            self.game_state['camera_offset'] = (cam_x, cam_y)
+
+            if self.game_state['is_infinite']:
+                # 화면에 보이는 청크는 메모리에서 내보내지 않도록 알려 줌
+                ts = self.renderer.tile_size
+                board.set_active_region(cam_x // ts, cam_y // ts,
+                                        (cam_x + SCREEN_WIDTH) // ts, (cam_y + SCREEN_HEIGHT - UI_PANEL_HEIGHT) // ts)
+
+            job = self.game_state.get('generation_job')
+            if job and job.done:
+                del self.game_state['generation_job']
+                if board.is_generated:
+                    self.profiler.mark('update')
+                    self._board_action(REVEAL, *job.click)
+                    self.profiler.mark('board')
+                    self.profiler.count('board_ops')
+                    # 생성에 걸린 시간은 플레이 시간에서 제외
+                    self.game_state['start_time'] = time.time()
+
+            if self.game_state['is_mega'] and board.flooding:
+                # 넓은 빈 영역은 프레임마다 정해진 만큼 이어서 엶 (재생할 때도 같은 프레임에 같은 칸이 열림)
+                self.profiler.mark('update')
+                board.advance()
+                self.profiler.mark('board')
 
             if self.game_state['game_active']:
                 if board.game_over:
                     self.game_state['game_active'] = False
-                else:
+                elif 'generation_job' not in self.game_state:
                     self.game_state['timer'] = time.time() - self.game_state['start_time']
                 
                 # Update stats for UI
@@ -286,6 +545,19 @@ class Game:
                 self.game_state['win'] = board.win
                 self.game_state['game_over'] = board.game_over
 
+            if self.game_state['show_hints'] and 'generation_job' not in self.game_state:
+                # 바뀐 칸 주변만 다시 계산하며, 열거는 프레임마다 정해진 시간 안에서만 진행
+                self.profiler.mark('update')
+                self.game_state['hints'].update(HINT_FRAME_BUDGET)
+                self.profiler.mark('hints')
+
+            # 카메라는 프레임마다 한 번, 움직였을 때만 이동량으로 기록
+            recorded_x, recorded_y = self.game_state['recorded_camera']
+            if (cam_x, cam_y) != (recorded_x, recorded_y):
+                self._record(CAMERA, cam_x - recorded_x, cam_y - recorded_y)
+                self.game_state['recorded_camera'] = (cam_x, cam_y)
+            self.game_state['frame'] += 1
+
     def _draw(self):
         game_draw_state = self.game_state
         if self.scene == 'game':
@@ -295,11 +567,15 @@ class Game:
                 'timer': self.game_state.get('timer', 0),
                 'is_infinite': self.game_state.get('is_infinite', False),
                 'revealed_count': self.game_state.get('revealed_count', 0),
+                'seed': getattr(self.game_state['board'], 'seed', None),
                 'flag_count': self.game_state.get('flag_count', 0),
                 'mine_count': self.game_state.get('mine_count', 0),
                 'game_over': self.game_state.get('game_over', False),
                 'win': self.game_state.get('win', False),
-                'reset_button': self.game_state['reset_button']
+                'reset_button': self.game_state['reset_button'],
+                'generation_job': self.game_state.get('generation_job'),
+                'profiler': self.profiler if self.profiler.enabled else None,
+                'hints': self.game_state['hints'] if self.game_state['show_hints'] else None,
             }
         
         self.renderer.draw(self.scene, game_draw_state)
@@ -0,0 +1,566 @@
+import math
+import time
+from collections import OrderedDict, deque
+
+from board import NO_CELL, BoardFinite, BoardInfinite
+from chunk import SPILL_ADJACENT_SHIFT, SPILL_FLAGGED, SPILL_MINE, SPILL_REVEALED
+from solver import ENUMERATION_LIMIT, Solver
+
+
+class _Component:
+    """(내부용) 닫힌 칸을 공유하는 프런티어 제약의 묶음과 그 풀이 결과."""
+    __slots__ = ('cells', 'constraints', 'parts', 'solved', 'alive')
+
+    def __init__(self, cells, constraints):
+        self.cells = cells  # 제약을 따라 방문한 순서의 닫힌 칸 목록
+        self.constraints = constraints  # [(숫자 칸, (닫힌 이웃 튜플, 남은 지뢰 수)), ...]
+        self.parts = None  # _solve_component 결과 (모순이면 None)
+        self.solved = False
+        self.alive = True
+
+
+class HintEngine:
+    """보드의 프런티어(열린 숫자 칸과 맞닿은 닫힌 칸)마다 지뢰 확률을 계산하는 힌트 엔진.
+
+    보드에 관찰자로 붙어 동작마다 받은 `BoardDelta` 주변의 제약만 다시 만들고, 바뀐 제약에서
+    시작해 단일 칸 규칙과 부분집합 규칙으로 정해지는 칸을 확정합니다. 확정한 칸은 제약에서
+    빼 두므로(깃발은 지뢰로 믿음) 남은 제약은 작은 성분으로 나뉘고, 제약이 바뀐 성분만 다시
+    묶어 풉니다. 바뀌지 않은 성분의 결과는 그대로 쓰고, 같은 모양으로 다시 생긴 성분은
+    `COMPONENT_CACHE_SIZE`개까지 기억해 둔 결과를 씁니다. 확정은 정보가 늘기만 하는 동안 계속
+    유효하므로 깃발을 뽑거나 모순이 드러날 때만 처음부터 다시 계산합니다.
+
+    성분은 `ENUMERATION_LIMIT`칸 이하면 그대로 열거하고, 넘으면 겹치는 창으로 나눠 근사합니다.
+    모든 성분이 정확하면 유한 보드는 전체 지뢰 수로 성분들을 묶어 정확히 세고(프런티어가
+    `EXACT_FRONTIER_LIMIT`칸 이하일 때), 아니면 남은 칸의 지뢰 밀도를 맞춰 가며 근사합니다.
+    무한맵은 칸마다 독립적으로 지뢰 밀도에 따라 지뢰가 놓이므로 성분별 결과를 밀도로 가중하면 됩니다.
+    """
+    TILE = 16  # 칸 상태를 한 번에 읽는 타일 한 변의 칸 수
+    COMPONENT_CACHE_SIZE = 256  # 제약 모양별로 기억해 둘 성분 풀이 결과 수
+    EXACT_FRONTIER_LIMIT = 400  # 전체 지뢰 수로 정확히 셀 프런티어의 최대 칸 수
+    QUEUE_LIMIT = 1 << 14  # update 없이 이보다 많은 칸이 바뀌면 보드 전체를 다시 읽음
+
+    def __init__(self, board):
+        self.board = board
+        self.infinite = isinstance(board, BoardInfinite)
+        self.version = 0  # 확률이 바뀔 수 있을 때마다 증가
+        self._queue = []  # 아직 반영하지 않은 바뀐 칸
+        self._reset = True  # 보드 전체를 다시 읽어야 하는지
+        self._constraints = {}  # 숫자 칸 -> (확정되지 않은 닫힌 이웃 튜플, 남은 지뢰 수)
+        self._by_cell = {}  # 닫힌 칸 -> 그 칸을 제약하는 숫자 칸 집합
+        self._fixed = {}  # 규칙으로 확정한 닫힌 칸 -> 지뢰 여부
+        self._check = set()  # 확정 규칙을 다시 적용할 숫자 칸
+        self._component_of = {}  # 숫자 칸 -> _Component
+        self._dirty = set()  # 성분을 다시 묶어야 하는 숫자 칸
+        self._pending = deque()  # 아직 풀지 않은 성분
+        self._cache = OrderedDict()  # 성분의 제약 모양 -> 풀이 결과
+        self._result = None  # (계산한 version, 칸별 확률, 나머지 칸의 확률)
+        board.add_observer(self._on_change)
+
+    def _on_change(self, delta):
+        # 보드 생성 스레드에서도 불리므로 기록만 하고 계산은 update에서
+        if delta is None or delta.flags < 0:
+            # 보드가 통째로 바뀌었거나 깃발을 뽑으면 그 깃발로 확정한 칸을 믿을 수 없음
+            self._reset = True
+        elif not self._reset:
+            self._queue.extend(delta.cells)
+            if len(self._queue) > self.QUEUE_LIMIT:
+                self._reset = True
+
+    def update(self, budget=None):
+        """쌓인 변경을 반영하고 `budget`초 안에서 성분을 풉니다. 모두 끝났으면 True.
+
+        제약을 다시 만들고 확정하는 일은 예산과 관계없이 끝내고, 성분 풀이는 `budget`초가 지나면
+        다음 호출로 미룹니다(`budget=0`이면 풀지 않고 지금까지의 결과만 씀).
+        """
+        deadline = None if budget is None else time.perf_counter() + budget
+        if self._queue and not self._reset:
+            cells, self._queue = self._queue, []
+            self._apply_cells(cells)
+        if self._reset:
+            self._reset = False
+            self._queue = []
+            self._clear()
+            board = self.board
+            if self.infinite or board.is_generated:
+                self._apply_cells(board.known_cells())
+        if self._check:
+            self._deduce()
+        if self._dirty:
+            self._regroup()
+        pending = self._pending
+        while pending and (deadline is None or time.perf_counter() < deadline):
+            component = pending.popleft()
+            if component.alive:
+                self._solve(component)
+        return not pending
+
+    def probabilities(self, budget=None):
+        """`(칸별 지뢰 확률 사전, 프런티어 밖 닫힌 칸의 확률)`을 반환합니다.
+
+        사전의 키는 (x, y)이며, 아직 풀지 못했거나 모순된(잘못된 깃발) 성분의 칸은 빠집니다.
+        `budget`초 안에 풀이가 끝나지 않으면 그때까지 끝난 성분만으로 계산합니다.
+        """
+        self.update(budget)
+        if self._result is None or self._result[0] != self.version:
+            probabilities, rest = self._combine()
+            probabilities.update((cell, float(mine)) for cell, mine in self._fixed.items())
+            self._result = (self.version, probabilities, rest)
+        return self._result[1], self._result[2]
+
+    def safe_cells(self, budget=None):
+        """지뢰일 수 없는 프런티어 칸 목록."""
+        probabilities, _ = self.probabilities(budget)
+        return [cell for cell, p in probabilities.items() if p == 0.0]
+
+    def mine_cells(self, budget=None):
+        """반드시 지뢰인 프런티어 칸 목록 (깃발이 맞다고 믿을 때)."""
+        probabilities, _ = self.probabilities(budget)
+        return [cell for cell, p in probabilities.items() if p > 1 - 1e-9]
+
+    def hint(self, budget=None):
+        """지뢰일 확률이 가장 낮은 닫힌 칸 `((x, y), 확률)`을 반환합니다. 고를 칸이 없으면 None.
+
+        유한 보드에서 프런티어 밖의 칸이 더 안전하면 그중 하나를 고릅니다.
+        """
+        probabilities, rest = self.probabilities(budget)
+        best = min(probabilities.items(), key=lambda item: item[1], default=None)
+        if not self.infinite and rest is not None and (best is None or rest < best[1]):
+            cell = self._rest_cell(probabilities)
+            if cell is not None:
+                return cell, rest
+        return best
+
+    def _rest_cell(self, frontier):
+        """(내부용) 유한 보드에서 프런티어 밖의 닫힌 칸 하나를 찾습니다. 메가 보드는 전체를 훑지 않고 None."""
+        board = self.board
+        if not isinstance(board, BoardFinite):
+            return None
+        width = board.width
+        for index, (revealed, flagged) in enumerate(zip(board.revealed, board.flagged)):
+            if not revealed and not flagged:
+                cell = (index % width, index // width)
+                if cell not in frontier and cell not in self._by_cell:
+                    return cell
+        return None
+
+    def _clear(self):
+        self._constraints.clear()
+        self._by_cell.clear()
+        self._fixed.clear()
+        self._check.clear()
+        for component in self._component_of.values():
+            component.alive = False
+        self._component_of.clear()
+        self._dirty.clear()
+        self._pending.clear()
+        self.version += 1
+
+    def _states(self, cells):
+        """(내부용) 칸들과 그 이웃의 상태를 타일 단위로 한 번에 읽어 `(x, y) -> 상태 바이트` 함수를 반환합니다."""
+        size = self.TILE
+        span = size + 2
+        windows = {}
+        for x, y in cells:
+            tile = (x // size, y // size)
+            if tile not in windows:
+                windows[tile] = self.board.cell_states(tile[0] * size - 1, tile[1] * size - 1, span, span)
+
+        def state(x, y, center):
+            # center: 이웃을 읽을 때 기준이 된 칸 (그 칸의 타일 창에 이웃이 모두 들어 있음)
+            tx, ty = center[0] // size, center[1] // size
+            return windows[(tx, ty)][(y - ty * size + 1) * span + x - tx * size + 1]
+        return state
+
+    def _apply_cells(self, cells):
+        """(내부용) 바뀐 칸 주변의 숫자 칸 제약을 다시 만듭니다. 확정과 어긋나면 전체를 다시 계산하도록 표시합니다."""
+        affected = set()
+        for x, y in cells:
+            affected.update(((x - 1, y - 1), (x, y - 1), (x + 1, y - 1), (x - 1, y), (x, y),
+                             (x + 1, y), (x - 1, y + 1), (x, y + 1), (x + 1, y + 1)))
+        state = self._states(affected)
+        known = SPILL_REVEALED | SPILL_FLAGGED
+        fixed = self._fixed
+        self.version += 1  # 제약이 그대로여도 남은 지뢰 수와 나머지 칸 수는 바뀜
+        for cell in affected:
+            x, y = cell
+            value = state(x, y, cell)
+            if cell in fixed and value != NO_CELL and value & known:
+                # 확정한 칸이 열리거나 깃발이 꽂힘: 지뢰로 확정한 칸이 열렸거나 안전한 칸에 깃발이면 모순
+                if fixed.pop(cell) != bool(value & SPILL_FLAGGED):
+                    self._reset = True
+                    return
+            new = None
+            if value != NO_CELL and value & SPILL_REVEALED and not value & SPILL_MINE and value >> SPILL_ADJACENT_SHIFT:
+                unknown = []
+                mines = 0
+                for n in ((x - 1, y - 1), (x, y - 1), (x + 1, y - 1), (x - 1, y),
+                          (x + 1, y), (x - 1, y + 1), (x, y + 1), (x + 1, y + 1)):
+                    neighbor = state(n[0], n[1], cell)
+                    if neighbor == NO_CELL and not self.infinite:
+                        continue  # 보드 밖 (무한맵에서는 아직 생성되지 않은 청크의 닫힌 칸)
+                    if neighbor != NO_CELL and neighbor & known:
+                        mines += bool(neighbor & SPILL_FLAGGED)
+                    elif n in fixed:
+                        mines += fixed[n]
+                    else:
+                        unknown.append(n)
+                if unknown:
+                    new = (tuple(unknown), (value >> SPILL_ADJACENT_SHIFT) - mines)
+            self._set_constraint(cell, new)
+
+    def _set_constraint(self, cell, new):
+        """(내부용) 숫자 칸의 제약을 바꾸고, 확정 규칙을 다시 적용하고 성분을 다시 묶도록 표시합니다."""
+        old = self._constraints.get(cell)
+        if old == new:
+            return
+        self._dissolve(cell)
+        if old is not None:
+            for c in old[0]:
+                members = self._by_cell[c]
+                members.discard(cell)
+                if not members:
+                    del self._by_cell[c]
+            del self._constraints[cell]
+        if new is not None:
+            self._constraints[cell] = new
+            self._dirty.add(cell)
+            self._check.add(cell)
+            for c in new[0]:
+                members = self._by_cell.setdefault(c, set())
+                for other in members:
+                    self._dissolve(other)
+                members.add(cell)
+        self.version += 1
+
+    def _deduce(self):
+        """(내부용) 표시된 제약에서 시작해 단일 칸 규칙과 부분집합 규칙으로 정해지는 칸을 확정합니다."""
+        constraints, by_cell, check = self._constraints, self._by_cell, self._check
+        while check:
+            cell = check.pop()
+            constraint = constraints.get(cell)
+            if constraint is None:
+                continue
+            members, remaining = constraint
+            if self._settle(members, remaining):
+                continue
+            member_set = set(members)
+            for other in {o for c in members for o in by_cell[c]}:
+                other_constraint = constraints.get(other)
+                if other == cell or other_constraint is None:
+                    continue
+                other_members, other_remaining = other_constraint
+                if len(other_members) > len(members):
+                    other_set = set(other_members)
+                    if member_set <= other_set:
+                        self._settle(other_set - member_set, other_remaining - remaining)
+                elif len(other_members) < len(members):
+                    other_set = set(other_members)
+                    if other_set <= member_set:
+                        self._settle(member_set - other_set, remaining - other_remaining)
+                if constraints.get(cell) != constraint:
+                    break  # 이 제약도 바뀌었으면 다시 표시되어 있음
+
+    def _settle(self, members, mines):
+        """(내부용) `members` 중 정확히 `mines`개가 지뢰일 때 모두 정해지면 확정합니다. 확정했으면 True.
+
+        모순(음수이거나 칸 수보다 많음)은 그대로 두어 성분을 풀 때 드러나게 합니다.
+        """
+        if not members or (mines != 0 and mines != len(members)):
+            return False
+        mine = mines > 0
+        for c in list(members):
+            self._fix(c, mine)
+        return True
+
+    def _fix(self, cell, mine):
+        """(내부용) 칸을 확정하고 그 칸을 제약하던 숫자 칸의 제약에서 뺍니다."""
+        if cell in self._fixed:
+            return
+        self._fixed[cell] = mine
+        for number in list(self._by_cell.get(cell, ())):
+            members, remaining = self._constraints[number]
+            members = tuple(c for c in members if c != cell)
+            self._set_constraint(number, (members, remaining - mine) if members else None)
+
+    def _dissolve(self, cell):
+        """(내부용) 숫자 칸이 속한 성분을 풀어 구성원 모두를 다시 묶도록 표시합니다."""
+        component = self._component_of.get(cell)
+        if component is None:
+            return
+        component.alive = False
+        for member, _ in component.constraints:
+            del self._component_of[member]
+            self._dirty.add(member)
+
+    def _regroup(self):
+        """(내부용) 표시된 숫자 칸에서 시작해 닫힌 칸을 공유하는 제약끼리 새 성분으로 묶습니다."""
+        constraints, by_cell, component_of = self._constraints, self._by_cell, self._component_of
+        for start in self._dirty:
+            if start not in constraints or start in component_of:
+                continue
+            order, placed, members = [], set(), []
+            component = _Component(order, members)
+            component_of[start] = component
+            q = deque([start])
+            while q:
+                current = q.popleft()
+                members.append((current, constraints[current]))
+                for c in constraints[current][0]:
+                    if c in placed:
+                        continue
+                    placed.add(c)
+                    order.append(c)
+                    for other in by_cell[c]:
+                        if other not in component_of:
+                            component_of[other] = component
+                            q.append(other)
+            self._pending.append(component)
+        self._dirty.clear()
+
+    def _solve(self, component):
+        """(내부용) 성분을 풀어 둡니다. 같은 모양의 제약은 기억해 둔 결과를 씁니다."""
+        # 같은 제약이 여러 숫자 칸에서 나와도 결과는 같으므로 집합으로 다룸
+        key = frozenset(constraint for _, constraint in component.constraints)
+        cache = self._cache
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = _solve_component(component.cells, list(key))
+            if len(cache) > self.COMPONENT_CACHE_SIZE:
+                cache.popitem(last=False)
+        component.parts = cache[key]
+        component.solved = True
+        self.version += 1
+
+    def _components(self):
+        """(내부용) 지금 살아 있는 성분 목록."""
+        seen = set()
+        result = []
+        for component in self._component_of.values():
+            if id(component) not in seen:
+                seen.add(id(component))
+                result.append(component)
+        return result
+
+    def _combine(self):
+        """(내부용) 성분별 풀이 결과를 묶어 `(확정하지 않은 칸별 확률, 나머지 칸의 확률)`을 계산합니다."""
+        parts = []  # (칸 튜플, {지뢰 수: [배치 수, 칸별 지뢰 배치 수]}, 확률을 맡는 위치 또는 None)
+        frontier = unsolved = 0
+        for component in self._components():
+            if component.solved and component.parts is not None:
+                parts.extend(component.parts)
+                frontier += len(component.cells)
+            else:
+                unsolved += len(component.cells)
+
+        board = self.board
+        if self.infinite:
+            density = board.mine_density
+            return self._weighted(parts, density), density
+        if not board.is_generated:
+            return {}, None
+
+        fixed = self._fixed
+        unknown = board.width * board.height - board.revealed_count - board.flag_count - len(fixed)
+        rest = unknown - frontier  # 풀지 못한 성분의 칸도 나머지로 셈 (근사)
+        remaining = board.mine_count - board.flag_count - sum(fixed.values())
+        exact = not unsolved and all(owned is None for _, _, owned in parts)
+        if exact and frontier <= self.EXACT_FRONTIER_LIMIT:
+            result = self._exact(parts, rest, remaining)
+            if result is not None:
+                return result
+
+        # 근사: 나머지 칸의 밀도를 프런티어의 기대 지뢰 수에 맞춰 몇 번 고쳐 씀
+        density = min(max(remaining / unknown, 0.0), 1.0) if unknown > 0 else 0.0
+        if rest <= 0:
+            return self._weighted(parts, density), None
+        # 조각마다 지뢰 수별 (배치 수, 맡은 칸의 지뢰 배치 수 합)을 먼저 모아 두고 기대값만 반복 계산
+        totals = []
+        for cells, summary, owned in parts:
+            positions = owned if owned is not None else range(len(cells))
+            totals.append([(k, count, sum(per_cell[p] for p in positions))
+                           for k, (count, per_cell) in summary.items()])
+        for _ in range(4):
+            density = min(max(density, 1e-6), 1 - 1e-6)
+            ratio = density / (1 - density)
+            expected = 0.0
+            for entries in totals:
+                low = min(k for k, _, _ in entries)
+                weights = [ratio ** (k - low) for k, _, _ in entries]
+                expected += (sum(w * mines for w, (_, _, mines) in zip(weights, entries))
+                             / sum(w * count for w, (_, count, _) in zip(weights, entries)))
+            density = (remaining - expected) / rest
+        density = min(max(density, 1e-6), 1 - 1e-6)
+        return self._weighted(parts, density), density
+
+    @staticmethod
+    def _weighted(parts, density):
+        """(내부용) 칸마다 독립적으로 `density` 확률로 지뢰가 놓인다고 보고 조각별 확률을 계산합니다."""
+        probabilities = {}
+        ratio = density / (1 - density) if 0.0 < density < 1.0 else None
+        for cells, summary, owned in parts:
+            if ratio is None:
+                k = max(summary) if density >= 1.0 else min(summary)
+                weights = {k: 1.0}
+            else:
+                low = min(summary)  # 지뢰 수 차이만 중요하므로 작은 쪽을 기준으로 (아주 작은 수가 0이 되지 않게)
+                weights = {k: ratio ** (k - low) for k in summary}
+            total = sum(summary[k][0] * w for k, w in weights.items())
+            if total == 0:
+                continue
+            for p in owned if owned is not None else range(len(cells)):
+                probabilities[cells[p]] = sum(summary[k][1][p] * w for k, w in weights.items()) / total
+        return probabilities
+
+    @staticmethod
+    def _exact(parts, rest, remaining):
+        """(내부용) 전체 지뢰 수로 조각들을 묶어 정확한 확률을 계산합니다. 모순이면 None.
+
+        조각별 배치 수 다항식의 곱 P(s)와 나머지 칸 배치 수 C(rest, remaining - s)로 전체를 세고,
+        조각 j의 확률에는 P를 그 조각의 다항식으로 나눈 나머지 조각들의 곱을 씁니다.
+        """
+        polys = []
+        for _, summary, _ in parts:
+            poly = [0] * (max(summary) + 1)
+            for k, (count, _) in summary.items():
+                poly[k] = count
+            polys.append(poly)
+        total = [1]
+        for poly in polys:
+            total = _convolve(total, poly)
+
+        log_ways = [_log_comb(rest, remaining - s) for s in range(len(total))]
+        top = max((v for v in log_ways if v is not None), default=None)
+        if top is None:
+            return None
+        ways = [0.0 if v is None else math.exp(v - top) for v in log_ways]
+        scaled = _to_floats(total)
+        norm = sum(p * w for p, w in zip(scaled, ways))
+        if norm == 0:
+            return None
+
+        probabilities = {}
+        for (cells, summary, _), poly in zip(parts, polys):
+            others = _to_floats(_deconvolve(total, poly))
+            weights = {k: sum(q * w for q, w in zip(others, ways[k:])) for k in summary}
+            z = sum(summary[k][0] * w for k, w in weights.items())
+            if z == 0:
+                continue
+            for p, cell in enumerate(cells):
+                probabilities[cell] = sum(summary[k][1][p] * w for k, w in weights.items()) / z
+        rest_probability = None
+        if rest > 0:
+            rest_probability = sum(p * w * (remaining - s) for s, (p, w) in enumerate(zip(scaled, ways))) / (norm * rest)
+        return probabilities, rest_probability
+
+
+def _solve_component(cells, constraints, limit=ENUMERATION_LIMIT):
+    """(내부용) 성분 하나를 풀어 조각 목록으로 반환합니다. 제약이 모순이면 None.
+
+    조각은 `(칸 튜플, Solver.enumerate_component 형식의 요약, 확률을 맡는 위치 목록 또는 None)`입니다.
+    `limit`칸 이하면 성분 전체가 한 조각이고, 더 크면 `_windowed`로 나눈 근사 조각들입니다.
+    """
+    if len(cells) <= limit:
+        summary = Solver.enumerate_component(cells, constraints, limit)
+        return [(tuple(cells), summary, None)] if summary else None
+    return _windowed(cells, constraints, limit)
+
+
+def _windowed(cells, order, limit):
+    """(내부용) 큰 성분을 방문 순서의 제약으로 잘라 겹치는 창마다 열거합니다. 창이 모순이면 None.
+
+    창은 칸이 `limit`개를 넘지 않게 제약을 이어 붙이고 절반씩 겹치며, 칸마다 자기 제약이 가장 많이
+    들어간 창의 결과를 씁니다. 창 밖의 제약을 무시하므로 근사입니다. 결과가 성분을 묶은 순서에
+    따라 달라지지 않도록 가장 작은 제약에서 시작해 정렬된 순서로 다시 방문합니다.
+    """
+    constraints = sorted(order)
+    sharing = {}
+    for i, (members, _) in enumerate(constraints):
+        for c in members:
+            sharing.setdefault(c, []).append(i)
+    order, seen = [], {0}
+    q = deque([0])
+    while q:
+        i = q.popleft()
+        order.append(constraints[i])
+        for j in sorted({j for c in constraints[i][0] for j in sharing[c]} - seen):
+            seen.add(j)
+            q.append(j)
+
+    windows = []
+    start = 0
+    while start < len(order):
+        members, end = set(), start
+        while end < len(order) and (end == start or len(members | set(order[end][0])) <= limit):
+            members.update(order[end][0])
+            end += 1
+        windows.append((start, end))
+        if end == len(order):
+            break
+        start = max(start + 1, (start + end) // 2)
+
+    # 칸마다 자기 제약이 가장 많이 들어간 창(같으면 가운데에 가까운 창)을 고름
+    touching = {c: [] for c in cells}
+    for i, (members, _) in enumerate(order):
+        for c in members:
+            touching[c].append(i)
+    owner = {}
+    for c, indices in touching.items():
+        centre = sum(indices) / len(indices)
+        owner[c] = max(range(len(windows)), key=lambda w: (
+            sum(windows[w][0] <= i < windows[w][1] for i in indices),
+            -abs((windows[w][0] + windows[w][1] - 1) / 2 - centre)))
+
+    parts = []
+    for w, (start, end) in enumerate(windows):
+        window_cells = []
+        for members, _ in order[start:end]:
+            for c in members:
+                if c not in window_cells:
+                    window_cells.append(c)
+        summary = Solver.enumerate_component(window_cells, order[start:end], len(window_cells))
+        if not summary:
+            return None
+        owned = [p for p, c in enumerate(window_cells) if owner[c] == w]
+        if owned:
+            parts.append((tuple(window_cells), summary, owned))
+    return parts
+
+
+def _convolve(a, b):
+    """(내부용) 정수 계수 다항식의 곱."""
+    result = [0] * (len(a) + len(b) - 1)
+    for j, y in enumerate(b):
+        if y:
+            for i, x in enumerate(a):
+                result[i + j] += x * y
+    return result
+
+
+def _deconvolve(total, poly):
+    """(내부용) `total`을 `poly`로 나눈 몫 (나누어떨어지는 정수 다항식)."""
+    low = next(i for i, v in enumerate(poly) if v)
+    divisor = poly[low:]
+    dividend = total[low:]
+    quotient = [0] * (len(total) - len(poly) + 1)
+    for t in range(len(quotient)):
+        value = dividend[t]
+        for i in range(1, min(t, len(divisor) - 1) + 1):
+            value -= divisor[i] * quotient[t - i]
+        quotient[t] = value // divisor[0]
+    return quotient
+
+
+def _to_floats(values):
+    """(내부용) 큰 정수 목록을 비율을 유지한 채 float로 바꿉니다."""
+    shift = max(v.bit_length() for v in values) - 1000
+    if shift > 0:
+        return [float(v >> shift) for v in values]
+    return [float(v) for v in values]
+
+
+def _log_comb(n, k):
+    """(내부용) log C(n, k). k가 범위 밖이면 None."""
+    if k < 0 or k > n:
+        return None
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
@@ -1,3 +1,5 @@
+import argparse
+import multiprocessing
 import os
 import sys
 
@@ -11,12 +13,20 @@ else:
 
 sys.path.append(os.path.join(application_path, 'src'))
 
-from game import Game
-
 def main():
     """게임 인스턴스를 생성하고 실행합니다."""
-    game_instance = Game(application_path)
-    game_instance.run()
+    parser = argparse.ArgumentParser(description="Minesweeper")
+    parser.add_argument('--frames', type=int, help="quit after drawing this many frames (start-up timing)")
+    parser.add_argument('--replay', help="play back a recorded session (.msrec) in real time instead of showing the menu")
+    args, _ = parser.parse_known_args()
+
+    # pygame은 게임을 실제로 띄울 때만 불러옴 (병렬 생성 워커 프로세스는 이 모듈을 다시 실행하지만 main은 부르지 않음)
+    from game import Game
+    from replay import SessionLog
+    game_instance = Game(application_path, SessionLog.load(args.replay) if args.replay else None)
+    game_instance.run(args.frames)
 
 if __name__ == '__main__':
+    # PyInstaller 빌드에서 병렬 보드 생성 워커 프로세스가 동작하도록 필요
+    multiprocessing.freeze_support()
     main()
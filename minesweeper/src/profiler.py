@@ -0,0 +1,134 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+
+
+class FrameProfiler:
+    """메인 루프의 프레임을 단계별로 재는 계측기.
+
+    루프는 단계가 끝날 때마다 `mark(단계)`를 부르고, 직전 표시부터의 시간이 그 단계에 더해집니다.
+    같은 단계를 여러 번 표시해도 되므로 이벤트 처리 중 보드 조작만 따로 떼어 잴 수 있습니다.
+    꺼져 있을 때는 모든 호출이 `enabled` 확인 한 번으로 끝납니다.
+    """
+    PHASES = ('wait', 'events', 'board', 'hints', 'update', 'draw', 'warm')  # 표시 순서
+    TRACE_FRAMES = 600  # 보관할 최근 프레임 수 (60 FPS에서 10초)
+    OVERLAY_REFRESH = 15  # 오버레이 글줄을 다시 계산하는 프레임 간격
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.frames = deque(maxlen=self.TRACE_FRAMES)
+        self._frame_index = 0
+        self._start = None  # 진행 중인 프레임의 시작 시각 (없으면 None)
+        self._last = 0.0
+        self._phases = {}
+        self._counts = {}
+        self._overlay = (None, None)  # (계산한 프레임 번호, 글줄)
+
+    def toggle(self):
+        """계측을 켜거나 끕니다. 다시 켜면 이전 기록은 버립니다."""
+        self.enabled = not self.enabled
+        self._start = None
+        if self.enabled:
+            self.frames.clear()
+            self._overlay = (None, None)
+        return self.enabled
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._start = self._last = time.perf_counter()
+        self._phases = {}
+        self._counts = {}
+
+    def mark(self, phase):
+        """직전 표시부터 지금까지의 시간을 `phase` 단계에 더합니다."""
+        if self._start is None:
+            return
+        now = time.perf_counter()
+        self._phases[phase] = self._phases.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def count(self, name, n=1):
+        if self._start is None:
+            return
+        self._counts[name] = self._counts.get(name, 0) + n
+
+    def end_frame(self):
+        """진행 중인 프레임을 기록에 넣습니다. 프레임 도중에 켜졌으면 그 프레임은 버립니다."""
+        if self._start is None:
+            return
+        total = self._last - self._start
+        self.frames.append({
+            'frame': self._frame_index,
+            'time': self._start,
+            'frame_ms': total * 1000,
+            'work_ms': (total - self._phases.get('wait', 0.0)) * 1000,
+            'phases': {phase: seconds * 1000 for phase, seconds in self._phases.items()},
+            'counts': self._counts,
+        })
+        self._frame_index += 1
+        self._start = None
+
+    def summary(self):
+        """최근 프레임의 프레임/작업 시간 백분위수, 단계별 평균(ms), 횟수 합계를 반환합니다. 기록이 없으면 None."""
+        frames = list(self.frames)
+        if not frames:
+            return None
+        summary = {'frames': len(frames)}
+        for key in ('frame_ms', 'work_ms'):
+            values = sorted(frame[key] for frame in frames)
+            summary[key] = {f'p{p}': values[min(len(values) - 1, len(values) * p // 100)] for p in (50, 95, 99)}
+            summary[key]['max'] = values[-1]
+        summary['phases'] = {phase: sum(frame['phases'].get(phase, 0.0) for frame in frames) / len(frames)
+                             for phase in self.PHASES}
+        names = sorted({name for frame in frames for name in frame['counts']})
+        summary['counts'] = {name: sum(frame['counts'].get(name, 0) for frame in frames) for name in names}
+        return summary
+
+    def overlay_lines(self):
+        """오버레이에 표시할 글줄 목록. 매 프레임 다시 계산하지 않고 `OVERLAY_REFRESH` 프레임마다 갱신합니다."""
+        computed, lines = self._overlay
+        if computed is not None and self._frame_index - computed < self.OVERLAY_REFRESH:
+            return lines
+        lines = self._overlay_lines()
+        self._overlay = (self._frame_index, lines)
+        return lines
+
+    def _overlay_lines(self):
+        summary = self.summary()
+        if summary is None:
+            return ["Profiler: collecting..."]
+        frame, work = summary['frame_ms'], summary['work_ms']
+        lines = [
+            f"Frame ms p50 {frame['p50']:.1f}  p95 {frame['p95']:.1f}  p99 {frame['p99']:.1f}",
+            f"Work  ms p50 {work['p50']:.1f}  p95 {work['p95']:.1f}  p99 {work['p99']:.1f}  max {work['max']:.1f}",
+            "  ".join(f"{phase} {ms:.2f}" for phase, ms in summary['phases'].items() if phase != 'wait'),
+        ]
+        if summary['counts']:
+            lines.append("  ".join(f"{name} {n}" for name, n in summary['counts'].items()))
+        lines.append(f"last {summary['frames']} frames  F4: dump JSON  Shift+F4: CSV")
+        return lines
+
+    def dump(self, path):
+        """최근 프레임 기록을 파일로 씁니다. 확장자가 .csv면 CSV, 그 외에는 JSON입니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        frames = list(self.frames)
+        if path.endswith('.csv'):
+            counts = sorted({name for frame in frames for name in frame['counts']})
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['frame', 'time', 'frame_ms', 'work_ms']
+                                + [f'{phase}_ms' for phase in self.PHASES] + counts)
+                for frame in frames:
+                    writer.writerow([frame['frame'], f"{frame['time']:.6f}", f"{frame['frame_ms']:.3f}",
+                                     f"{frame['work_ms']:.3f}"]
+                                    + [f"{frame['phases'].get(phase, 0.0):.3f}" for phase in self.PHASES]
+                                    + [frame['counts'].get(name, 0) for name in counts])
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'summary': self.summary(), 'frames': frames}, f, indent=1)
+        return path
@@ -1,32 +1,125 @@
+from collections import OrderedDict
+
 import pygame
+from board import NO_CELL
+from chunk import SPILL_ADJACENT_SHIFT, SPILL_FLAGGED, SPILL_MINE, SPILL_REVEALED
 from constants import *
 
 class Renderer:
-    """모든 그리기 작업을 처리하는 클래스."""
+    """모든 그리기 작업을 처리하는 클래스.
+
+    게임 화면의 보드는 화면 크기의 레이어 표면에 유지하고, 매 프레임 바뀐 영역만 다시 그려
+    `pygame.display.update`로 그 영역만 내보냅니다. 아무것도 바뀌지 않은 프레임은 그리지 않습니다.
+    `TILE_SIZE_DETAIL_MIN`보다 작은 타일은 테두리와 그림 없이 칸 상태 색만 칠하는 개요 모드로 그립니다.
+    """
+    MAX_UPDATE_RECTS = 256  # 이보다 많은 칸이 바뀌면 칸별로 그리지 않고 보드 영역 전체를 다시 구성
+    BLOCK_REBUILD_CELLS = 64  # 캐시된 블록에서 이보다 많은 칸이 바뀌면 칸별로 고치지 않고 버림 (다음에 통째로 다시 만듦)
+    ATLAS_CACHE_SIZE = 8  # 타일 아틀라스를 보관할 타일 크기 수
+    BLOCK_SIZE = 16  # 미리 합성해 두는 블록 한 변의 칸 수
+    BLOCK_CACHE_BYTES = 96 * 1024 * 1024  # 블록 표면 캐시의 메모리 한도
+    # 타일 크기에 맞춰 확대해 쓰는 스프라이트 (확대본 키 -> 원본 키)
+    SCALED_SPRITES = {
+        'flag_img_scaled': 'flag_img',
+        'mine_img_scaled': 'mine_img',
+        'mine_bomb_img_scaled': 'mine_bomb_img',
+    }
+    # 개요 모드에서 칸 모양별로 칠할 색 (키는 아틀라스 키와 같고, None은 칸이 없는 자리)
+    OVERVIEW_COLORS = {
+        'hidden': COLOR_LIGHT_GRAY,
+        'flag': pygame.Color(COLOR_LIGHT_GRAY).lerp(COLOR_RED, 0.6),
+        'mine': COLOR_DARK_GRAY,
+        'exploded': COLOR_RED,
+        'wrong_flag': COLOR_INCORRECT_FLAG,
+        'correct_flag': COLOR_GREEN,
+        'blank': COLOR_GRAY,
+        0: COLOR_REVEALED_INNER,
+        **{n: pygame.Color(COLOR_REVEALED).lerp(color, 0.4) for n, color in NUMBER_COLORS.items()},
+        None: COLOR_GRAY,
+    }
+
     def __init__(self, screen, font, assets, font_path):
         self.screen = screen
+        # 레이어는 화면 전체 크기로 두어 아래쪽 칸이 보드 영역 경계에서 잘리지 않고 이전과 같은 모양으로 그려지게 함
+        self.board_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.board_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT - UI_PANEL_HEIGHT)
+        self._layer_bounds = self.board_layer.get_rect()
+        self._atlases = OrderedDict()  # 타일 크기 -> {모양 키: 타일 표면} (오래 쓰이지 않은 순서)
+        self._atlas = None
+        self._blocks = OrderedDict()  # (bx, by, 타일 크기) -> (블록 표면, 칸이 있는 영역) (오래 쓰이지 않은 순서)
+        self._block_bytes = 0
+        self._empty_blocks = set()  # 칸이 없는 블록 (무한맵의 생성되지 않은 영역)
+        self._block_state = None  # 블록을 그린 기준 (보드, 게임 종료 여부)
+        self._overview_keys = list(self.OVERVIEW_COLORS)  # 개요 모드 팔레트 번호 -> 모양 키
+        self._overview_palette = list(self.OVERVIEW_COLORS.values())
+        self._overview_tables = {}  # 게임 종료 여부 -> 칸 상태 바이트를 팔레트 번호로 바꾸는 변환표
+        self._state_keys = {}  # 게임 종료 여부 -> 칸 상태 바이트별 아틀라스 키 목록
+        self._view = None  # 레이어를 그린 기준 (보드, 타일 크기, 게임 종료 여부)
+        self._camera = (0, 0)
+        self._panel = None  # 마지막으로 그린 패널 내용
+        self._overlay_rect = None  # 지난 프레임에 보드 위에 그린 진행 표시 영역
+        self._zoom_cache = {}  # 타일 크기 -> (숫자 폰트, {확대본 키: 스프라이트})
+        self._fonts = {}  # 글자 크기 -> 제목/메시지/오버레이용 폰트
+        self._profiler_rect = None  # 지난 프레임에 그린 프로파일러 오버레이 영역
+        self._profiler_text = None  # (글줄, 오버레이 표면)
+        self._hint_rects = []  # 지난 프레임에 그린 힌트 칸 영역
+        self._hint_view = None  # 힌트를 그린 기준 (엔진, 확률 버전, 카메라, 타일 크기)
+        self._hint_tiles = {}  # (타일 크기, 백분율) -> 반투명 힌트 타일
+        self.cells_drawn = 0  # 마지막 draw 호출에서 타일을 그린 칸 수 (블록 합성 포함)
         self.font = font
         self.assets = assets
         self.font_path = font_path
         self.tile_size = TILE_SIZE_DEFAULT
-        try:
-            self.number_font = pygame.font.Font(self.font_path, self.tile_size - 4)
-        except FileNotFoundError:
-            self.number_font = pygame.font.Font(None, self.tile_size - 4)
+        self.number_font = None  # 숫자 폰트와 스프라이트는 set_tile_size에서 처음 필요할 때 준비
+
+    def set_tile_size(self, tile_size):
+        """타일 크기를 바꾸고 그 크기의 숫자 폰트와 스프라이트로 교체합니다.
+
+        폰트와 스프라이트는 크기별로 한 번만 만들어 두므로 확대/축소는 사전 조회로 끝납니다.
+        """
+        self.tile_size = tile_size
+        self.number_font, sprites = self._zoom_resources(tile_size)
+        self.assets.update(sprites)
 
-    def update_font_size(self):
-        try:
-            self.number_font = pygame.font.Font(self.font_path, int(self.tile_size * 0.75))
-        except FileNotFoundError:
-            self.number_font = pygame.font.Font(None, int(self.tile_size * 0.75))
+    def warm_zoom_cache(self):
+        """아직 준비되지 않은 타일 크기 하나의 폰트와 스프라이트를 미리 만듭니다.
+
+        메인 루프가 프레임마다 한 번씩 호출해 전체 확대/축소 범위를 조금씩 채우며,
+        더 만들 것이 없으면 False를 반환합니다.
+        """
+        for tile_size in range(TILE_SIZE_MIN, TILE_SIZE_MAX + 1):
+            if tile_size not in self._zoom_cache:
+                self._zoom_resources(tile_size)
+                return True
+        return False
+
+    def _zoom_resources(self, tile_size):
+        """(내부용) 타일 크기의 `(숫자 폰트, 확대한 스프라이트)`. 처음 쓰는 크기면 만들어 둡니다."""
+        resources = self._zoom_cache.get(tile_size)
+        if resources is None:
+            font_size = int(tile_size * 0.75)
+            try:
+                number_font = pygame.font.Font(self.font_path, font_size)
+            except FileNotFoundError:
+                number_font = pygame.font.Font(None, font_size)
+            sprites = {name: pygame.transform.scale(self.assets[source], (tile_size, tile_size))
+                       for name, source in self.SCALED_SPRITES.items()}
+            resources = self._zoom_cache[tile_size] = (number_font, sprites)
+        return resources
+
+    def _font(self, size):
+        """(내부용) 글꼴 파일의 `size` 크기 폰트. 처음 쓸 때 불러와 보관합니다."""
+        font = self._fonts.get(size)
+        if font is None:
+            try:
+                font = pygame.font.Font(self.font_path, size)
+            except FileNotFoundError:
+                font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
 
     def draw_menu(self, ui_elements):
         self.screen.fill(COLOR_DARK_GRAY)
-        try:
-            title_font = pygame.font.Font(self.font_path, 64)
-        except FileNotFoundError:
-            title_font = pygame.font.Font(None, 64)
-        title_surf = title_font.render("Minesweeper", True, COLOR_WHITE)
+        title_surf = self._font(64).render("Minesweeper", True, COLOR_WHITE)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH / 2, 100))
         self.screen.blit(title_surf, title_rect)
 
@@ -36,108 +129,346 @@ class Renderer:
             else:
                 element.draw(self.screen)
     
+    def invalidate(self):
+        """다음 프레임에 보드와 패널 전체를 다시 그리도록 합니다."""
+        self._view = None
+
     def draw_board(self, board, camera_offset=(0, 0)):
-        start_x, start_y = camera_offset
-        
-        # 화면에 보일 셀의 범위를 계산
-        view_start_col = int(start_x // self.tile_size)
-        view_end_col = int((start_x + SCREEN_WIDTH) // self.tile_size) + 1
-        view_start_row = int(start_y // self.tile_size)
-        view_end_row = int((start_y + SCREEN_HEIGHT - UI_PANEL_HEIGHT) // self.tile_size) + 1
-
-        cells_to_draw = []
-        if hasattr(board, 'width'): # Finite board
-            for y in range(view_start_row, view_end_row):
-                for x in range(view_start_col, view_end_col):
-                    if 0 <= x < board.width and 0 <= y < board.height:
-                        cells_to_draw.append(board.cells[y][x])
-        else: # Infinite board
-            for y in range(view_start_row, view_end_row):
-                for x in range(view_start_col, view_end_col):
-                    cell = board.get_cell(x, y)
-                    if cell:
-                        cells_to_draw.append(cell)
-
-        for cell in cells_to_draw:
-            rect = pygame.Rect(
-                cell.x * self.tile_size - start_x,
-                cell.y * self.tile_size - start_y,
-                self.tile_size,
-                self.tile_size
-            )
-            
-            # 화면 밖 셀은 그리지 않음
-            if rect.right < 0 or rect.left > SCREEN_WIDTH or rect.bottom < 0 or rect.top > SCREEN_HEIGHT - UI_PANEL_HEIGHT:
-                continue
-
-            if cell.is_revealed:
-                if cell.is_mine:
-                    exploded_pos = board.exploded_mine_pos
-                    if exploded_pos and (cell.x, cell.y) == exploded_pos:
-                        # This is the one that was clicked
-                        pygame.draw.rect(self.screen, COLOR_RED, rect)
-                        self.screen.blit(self.assets['mine_bomb_img_scaled'], rect.topleft)
+        """보드 레이어를 갱신하고 바뀐 영역의 Rect 목록을 반환합니다.
+
+        보드/타일 크기/게임 종료 상태가 바뀌거나 카메라가 움직이면 캐시된 블록을 붙여 레이어를
+        다시 구성하고, 그 외에는 보드가 알려 준 바뀐 칸(`Board.pop_changes`)만 상태 바이트로 다시 그립니다.
+        """
+        layer_rect = self.board_rect
+        camera = (int(camera_offset[0]), int(camera_offset[1]))
+        view = (board, self.tile_size, board.game_over)
+        if (board, board.game_over) != self._block_state:
+            # 다른 보드이거나 게임 종료로 모든 칸 모양이 바뀌었으면 블록을 모두 버림
+            self._clear_blocks()
+            self._block_state = (board, board.game_over)
+        if view != self._view:
+            self._atlas = self._tile_atlas()
+
+        changes = board.pop_changes()
+        if changes is None:
+            self._clear_blocks()
+        else:
+            self._update_blocks(board, changes)
+
+        if view != self._view or changes is None or camera != self._camera or len(changes) > self.MAX_UPDATE_RECTS:
+            # 바뀐 칸이 많으면 칸별로 그리기보다 (방금 고친) 블록을 붙이는 편이 빠름
+            self._view = view
+            self._camera = camera
+            self._compose(board)
+            return [layer_rect]
+
+        self.cells_drawn += len(changes)
+        rects = []
+        ts = self.tile_size
+        cam_x, cam_y = camera
+        for (x, y), key in zip(changes.cells, self._cell_keys(board, changes)):
+            rect = pygame.Rect(x * ts - cam_x, y * ts - cam_y, ts, ts)
+            if rect.colliderect(layer_rect):
+                self._draw_cell(key, rect)
+                rects.append(rect.clip(layer_rect))
+        return rects
+
+    def _compose(self, board):
+        """(내부용) 화면에 걸친 블록 표면을 붙여 보드 레이어 전체를 다시 구성합니다."""
+        layer = self.board_layer
+        layer_rect = self.board_rect
+        ts = self.tile_size
+        block_pixels = self.BLOCK_SIZE * ts
+        cam_x, cam_y = self._camera
+        right = layer_rect.width - 1
+        # 가장자리에 2픽셀만 걸친 칸은 잘린 테두리가 그 두 줄을 채우므로(pygame) 가장자리 한 줄을 칠해 재현.
+        # 개요 모드에는 테두리가 없음
+        outlined = ts >= TILE_SIZE_DETAIL_MIN
+        cut_top = outlined and cam_y % ts == ts - 2
+        cut_left = outlined and cam_x % ts == ts - 2
+        cut_right = outlined and (cam_x + layer_rect.width) % ts == 2
+
+        blocks = []
+        edges = []
+        covered = True
+        for by in range(cam_y // block_pixels, (cam_y + layer_rect.height - 1) // block_pixels + 1):
+            for bx in range(cam_x // block_pixels, (cam_x + layer_rect.width - 1) // block_pixels + 1):
+                cached = self._block_surface(board, bx, by)
+                if cached is None:
+                    covered = False
+                    continue
+                surface, extent = cached
+                pos = (bx * block_pixels - cam_x, by * block_pixels - cam_y)
+                blocks.append((surface, pos))
+                if extent.width < block_pixels or extent.height < block_pixels:
+                    covered = False
+                extent = extent.move(pos)
+                if cut_top and extent.top < 0 < extent.bottom:
+                    edges.append((extent.left, 0, extent.width, 1))
+                if cut_left and extent.left < 0 < extent.right:
+                    edges.append((0, extent.top, 1, extent.height))
+                if cut_right and extent.left <= right < extent.right - 1:
+                    edges.append((right, extent.top, 1, extent.height))
+        if not covered:
+            layer.fill(COLOR_GRAY, layer_rect)
+        layer.blits(blocks, doreturn=False)
+        for edge in edges:
+            layer.fill(COLOR_GRID, pygame.Rect(edge).clip(layer_rect))
+
+    def _block_surface(self, board, bx, by):
+        """(내부용) 블록 (bx, by)를 현재 타일 크기로 미리 합성한 `(표면, 칸이 있는 영역)`.
+
+        블록 안의 칸은 직사각형을 이룹니다(유한 보드의 가장자리, 무한맵의 청크 단위 생성).
+        칸이 하나도 없으면 None을 반환합니다.
+        """
+        key = (bx, by, self.tile_size)
+        cached = self._blocks.get(key)
+        if cached is not None:
+            self._blocks.move_to_end(key)
+            return cached
+        if (bx, by) in self._empty_blocks:
+            return None
+
+        if self.tile_size < TILE_SIZE_DETAIL_MIN:
+            cached = self._build_overview_block(board, bx, by)
+        else:
+            cached = self._build_block(board, bx, by)
+        if cached is None:
+            # 무한맵의 아직 생성되지 않은 영역: 칸이 생기면 _update_blocks에서 지움
+            self._empty_blocks.add((bx, by))
+            return None
+
+        self._blocks[key] = cached
+        surface = cached[0]
+        self._block_bytes += self._surface_bytes(surface)
+        while self._block_bytes > self.BLOCK_CACHE_BYTES and len(self._blocks) > 1:
+            _, (old, _) = self._blocks.popitem(last=False)
+            self._block_bytes -= self._surface_bytes(old)
+        return cached
+
+    def _build_block(self, board, bx, by):
+        """(내부용) 블록 안의 칸마다 아틀라스 타일을 복사해 블록 표면을 만듭니다."""
+        ts = self.tile_size
+        size = self.BLOCK_SIZE
+        atlas = self._atlas
+        keys = self._tile_keys(board.game_over)
+        states = board.cell_states(bx * size, by * size, size, size)
+        if states.count(NO_CELL) == len(states):
+            return None
+        exploded = board.exploded_mine_pos
+        if exploded and exploded[0] // size == bx and exploded[1] // size == by:
+            exploded = exploded[1] % size * size + exploded[0] % size
+        else:
+            exploded = None
+        tiles = []
+        extent = None
+        for index, state in enumerate(states):
+            if state != NO_CELL:
+                y, x = divmod(index, size)
+                rect = pygame.Rect(x * ts, y * ts, ts, ts)
+                tiles.append((atlas['exploded' if index == exploded else keys[state]], rect))
+                extent = rect if extent is None else extent.union(rect)
+        self.cells_drawn += len(tiles)
+        surface = pygame.Surface((size * ts, size * ts)).convert()
+        surface.fill(COLOR_GRAY)
+        surface.blits(tiles, doreturn=False)
+        return surface, extent
+
+    def _build_overview_block(self, board, bx, by):
+        """(내부용) 개요 모드의 블록 표면을 만듭니다.
+
+        보드에서 블록의 칸 상태를 한 번에 받아 변환표로 팔레트 번호(칸당 1픽셀)로 바꾼 뒤
+        8비트 이미지로 감싸 타일 크기만큼 확대합니다. 칸마다 파이썬 반복이나 그리기 호출이 없습니다.
+        """
+        ts = self.tile_size
+        size = self.BLOCK_SIZE
+        states = board.cell_states(bx * size, by * size, size, size)
+        rows = [row for row in range(size) if states[row * size:(row + 1) * size].count(NO_CELL) < size]
+        if not rows:
+            return None
+        first = states[rows[0] * size:(rows[0] + 1) * size]
+        left = size - len(first.lstrip(bytes([NO_CELL])))
+        right = len(first.rstrip(bytes([NO_CELL])))
+
+        pixels = states.translate(self._overview_table(board.game_over))
+        exploded = board.exploded_mine_pos
+        if exploded and exploded[0] // size == bx and exploded[1] // size == by:
+            pixels[exploded[1] % size * size + exploded[0] % size] = self._overview_keys.index('exploded')
+        image = pygame.image.frombuffer(pixels, (size, size), 'P')
+        image.set_palette(self._overview_palette)
+        surface = pygame.transform.scale(image, (size * ts, size * ts)).convert()
+        extent = pygame.Rect(left * ts, rows[0] * ts, (right - left) * ts, (rows[-1] + 1 - rows[0]) * ts)
+        self.cells_drawn += (right - left) * len(rows)
+        return surface, extent
+
+    def _overview_table(self, game_over):
+        """(내부용) 칸 상태 바이트(`Board.cell_states`)를 개요 모드 팔레트 번호로 바꾸는 변환표."""
+        table = self._overview_tables.get(game_over)
+        if table is None:
+            keys = []
+            for value in range(256):
+                mine = value & SPILL_MINE
+                if value == NO_CELL:
+                    key = None
+                elif value & SPILL_REVEALED:
+                    key = 'mine' if mine else min(value >> SPILL_ADJACENT_SHIFT, 8)
+                elif game_over:
+                    if value & SPILL_FLAGGED:
+                        key = 'correct_flag' if mine else 'wrong_flag'
                     else:
-                        # This is another mine revealed at game over
-                        pygame.draw.rect(self.screen, COLOR_REVEALED, rect)
-                        self.screen.blit(self.assets['mine_img_scaled'], rect.topleft)
+                        key = 'mine' if mine else 'blank'
                 else:
-                    # 인접 지뢰 0인 내부 칸과 숫자가 있는 경계 칸 색상 구분
-                    is_inner = True
-                    neighbors = board.get_neighbors(cell.x, cell.y)
-                    if len(neighbors) < 8: # 맵 가장자리
-                        is_inner = False
-                    else:
-                        for n in neighbors:
-                             if not n.is_revealed:
-                                is_inner = False
-                                break
-                    
-                    # 더 간단한 규칙: adjacent_mines가 0이면 내부 스타일
-                    if cell.adjacent_mines == 0:
-                        pygame.draw.rect(self.screen, COLOR_REVEALED_INNER, rect)
-                    else:
-                        pygame.draw.rect(self.screen, COLOR_REVEALED, rect)
-
-                    if cell.adjacent_mines > 0:
-                        num_surf = self.number_font.render(str(cell.adjacent_mines), True, NUMBER_COLORS[cell.adjacent_mines])
-                        num_rect = num_surf.get_rect(center=rect.center)
-                        self.screen.blit(num_surf, num_rect)
-            elif board.game_over: # Game is over, show hidden mines and incorrect flags
-                if cell.is_mine and not cell.is_flagged: # Unrevealed mine, not flagged (so show it)
-                    pygame.draw.rect(self.screen, COLOR_REVEALED, rect)
-                    self.screen.blit(self.assets['mine_img_scaled'], rect.topleft)
-                elif cell.is_flagged and not cell.is_mine: # Incorrectly flagged
-                    pygame.draw.rect(self.screen, COLOR_INCORRECT_FLAG, rect)
-                    self.screen.blit(self.assets['flag_img_scaled'], rect.topleft)
-                elif cell.is_flagged and cell.is_mine: # Correctly flagged mine
-                    pygame.draw.rect(self.screen, COLOR_REVEALED, rect) # Background for correctly flagged
-                    self.screen.blit(self.assets['flag_img_scaled'], rect.topleft)
-            else: # Not revealed and game not over
-                pygame.draw.rect(self.screen, COLOR_LIGHT_GRAY, rect)
-                if cell.is_flagged:
-                    self.screen.blit(self.assets['flag_img_scaled'], rect.topleft)
-
-            pygame.draw.rect(self.screen, COLOR_GRID, rect, 1)
+                    key = 'flag' if value & SPILL_FLAGGED else 'hidden'
+                keys.append(self._overview_keys.index(key))
+            table = self._overview_tables[game_over] = bytes(keys)
+        return table
 
-    def draw_ui(self, game_state):
-        panel_rect = pygame.Rect(0, SCREEN_HEIGHT - UI_PANEL_HEIGHT, SCREEN_WIDTH, UI_PANEL_HEIGHT)
-        pygame.draw.rect(self.screen, COLOR_DARK_GRAY, panel_rect)
+    def _tile_keys(self, game_over):
+        """(내부용) 칸 상태 바이트로 아틀라스 키를 찾는 목록. 열린 숫자 칸은 인접 지뢰 수(0~8)이고 'exploded'는 따로 처리합니다."""
+        keys = self._state_keys.get(game_over)
+        if keys is None:
+            keys = self._state_keys[game_over] = [self._overview_keys[i] for i in self._overview_table(game_over)]
+        return keys
+
+    def _cell_keys(self, board, changes):
+        """(내부용) `BoardDelta`의 칸마다 아틀라스 키를 같은 순서로 반환합니다."""
+        keys = self._tile_keys(board.game_over)
+        result = [keys[state] for state in changes.states]
+        exploded = board.exploded_mine_pos
+        if exploded:
+            for i, cell in enumerate(changes.cells):
+                if cell == exploded:
+                    result[i] = 'exploded'
+        return result
 
+    def _update_blocks(self, board, changes):
+        """(내부용) 바뀐 칸을 현재 타일 크기의 캐시된 블록에 반영하고, 다른 타일 크기의 블록은 버립니다.
+
+        한 블록에서 `BLOCK_REBUILD_CELLS`칸보다 많이 바뀌었으면(넓게 열린 경우) 그 블록도 버려
+        다음에 보일 때 상태 바이트로 통째로 다시 만듭니다.
+        """
+        if not changes:
+            return
+        ts = self.tile_size
+        size = self.BLOCK_SIZE
+        per_block = {}
+        for (x, y), key in zip(changes.cells, self._cell_keys(board, changes)):
+            bx, local_x = divmod(x, size)
+            by, local_y = divmod(y, size)
+            tiles = per_block.get((bx, by))
+            if tiles is None:
+                tiles = per_block[(bx, by)] = []
+            tiles.append((key, local_x * ts, local_y * ts))
+
+        atlas = self._atlas
+        sizes = {key[2] for key in self._blocks}
+        for (bx, by), tiles in per_block.items():
+            self._empty_blocks.discard((bx, by))
+            for other in sizes:
+                if other == ts and len(tiles) <= self.BLOCK_REBUILD_CELLS:
+                    cached = self._blocks.get((bx, by, ts))
+                    if cached is not None:
+                        cached[0].blits([(atlas[key], pos) for key, *pos in tiles], doreturn=False)
+                    continue
+                cached = self._blocks.pop((bx, by, other), None)
+                if cached is not None:
+                    self._block_bytes -= self._surface_bytes(cached[0])
+
+    def _clear_blocks(self):
+        self._blocks.clear()
+        self._empty_blocks.clear()
+        self._block_bytes = 0
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _draw_cell(self, key, rect):
+        """(내부용) 모양 키가 `key`인 칸 하나를 보드 레이어에 그립니다. 타일 아틀라스에서 한 번 복사합니다."""
+        layer = self.board_layer
+        layer.blit(self._atlas[key], rect)
+        if self.tile_size >= TILE_SIZE_DETAIL_MIN and not self._layer_bounds.contains(rect):
+            # 가장자리에 걸린 칸: 예전처럼 잘린 영역의 경계에 테두리를 그림
+            pygame.draw.rect(layer, COLOR_GRID, rect, 1)
+
+    def _tile_atlas(self):
+        """(내부용) 현재 타일 크기의 아틀라스를 반환합니다. 처음 쓰는 크기면 만들고, 오래된 크기는 버립니다."""
+        atlas = self._atlases.get(self.tile_size)
+        if atlas is None:
+            atlas = self._build_atlas()
+            self._atlases[self.tile_size] = atlas
+            while len(self._atlases) > self.ATLAS_CACHE_SIZE:
+                self._atlases.popitem(last=False)
+        else:
+            self._atlases.move_to_end(self.tile_size)
+        return atlas
+
+    def _build_atlas(self):
+        """(내부용) 셀이 가질 수 있는 모든 모양을 현재 타일 크기로 한 번씩 그려 둡니다."""
+        ts = self.tile_size
+        if ts < TILE_SIZE_DETAIL_MIN:
+            # 개요 모드: 모양별 색으로 칠한 타일
+            atlas = {}
+            for key, color in self.OVERVIEW_COLORS.items():
+                if key is not None:
+                    atlas[key] = pygame.Surface((ts, ts)).convert()
+                    atlas[key].fill(color)
+            return atlas
+        rect = pygame.Rect(0, 0, ts, ts)
+        backgrounds = {
+            'hidden': COLOR_LIGHT_GRAY,
+            'flag': COLOR_LIGHT_GRAY,
+            'mine': COLOR_REVEALED,
+            'exploded': COLOR_RED,
+            'wrong_flag': COLOR_INCORRECT_FLAG,
+            'correct_flag': COLOR_REVEALED,
+            'blank': COLOR_GRAY,  # 게임 종료 후 가려진 안전 칸은 배경 그대로
+            0: COLOR_REVEALED_INNER,  # 인접 지뢰 0인 내부 칸과 숫자가 있는 경계 칸 색상 구분
+        }
+        images = {
+            'flag': 'flag_img_scaled',
+            'mine': 'mine_img_scaled',
+            'exploded': 'mine_bomb_img_scaled',
+            'wrong_flag': 'flag_img_scaled',
+            'correct_flag': 'flag_img_scaled',
+        }
+        atlas = {}
+        for key in list(backgrounds) + list(range(1, 9)):
+            tile = pygame.Surface((ts, ts)).convert()
+            pygame.draw.rect(tile, backgrounds.get(key, COLOR_REVEALED), rect)
+            if key in images:
+                tile.blit(self.assets[images[key]], rect.topleft)
+            elif isinstance(key, int) and key > 0:
+                num_surf = self.number_font.render(str(key), True, NUMBER_COLORS[key])
+                num_rect = num_surf.get_rect(center=rect.center)
+                tile.blit(num_surf, num_rect)
+            pygame.draw.rect(tile, COLOR_GRID, rect, 1)
+            atlas[key] = tile
+        return atlas
+
+    def draw_ui(self, game_state):
+        """하단 패널을 그립니다. 표시 내용이 그대로면 그리지 않고 None을 반환합니다."""
         is_infinite = game_state['is_infinite']
         
         if is_infinite:
             # Score
-            text = f"Score: {game_state['revealed_count']}"
+            text = f"Score: {game_state['revealed_count']}   Seed: {game_state['seed']}"
         else:
              # Mine Counter
-            text = f"Mines: {game_state['mine_count'] - game_state['flag_count']}"
-        
-        surf = self.font.render(text, True, COLOR_WHITE)
-        self.screen.blit(surf, (20, SCREEN_HEIGHT - UI_PANEL_HEIGHT + 15))
+            text = f"Mines: {game_state['mine_count'] - game_state['flag_count']}   Seed: {game_state['seed']}"
 
         # Timer
         time_text = f"Time: {int(game_state['timer'])}"
+        if self._panel == (text, time_text):
+            return None
+        self._panel = (text, time_text)
+
+        panel_rect = pygame.Rect(0, SCREEN_HEIGHT - UI_PANEL_HEIGHT, SCREEN_WIDTH, UI_PANEL_HEIGHT)
+        pygame.draw.rect(self.screen, COLOR_DARK_GRAY, panel_rect)
+
+        surf = self.font.render(text, True, COLOR_WHITE)
+        self.screen.blit(surf, (20, SCREEN_HEIGHT - UI_PANEL_HEIGHT + 15))
+
         time_surf = self.font.render(time_text, True, COLOR_WHITE)
         time_rect = time_surf.get_rect(centerx=SCREEN_WIDTH / 2)
         time_rect.y = SCREEN_HEIGHT - UI_PANEL_HEIGHT + 15
@@ -145,31 +476,159 @@ class Renderer:
 
         # Reset Button
         game_state['reset_button'].draw(self.screen, COLOR_BLUE)
+        return panel_rect
+
+    def draw_game_over(self, win):
+        """보드 영역을 어둡게 덮고 승리/패배 메시지를 표시합니다."""
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - UI_PANEL_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 128))
+        self.screen.blit(overlay, (0, 0))
         
-        # Game Over/Win message
-        if game_state['game_over']:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - UI_PANEL_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
-            
-            msg = "You Win!" if game_state['win'] else "Game Over"
-            try:
-                msg_font = pygame.font.Font(self.font_path, 72)
-            except FileNotFoundError:
-                msg_font = pygame.font.Font(None, 72)
-            msg_surf = msg_font.render(msg, True, COLOR_WHITE)
-            msg_rect = msg_surf.get_rect(center=(SCREEN_WIDTH / 2, (SCREEN_HEIGHT - UI_PANEL_HEIGHT) / 2))
-            self.screen.blit(msg_surf, msg_rect)
+        msg = "You Win!" if win else "Game Over"
+        msg_surf = self._font(72).render(msg, True, COLOR_WHITE)
+        msg_rect = msg_surf.get_rect(center=(SCREEN_WIDTH / 2, (SCREEN_HEIGHT - UI_PANEL_HEIGHT) / 2))
+        self.screen.blit(msg_surf, msg_rect)
+
+    def draw_generation_progress(self, job):
+        """보드 생성 중 시도 횟수와 경과 시간을 화면 중앙에 표시합니다."""
+        box = pygame.Rect(0, 0, 520, 90)
+        box.center = (SCREEN_WIDTH / 2, (SCREEN_HEIGHT - UI_PANEL_HEIGHT) / 2)
+        pygame.draw.rect(self.screen, COLOR_DARK_GRAY, box)
+        pygame.draw.rect(self.screen, COLOR_WHITE, box, 2)
+
+        dots = '.' * (int(job.elapsed * 2) % 4)
+        lines = (f"Generating board{dots}", f"Attempt {job.attempts}  ({job.elapsed:.1f}s)")
+        for i, line in enumerate(lines):
+            surf = self.font.render(line, True, COLOR_WHITE)
+            rect = surf.get_rect(center=(box.centerx, box.top + 25 + i * 40))
+            self.screen.blit(surf, rect)
+        return box
+
+    def draw_profiler(self, lines):
+        """프로파일러 오버레이를 보드 왼쪽 위에 그리고 그 영역을 반환합니다.
+
+        배경이 불투명해 같은 자리에 겹쳐 그려도 되며, 글줄이 짧아져도 지난 영역까지 배경으로 덮습니다.
+        """
+        if self._profiler_text is None or self._profiler_text[0] != lines:
+            font = self._font(16)
+            surfs = [font.render(line, True, COLOR_WHITE) for line in lines]
+            text = pygame.Surface((max(surf.get_width() for surf in surfs) + 16,
+                                   sum(surf.get_height() for surf in surfs) + 12)).convert()
+            text.fill(COLOR_DARK_GRAY)
+            y = 6
+            for surf in surfs:
+                text.blit(surf, (8, y))
+                y += surf.get_height()
+            self._profiler_text = (lines, text)
+        text = self._profiler_text[1]
+        rect = text.get_rect(topleft=(8, 8))
+        if self._profiler_rect:
+            rect.union_ip(self._profiler_rect)
+            self.screen.fill(COLOR_DARK_GRAY, rect)
+        self.screen.blit(text, rect.topleft)
+        return rect
+
+    def _hint_tile(self, percent):
+        """(내부용) 지뢰 확률 `percent`%를 초록(안전)에서 빨강(위험)으로 칠한 반투명 타일. 크기별로 보관합니다."""
+        ts = self.tile_size
+        tile = self._hint_tiles.get((ts, percent))
+        if tile is None:
+            tile = pygame.Surface((ts, ts), pygame.SRCALPHA)
+            color = pygame.Color(HINT_SAFE_COLOR).lerp(HINT_MINE_COLOR, percent / 100)
+            color.a = HINT_ALPHA
+            margin = max(1, ts // 8)  # 칸 테두리는 보이도록 안쪽만 칠함
+            tile.fill(color, tile.get_rect().inflate(-2 * margin, -2 * margin))
+            if ts >= HINT_TEXT_TILE_MIN:
+                text = self._font(ts * 2 // 5).render(str(percent), True, COLOR_BLACK)
+                tile.blit(text, text.get_rect(center=(ts / 2, ts / 2)))
+            self._hint_tiles[(ts, percent)] = tile
+        return tile
+
+    def draw_hints(self, engine, camera_offset):
+        """보이는 프런티어 칸마다 지뢰 확률을 반투명 타일로 덧그리고 그린 영역 목록을 반환합니다."""
+        probabilities, _ = engine.probabilities(0)  # 계산은 게임 갱신 단계에서 예산 안에 끝냄
+        ts = self.tile_size
+        cam_x, cam_y = int(camera_offset[0]), int(camera_offset[1])
+        min_x, min_y = cam_x // ts, cam_y // ts
+        max_x = (cam_x + self.board_rect.width) // ts
+        max_y = (cam_y + self.board_rect.height) // ts
+        rects = []
+        for (x, y), p in probabilities.items():
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                rect = pygame.Rect(x * ts - cam_x, y * ts - cam_y, ts, ts).clip(self.board_rect)
+                self.screen.blit(self._hint_tile(round(p * 100)), rect,
+                                 pygame.Rect(rect.x - (x * ts - cam_x), rect.y - (y * ts - cam_y), rect.w, rect.h))
+                rects.append(rect)
+        return rects
 
     def draw(self, scene, game_state):
-        self.screen.fill(COLOR_GRAY)
+        self.cells_drawn = 0
         if scene == 'menu':
+            self.screen.fill(COLOR_GRAY)
             self.draw_menu(game_state['ui_elements'])
-        elif scene == 'game':
-            self.draw_board(game_state['board'], game_state['camera_offset'])
-            self.draw_ui(game_state)
-        
-        if 'message_box' in game_state and game_state['message_box'].active:
-            game_state['message_box'].draw(self.screen)
+            if 'message_box' in game_state and game_state['message_box'].active:
+                game_state['message_box'].draw(self.screen)
+            pygame.display.flip()
+            self.invalidate()
+            return
+
+        full = self._view is None
+        board_rects = self.draw_board(game_state['board'], game_state['camera_offset'])
+        if full:
+            self._panel = None
+            self._overlay_rect = None
+            self._profiler_rect = None
+            self._hint_rects = []
+            self._hint_view = None
+
+        rects = []
+        if self._profiler_rect and not game_state.get('profiler'):
+            # 꺼진 프로파일러 오버레이 자리는 덮개까지 포함해 보드 영역 전체를 다시 합성
+            board_rects = [self.board_rect]
+            self._profiler_rect = None
+        if game_state['game_over'] and board_rects:
+            # 반투명 덮개는 겹쳐 그리면 진해지므로 보드 영역 전체를 다시 합성
+            board_rects = [self.board_rect]
+            self.screen.blit(self.board_layer, self.board_rect, self.board_rect)
+            self.draw_game_over(game_state['win'])
+        else:
+            for rect in board_rects:
+                self.screen.blit(self.board_layer, rect, rect)
+        rects.extend(board_rects)
+
+        # 힌트: 확률이나 화면이 바뀌었거나 아래 칸을 다시 그렸으면 지난 힌트를 지우고 새로 그림
+        hints = game_state.get('hints') if not game_state['game_over'] else None
+        hint_view = (hints, hints.version, self._camera, self.tile_size) if hints else None
+        if self._hint_rects and (hint_view != self._hint_view or board_rects):
+            for rect in self._hint_rects:
+                self.screen.blit(self.board_layer, rect, rect)
+            rects.extend(self._hint_rects if len(self._hint_rects) <= self.MAX_UPDATE_RECTS else [self.board_rect])
+            self._hint_rects = []
+            self._hint_view = None
+        if hints and hint_view != self._hint_view:
+            self._hint_rects = self.draw_hints(hints, self._camera)
+            self._hint_view = hint_view
+            rects.extend(self._hint_rects if len(self._hint_rects) <= self.MAX_UPDATE_RECTS else [self.board_rect])
+
+        # 보드 생성 진행 표시: 지난 프레임의 표시를 지우고 새로 그림
+        if self._overlay_rect:
+            self.screen.blit(self.board_layer, self._overlay_rect, self._overlay_rect)
+            rects.append(self._overlay_rect)
+            self._overlay_rect = None
+        if game_state.get('generation_job'):
+            self._overlay_rect = self.draw_generation_progress(game_state['generation_job'])
+            rects.append(self._overlay_rect)
+
+        # 프로파일러 오버레이는 바뀐 칸이나 진행 표시에 가려지지 않도록 맨 위에 다시 그림
+        if game_state.get('profiler'):
+            self._profiler_rect = self.draw_profiler(game_state['profiler'].overlay_lines())
+            rects.append(self._profiler_rect)
+
+        panel_rect = self.draw_ui(game_state)
+        if panel_rect:
+            rects.append(panel_rect)
 
-        pygame.display.flip()
+        if full:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
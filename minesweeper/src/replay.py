@@ -0,0 +1,299 @@
+import argparse
+import json
+import os
+import statistics
+import time
+
+from board import BoardFinite, BoardInfinite
+from board_mega import BoardMega
+from board_pool import pack_mask, unpack_mask
+from constants import TILE_SIZE_DEFAULT
+
+# 기록 이벤트 종류 (1바이트)
+REVEAL = 1  # (x, y) 칸 열기
+FLAG = 2  # (x, y) 깃발 꽂기/빼기
+CHORD = 3  # (x, y) 주변 한 번에 열기
+CAMERA = 4  # (dx, dy) 카메라 이동량 (직전 카메라 위치 기준)
+ZOOM = 5  # (타일 크기,)
+LAYOUT = 6  # (압축한 지뢰 마스크,) 유한 보드가 생성된 직후의 배치
+EVENT_NAMES = {REVEAL: 'reveal', FLAG: 'flag', CHORD: 'chord', CAMERA: 'camera', ZOOM: 'zoom', LAYOUT: 'layout'}
+BOARD_EVENTS = (REVEAL, FLAG, CHORD)
+
+
+def _put_varint(out, value):
+    """(내부용) 음이 아닌 정수를 7비트씩 나눠 `out`(bytearray)에 씁니다."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data, pos):
+    """(내부용) `pos`에서 정수 하나를 읽어 `(값, 다음 위치)`를 반환합니다."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+class SessionLog:
+    """게임 세션 하나의 설정(시드 포함)과 입력 기록.
+
+    이벤트는 `(프레임 번호, 종류, 인자 튜플)`이며 프레임 번호는 게임 시작부터 센 메인 루프 프레임입니다.
+    파일에는 매직/버전/설정 뒤에 이벤트마다 프레임 증가량, 종류 바이트, 인자를 가변 길이 정수로
+    씁니다(좌표와 이동량은 지그재그 부호화). 칸 조작 하나가 보통 4~6바이트입니다.
+    """
+    MAGIC = b'MSRP'
+    VERSION = 1
+    EXTENSION = '.msrec'
+
+    def __init__(self, settings):
+        # infinite, mega, width, height, mines, solvable, seed, density
+        self.settings = dict(settings)
+        self.events = []
+        self.frames = 0  # 기록한 프레임 수
+
+    @classmethod
+    def for_board(cls, board):
+        """보드의 설정과 시드로 빈 기록을 만듭니다."""
+        if isinstance(board, BoardInfinite):
+            return cls({'infinite': True, 'solvable': board.solvable, 'seed': board.seed, 'density': board.mine_density})
+        if isinstance(board, BoardMega):
+            return cls({'infinite': False, 'mega': True, 'width': board.width, 'height': board.height,
+                        'mines': board.mine_count, 'seed': board.seed})
+        return cls({'infinite': False, 'width': board.width, 'height': board.height, 'mines': board.mine_count,
+                    'solvable': board.solvable, 'seed': board.seed})
+
+    def new_board(self, workers=1, pool=None):
+        """기록의 설정과 시드로 새 보드를 만듭니다."""
+        settings = self.settings
+        if settings['infinite']:
+            return BoardInfinite(mine_density=settings['density'], seed=settings['seed'],
+                                 solvable=settings.get('solvable', False))
+        if settings.get('mega'):
+            return BoardMega(settings['width'], settings['height'], settings['mines'], seed=settings['seed'])
+        return BoardFinite(settings['width'], settings['height'], settings['mines'], settings['solvable'],
+                           seed=settings['seed'], workers=workers, pool=pool)
+
+    def add(self, frame, kind, *args):
+        self.events.append((frame, kind, args))
+        self.frames = max(self.frames, frame + 1)
+
+    def add_layout(self, frame, board):
+        self.add(frame, LAYOUT, pack_mask(board.mines))
+
+    @property
+    def board_ops(self):
+        return sum(1 for _, kind, _ in self.events if kind in BOARD_EVENTS)
+
+    def to_bytes(self):
+        settings = self.settings
+        out = bytearray(self.MAGIC)
+        out.append(self.VERSION)
+        out.append(settings['infinite'] | settings.get('solvable', False) << 1 | settings.get('mega', False) << 2)
+        if settings['infinite']:
+            _put_varint(out, round(settings['density'] * 1_000_000))  # 밀도는 백만분율로 저장
+        else:
+            for key in ('width', 'height', 'mines'):
+                _put_varint(out, settings[key])
+        _put_varint(out, _zigzag(settings['seed']))
+        _put_varint(out, self.frames)
+        _put_varint(out, len(self.events))
+        previous = 0
+        for frame, kind, args in self.events:
+            _put_varint(out, frame - previous)
+            previous = frame
+            out.append(kind)
+            if kind == LAYOUT:
+                _put_varint(out, len(args[0]))
+                out += args[0]
+            elif kind == ZOOM:
+                _put_varint(out, args[0])
+            else:
+                for value in args:
+                    _put_varint(out, _zigzag(value))
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != cls.MAGIC:
+            raise ValueError("Not a session recording")
+        if data[4] != cls.VERSION:
+            raise ValueError(f"Unsupported session recording version: {data[4]}")
+        flags = data[5]
+        pos = 6
+        settings = {'infinite': bool(flags & 1), 'solvable': bool(flags & 2), 'mega': bool(flags & 4)}
+        if settings['infinite']:
+            density, pos = _get_varint(data, pos)
+            settings['density'] = density / 1_000_000
+        else:
+            for key in ('width', 'height', 'mines'):
+                settings[key], pos = _get_varint(data, pos)
+        seed, pos = _get_varint(data, pos)
+        settings['seed'] = _unzigzag(seed)
+        log = cls(settings)
+        frames, pos = _get_varint(data, pos)
+        count, pos = _get_varint(data, pos)
+        frame = 0
+        for _ in range(count):
+            delta, pos = _get_varint(data, pos)
+            frame += delta
+            kind = data[pos]
+            pos += 1
+            if kind == LAYOUT:
+                size, pos = _get_varint(data, pos)
+                args = (bytes(data[pos:pos + size]),)
+                pos += size
+            elif kind == ZOOM:
+                value, pos = _get_varint(data, pos)
+                args = (value,)
+            elif kind in EVENT_NAMES:
+                x, pos = _get_varint(data, pos)
+                y, pos = _get_varint(data, pos)
+                args = (_unzigzag(x), _unzigzag(y))
+            else:
+                raise ValueError(f"Unknown event type in session recording: {kind}")
+            log.events.append((frame, kind, args))
+        log.frames = frames
+        return log
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def save_session(log, directory, keep):
+    """기록을 `directory`에 시각과 시드를 붙인 이름으로 저장하고, 가장 최근 `keep`개만 남깁니다. 경로를 반환합니다."""
+    name = time.strftime('session-%Y%m%d-%H%M%S') + f"-{log.settings['seed']}{SessionLog.EXTENSION}"
+    path = log.save(os.path.join(directory, name))
+    recordings = sorted(f for f in os.listdir(directory) if f.endswith(SessionLog.EXTENSION))
+    for old in recordings[:-keep]:
+        os.remove(os.path.join(directory, old))
+    return path
+
+
+def apply_board_event(board, kind, args):
+    """기록된 칸 조작(또는 배치) 이벤트 하나를 보드에 적용합니다. 카메라/확대 이벤트는 무시합니다."""
+    if kind == LAYOUT:
+        board.load_layout(unpack_mask(args[0], board.width * board.height))
+    elif kind == REVEAL:
+        board.reveal_cell(*args)
+    elif kind == FLAG:
+        board.toggle_flag(*args)
+    elif kind == CHORD:
+        board.chord(*args)
+
+
+def replay(log, renderer=None):
+    """기록을 화면 없이 최대한 빠르게 다시 실행하고 결과 사전을 반환합니다.
+
+    `renderer`를 주면 이벤트가 있던 프레임마다 보드를 그려 그리기 시간도 잽니다(카메라와 확대 반영).
+    """
+    board = log.new_board()
+    camera = (0, 0)
+    board_seconds = draw_seconds = 0.0
+    if renderer is not None:
+        renderer.set_tile_size(TILE_SIZE_DEFAULT)
+    events = log.events
+    i = 0
+    while i < len(events):
+        frame = events[i][0]
+        start = time.perf_counter()
+        while i < len(events) and events[i][0] == frame:
+            _, kind, args = events[i]
+            i += 1
+            if kind == CAMERA:
+                camera = (camera[0] + args[0], camera[1] + args[1])
+            elif kind == ZOOM:
+                if renderer is not None:
+                    renderer.set_tile_size(args[0])
+            else:
+                apply_board_event(board, kind, args)
+        if isinstance(board, BoardMega):
+            # 게임은 프레임마다 확장을 한 번씩 이어 가므로 다음 이벤트 프레임까지 같은 횟수만큼 진행
+            until = events[i][0] if i < len(events) else log.frames
+            for _ in range(until - frame):
+                if not board.flooding:
+                    break
+                board.advance()
+        middle = time.perf_counter()
+        board_seconds += middle - start
+        if renderer is not None:
+            renderer.draw_board(board, camera)
+            draw_seconds += time.perf_counter() - middle
+    if isinstance(board, BoardInfinite):
+        board.spill.close()
+    elif isinstance(board, BoardMega):
+        board.close()
+    result = 'win' if board.win else 'loss' if board.game_over else 'unfinished'
+    return {
+        'frames': log.frames,
+        'events': len(events),
+        'board_ops': log.board_ops,
+        'revealed': board.revealed_count,
+        'result': result,
+        'board_ms': round(board_seconds * 1000, 3),
+        'draw_ms': round(draw_seconds * 1000, 3) if renderer is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded session headlessly as fast as possible.")
+    parser.add_argument('path', help="session recording (.msrec)")
+    parser.add_argument('--render', action='store_true', help="also draw the board (dummy video driver) and time it")
+    parser.add_argument('--repeat', type=int, default=1, help="replay this many times and report the median times")
+    args = parser.parse_args()
+
+    log = SessionLog.load(args.path)
+    renderer = None
+    if args.render:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # 인사말이 JSON 출력에 섞이지 않도록
+        import pygame
+        from constants import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FONT_SIZE
+        from renderer import Renderer
+        pygame.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        sprites = {}
+        for name, color in (('flag_img', 'yellow'), ('mine_img', 'black'), ('mine_bomb_img', 'red')):
+            sprites[name] = pygame.Surface((TILE_SIZE_DEFAULT, TILE_SIZE_DEFAULT))
+            sprites[name].fill(pygame.Color(color))
+        font = pygame.font.Font(None, UI_FONT_SIZE)
+
+    results = []
+    for _ in range(args.repeat):
+        if args.render:
+            renderer = Renderer(screen, font, dict(sprites), None)
+        results.append(replay(log, renderer))
+    result = results[-1]
+    result['settings'] = log.settings
+    result['repeat'] = args.repeat
+    for key in ('board_ms', 'draw_ms'):
+        if result[key] is not None:
+            result[key] = statistics.median(r[key] for r in results)
+    print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from board import NO_CELL, BoardFinite, BoardInfinite
+from chunk import SPILL_ADJACENT_SHIFT, SPILL_MINE, SPILL_REVEALED
+from solver import Solver, TIER_ENUMERATION, TIER_NAMES
+
+GUESS_POLICIES = ('none', 'random', 'safest')  # 추론이 막혔을 때: 멈춤 / 무작위 / 지뢰 확률이 가장 낮은 칸
+
+
+class _PlayerSolver(Solver):
+    """(내부용) 칸을 직접 열지 않고 자동 플레이어를 통해 보드에서 여는 솔버.
+
+    `numbers`는 처음에 비어 있고, 보드에서 열린 칸이 확인될 때마다 `mark_revealed`로 채웁니다.
+    """
+    def __init__(self, player, width, height, mine_count, max_tier):
+        super().__init__(width, height, bytearray(width * height), mine_count, max_tier)
+        self.player = player
+
+    def open(self, index):
+        if self.revealed[index] or self.flagged[index]:
+            return 0
+        return self.player.reveal(index)
+
+    def flag(self, index):
+        if self.flagged[index] or self.revealed[index]:
+            return
+        super().flag(index)
+        self.player.flag(index)
+
+    def mark_revealed(self, index, number):
+        """보드에서 열린 칸을 반영합니다. `number`가 None이면 숫자를 쓸 수 없는 칸입니다."""
+        self.revealed[index] = 1
+        self.revealed_count += 1
+        if number is not None:
+            self.numbers[index] = number
+            self._enqueue(index)
+            if number:
+                self._frontier.add(index)
+        hidden = self.hidden_around
+        for n in self.neighbors(index):
+            hidden[n] -= 1
+            self._enqueue(n)
+
+
+class AutoPlayer:
+    """`Solver`의 추론으로 보드를 플레이하는 자동 플레이어.
+
+    보드는 공개 동작(`reveal_cell`, `toggle_flag`)으로만 조작하고, 판단에는 그 동작이 돌려준 변경의 숫자만 씁니다.
+    보드의 (x, y)에서 시작하는 width x height 창 안만 다루며, `bounded`가 False(무한맵)이면
+    창 가장자리 줄의 칸은 창 밖 이웃을 모르므로 열려도 숫자를 추론에 쓰지 않습니다.
+    추론이 막히면 `guess` 정책에 따라 칸을 찍거나 멈춥니다.
+    """
+    def __init__(self, board, x, y, width, height, mine_count=None, bounded=True,
+                 guess='random', max_tier=TIER_ENUMERATION, rng=None, mine_density=None):
+        if guess not in GUESS_POLICIES:
+            raise ValueError(f"Unknown guess policy: {guess}")
+        self.board = board
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.bounded = bounded
+        self.guess = guess
+        self.rng = rng or random.Random()
+        self.mine_density = mine_density  # 지뢰 수를 모를 때 프런티어 밖 칸의 지뢰 확률
+        self.solver = _PlayerSolver(self, width, height, mine_count, max_tier)
+        self.reveals = 0
+        self.flags = 0
+        self.guesses = 0
+
+    def reveal(self, index):
+        """창 안의 칸을 보드에서 열고, 새로 열린 칸을 솔버에 반영합니다. 반영한 칸 수를 반환합니다."""
+        y, x = divmod(index, self.width)
+        delta = self.board.reveal_cell(self.x + x, self.y + y)
+        self.reveals += 1
+        return self.apply(delta)
+
+    def flag(self, index):
+        y, x = divmod(index, self.width)
+        self.board.toggle_flag(self.x + x, self.y + y)
+        self.flags += 1
+
+    def apply(self, delta):
+        """보드 동작이 돌려준 `BoardDelta` 중 창 안에서 새로 열린 칸을 솔버에 반영합니다."""
+        solver = self.solver
+        width, height = self.width, self.height
+        opened = 0
+        for (cx, cy), state in delta:
+            x, y = cx - self.x, cy - self.y
+            if not (0 <= x < width and 0 <= y < height) or not state & SPILL_REVEALED or state & SPILL_MINE:
+                continue
+            index = y * width + x
+            if solver.revealed[index]:
+                continue
+            edge = not self.bounded and (x in (0, width - 1) or y in (0, height - 1))
+            solver.mark_revealed(index, None if edge else state >> SPILL_ADJACENT_SHIFT)
+            opened += 1
+        return opened
+
+    def sync(self):
+        """보드에 이미 열려 있는 창 안의 칸을 한 번에 읽어 솔버에 반영합니다."""
+        board, solver = self.board, self.solver
+        width = self.width
+        states = board.cell_states(self.x, self.y, width, self.height)
+        opened = 0
+        for index, state in enumerate(states):
+            if state == NO_CELL or not state & SPILL_REVEALED or state & SPILL_MINE or solver.revealed[index]:
+                continue
+            y, x = divmod(index, width)
+            edge = not self.bounded and (x in (0, width - 1) or y in (0, self.height - 1))
+            solver.mark_revealed(index, None if edge else state >> SPILL_ADJACENT_SHIFT)
+            opened += 1
+        return opened
+
+    def play(self, first_x=None, first_y=None):
+        """첫 칸(없으면 이미 열린 칸)부터 끝까지 플레이하고 'win', 'loss', 'stuck' 중 하나를 반환합니다.
+
+        무한맵에서 'win'은 창 안에 더 열 칸이 남지 않았다는 뜻입니다(가장자리 줄 제외).
+        """
+        board, solver = self.board, self.solver
+        if first_x is None:
+            self.sync()
+        else:
+            solver.open((first_y - self.y) * self.width + (first_x - self.x))
+        while not board.game_over:
+            if solver.solve() or board.game_over:
+                break
+            candidates = self._guess_candidates()
+            if not candidates:
+                break
+            if self.guess == 'none':
+                return 'stuck'
+            self.guesses += 1
+            solver.open(self._pick_guess(candidates))
+        if board.game_over:
+            return 'win' if board.win else 'loss'
+        return 'win'
+
+    def _guess_candidates(self):
+        """(내부용) 찍을 수 있는 칸 목록. 무한맵에서는 창 가장자리 줄을 제외합니다."""
+        solver = self.solver
+        width, height = self.width, self.height
+        candidates = []
+        for index in range(width * height):
+            if solver.revealed[index] or solver.flagged[index]:
+                continue
+            if not self.bounded:
+                y, x = divmod(index, width)
+                if x in (0, width - 1) or y in (0, height - 1):
+                    continue
+            candidates.append(index)
+        return candidates
+
+    def _pick_guess(self, candidates):
+        """(내부용) 정책에 따라 후보 중 찍을 칸을 고릅니다."""
+        if self.guess == 'random':
+            return self.rng.choice(candidates)
+
+        # 'safest': 열거할 수 있는 프런티어 성분은 배치별 지뢰 비율, 나머지 칸은 남은 지뢰 밀도로 추정
+        solver = self.solver
+        probabilities = {}
+        expected_mines = 0.0
+        frontier_size = 0
+        for cells, constraints in solver.components():
+            frontier_size += len(cells)
+            summary = solver.enumerate_component(cells, constraints)
+            if summary is None:
+                continue
+            solutions = sum(count for count, _ in summary.values())
+            for p, cell in enumerate(cells):
+                probability = sum(per_cell[p] for _, per_cell in summary.values()) / solutions
+                probabilities[cell] = probability
+                expected_mines += probability
+        rest = solver.unknown_count() - frontier_size
+        if solver.mine_count is not None and rest > 0:
+            density = max(0.0, solver.mine_count - solver.flagged_count - expected_mines) / rest
+        else:
+            density = self.mine_density if self.mine_density is not None else 0.5
+        best = min(probabilities.get(index, density) for index in candidates)
+        return self.rng.choice([index for index in candidates if probabilities.get(index, density) == best])
+
+
+def play_game(index, seed, options):
+    """게임 하나를 만들고 자동 플레이어로 끝까지 진행해 결과 사전을 반환합니다.
+
+    `options`는 `mode`('finite'/'infinite'), 보드 크기와 지뢰 수 또는 밀도, `guess`, `max_tier` 등입니다.
+    보드 생성 중의 안내 메시지는 출력하지 않습니다.
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(None):
+        if options['mode'] == 'infinite':
+            window = options['window']
+            board = BoardInfinite(mine_density=options['density'], seed=rng.getrandbits(32),
+                                  solvable=options['solvable'])
+            player = AutoPlayer(board, -(window // 2), -(window // 2), window, window, bounded=False,
+                                guess=options['guess'], max_tier=options['max_tier'], rng=rng,
+                                mine_density=options['density'])
+            outcome = player.play()
+            board.spill.close()
+            # 창 가장자리 줄의 숫자는 모르므로 가장자리에서 청크 하나 너비 안쪽만 셈
+            margin = board.CHUNK_SIZE
+            solver = player.solver
+            undecided = sum(1 for y in range(margin, window - margin) for x in range(margin, window - margin)
+                            if not solver.revealed[y * window + x] and not solver.flagged[y * window + x])
+        else:
+            width, height = options['width'], options['height']
+            board = BoardFinite(width, height, options['mines'], solvable=options['solvable'],
+                                seed=rng.getrandbits(64))
+            player = AutoPlayer(board, 0, 0, width, height, mine_count=options['mines'],
+                                guess=options['guess'], max_tier=options['max_tier'], rng=rng)
+            outcome = player.play(width // 2, height // 2)
+    result = {
+        'game': index,
+        'seed': seed,
+        'result': outcome,
+        'moves': player.reveals + player.flags,
+        'reveals': player.reveals,
+        'flags': player.flags,
+        'guesses': player.guesses,
+        'revealed': board.revealed_count,
+        'tier': TIER_NAMES[player.solver.tier],
+        'time_ms': round((time.perf_counter() - start) * 1000, 3),
+    }
+    if options['mode'] == 'infinite':
+        result['undecided'] = undecided  # 플레이어가 열지도 깃발을 꽂지도 못한 안쪽 칸 수
+    return result
+
+
+def needed_guess(result):
+    """게임에서 논리만으로 정하지 못한 칸이 있었는지 반환합니다(`--check` 판정).
+
+    무한맵은 창 안쪽에 정해지지 않은 칸이 남았는지, 유한맵은 찍었거나 막혔는지로 봅니다.
+    """
+    if 'undecided' in result:
+        return result['undecided'] > 0
+    return result['guesses'] > 0 or result['result'] == 'stuck'
+
+
+def _play_spec(spec):
+    """(내부용) 프로세스 풀에서 호출하는 `play_game` 래퍼."""
+    return play_game(*spec)
+
+
+def simulate(games, options, seed=0, workers=1, chunksize=16):
+    """게임 `games`판을 실행하며 끝나는 대로 결과 사전을 내보내는 제너레이터.
+
+    i번째 게임의 시드는 `seed + i`이므로 같은 인자로 다시 실행하면 같은 게임을 재현합니다.
+    `workers`가 2 이상이면 여러 프로세스에 나누어 실행하며, 이때 결과는 끝난 순서로 나옵니다.
+    """
+    specs = ((i, seed + i, options) for i in range(games))
+    if workers <= 1:
+        for spec in specs:
+            yield _play_spec(spec)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(_play_spec, specs, chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play games headlessly with the logical auto-player and stream JSON lines.")
+    parser.add_argument('--mode', choices=('finite', 'infinite'), default='finite')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--width', type=int, default=30)
+    parser.add_argument('--height', type=int, default=16)
+    parser.add_argument('--mines', type=int, default=99)
+    parser.add_argument('--solvable', action='store_true', help="generate 'no-guess' boards (chunk by chunk in infinite mode)")
+    parser.add_argument('--density', type=float, default=0.15, help="mine density (infinite mode)")
+    parser.add_argument('--window', type=int, default=48, help="side of the square area played around the origin (infinite mode)")
+    parser.add_argument('--guess', choices=GUESS_POLICIES, default='safest', help="what to do when deduction is stuck")
+    parser.add_argument('--max-tier', type=int, choices=sorted(TIER_NAMES), default=TIER_ENUMERATION,
+                        help="highest deduction tier the player may use")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game; game i uses seed + i")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--output', help="write per-game JSON lines to this file instead of stdout")
+    parser.add_argument('--check', action='store_true',
+                        help="exit with status 1 if any game left a cell that logic alone could not decide "
+                             "(use with --solvable --guess none)")
+    args = parser.parse_args()
+    if args.check and args.guess != 'none':
+        parser.error("--check needs --guess none")
+
+    options = {
+        'mode': args.mode,
+        'width': args.width,
+        'height': args.height,
+        'mines': args.mines,
+        'solvable': args.solvable,
+        'density': args.density,
+        'window': args.window,
+        'guess': args.guess,
+        'max_tier': args.max_tier,
+    }
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    totals = {'win': 0, 'loss': 0, 'stuck': 0}
+    guesses = 0
+    failed = []
+    start = time.perf_counter()
+    try:
+        for result in simulate(args.games, options, args.seed, args.workers):
+            out.write(json.dumps(result) + '\n')
+            totals[result['result']] += 1
+            guesses += result['guesses']
+            if needed_guess(result):
+                failed.append(result['seed'])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    played = sum(totals.values())
+    print(f"{played} games in {elapsed:.2f}s ({played / elapsed:.1f} games/s): "
+          f"{totals['win']} won, {totals['loss']} lost, {totals['stuck']} stuck, "
+          f"{guesses / max(played, 1):.2f} guesses/game", file=sys.stderr)
+    if args.check and failed:
+        print(f"Check failed: {len(failed)} game(s) needed a guess (seeds {sorted(failed)[:20]})", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
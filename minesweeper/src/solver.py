@@ -0,0 +1,441 @@
+from collections import deque
+from functools import lru_cache
+
+# 추론 규칙 단계. 풀이에 필요했던 가장 높은 단계가 `Solver.tier`에 기록됩니다.
+TIER_OPENING = 0      # 첫 클릭의 확장만으로 충분
+TIER_BASIC = 1        # 단일 칸 규칙 (깃발 수 == 숫자, 닫힌 칸 수 == 숫자)
+TIER_SUBSET = 2       # 두 제약의 부분집합/겹침 규칙
+TIER_GLOBAL = 3       # 남은 지뢰 수 규칙
+TIER_ENUMERATION = 4  # 작은 프런티어 성분의 완전 열거
+
+TIER_NAMES = {
+    TIER_OPENING: 'opening',
+    TIER_BASIC: 'basic',
+    TIER_SUBSET: 'subset',
+    TIER_GLOBAL: 'global',
+    TIER_ENUMERATION: 'enumeration',
+}
+
+# 완전 열거를 시도할 프런티어 성분의 최대 칸 수
+ENUMERATION_LIMIT = 18
+
+# 이웃 인덱스 표를 미리 만들어 둘 보드의 최대 칸 수 (더 크면 그때그때 계산)
+NEIGHBOR_TABLE_LIMIT = 1 << 16
+
+# `numbers`에서 숫자를 쓸 수 없는 칸(이웃이 풀이 영역 밖에 있는 칸)의 값. 열려도 제약이 되지 않음
+UNKNOWN_NUMBER = 9
+
+
+@lru_cache(maxsize=8)
+def neighbor_table(width, height):
+    """칸마다 주변 8칸의 평면 인덱스 튜플을 담은 표. 같은 크기의 보드끼리 공유합니다."""
+    # 안쪽 칸은 고정된 오프셋으로 한 번에 만들고, 가장자리 칸만 범위를 잘라 다시 계산
+    table = [(i - width - 1, i - width, i - width + 1, i - 1, i + 1, i + width - 1, i + width, i + width + 1)
+             for i in range(width * height)]
+    edges = set(range(width)) | set(range((height - 1) * width, height * width))
+    edges.update(y * width for y in range(height))
+    edges.update(y * width + width - 1 for y in range(height))
+    for index in edges:
+        y, x = divmod(index, width)
+        table[index] = tuple(ny * width + nx for ny in range(max(0, y - 1), min(height, y + 2))
+                             for nx in range(max(0, x - 1), min(width, x + 2)) if nx != x or ny != y)
+    return table
+
+
+@lru_cache(maxsize=8)
+def neighbor_counts(width, height):
+    """칸마다 보드 안에 있는 이웃 수(모서리 3, 가장자리 5, 안쪽 8)를 담은 행 우선 바이트열."""
+    columns = [min(x + 1, width - 1) - max(x - 1, 0) + 1 for x in range(width)]
+    rows = [min(y + 1, height - 1) - max(y - 1, 0) + 1 for y in range(height)]
+    patterns = {r: bytes(c * r - 1 for c in columns) for r in set(rows)}
+    return b''.join(patterns[r] for r in rows)
+
+
+class Solver:
+    """열린 칸의 숫자만으로 논리적 추론을 진행하는 지뢰찾기 솔버.
+
+    칸을 열거나 지뢰로 표시할 때마다 그 주변의 숫자 칸만 작업 목록(worklist)에 넣고
+    다시 검사하므로, 진행할 때마다 보드 전체를 다시 훑지 않습니다. 칸별 닫힌 이웃 수와 지뢰로
+    표시한 이웃 수(`hidden_around`, `flags_around`)도 그때그때 고쳐 두어 규칙 검사는 이웃을 세지 않습니다.
+    `numbers`는 행 우선 순서의 인접 지뢰 수 배열이며, 열린 칸의 값만 읽습니다. 값이
+    `UNKNOWN_NUMBER`인 칸은 열려도 규칙에 쓰이지 않으므로 더 큰 보드의 일부만 풀 수 있습니다.
+    `mine_count`를 알면 남은 지뢰 수 규칙도 사용하며, `max_tier`로 사용할 규칙 단계를 제한합니다.
+    """
+    def __init__(self, width, height, numbers, mine_count=None, max_tier=TIER_ENUMERATION):
+        self.width = width
+        self.height = height
+        self.numbers = numbers
+        self.mine_count = mine_count
+        self.max_tier = max_tier
+        size = width * height
+        self.revealed = bytearray(size)
+        self.flagged = bytearray(size)
+        self.revealed_count = 0
+        self.flagged_count = 0
+        self.hidden_around = bytearray(neighbor_counts(width, height))  # 칸별로 열리지도 표시되지도 않은 이웃 수
+        self.flags_around = bytearray(size)  # 칸별로 지뢰로 표시한 이웃 수
+        self.tier = TIER_OPENING
+        self._pending = deque()
+        self._queued = bytearray(size)
+        self._frontier = set()  # 닫힌 이웃이 남아 있을 수 있는 열린 숫자 칸
+        if size <= NEIGHBOR_TABLE_LIMIT:
+            self.neighbors = neighbor_table(width, height).__getitem__
+
+    def neighbors(self, index):
+        """평면 인덱스 기준으로 주변 8칸의 인덱스 목록을 반환합니다. 작은 보드는 미리 만든 표를 씁니다."""
+        width = self.width
+        y, x = divmod(index, width)
+        indices = []
+        for ny in range(max(0, y - 1), min(self.height, y + 2)):
+            row = ny * width
+            for nx in range(max(0, x - 1), min(width, x + 2)):
+                if nx != x or ny != y:
+                    indices.append(row + nx)
+        return indices
+
+    def _enqueue(self, index):
+        if self.revealed[index] and self.numbers[index] and not self._queued[index]:
+            self._queued[index] = 1
+            self._pending.append(index)
+
+    def open(self, index):
+        """안전한 칸을 열고, 0이면 주변으로 확장합니다. 새로 연 칸 수를 반환합니다."""
+        revealed, flagged, numbers = self.revealed, self.flagged, self.numbers
+        if revealed[index] or flagged[index]:
+            return 0
+        revealed[index] = 1
+        opened = 1
+        q = deque([index])
+        pending, queued = self._pending, self._queued
+        frontier = self._frontier
+        hidden = self.hidden_around
+        neighbors_of = self.neighbors
+        while q:
+            current = q.popleft()
+            number = numbers[current]
+            # 작업 목록에 넣는 검사(`_enqueue`)는 호출 비용을 줄이려고 풀어 씀
+            if number and not queued[current]:
+                queued[current] = 1
+                pending.append(current)
+            neighbors = neighbors_of(current)
+            for n in neighbors:
+                hidden[n] -= 1
+                if revealed[n] and numbers[n] and not queued[n]:
+                    queued[n] = 1
+                    pending.append(n)
+            if number == 0:
+                for n in neighbors:
+                    if not revealed[n] and not flagged[n]:
+                        revealed[n] = 1
+                        opened += 1
+                        q.append(n)
+            elif number != UNKNOWN_NUMBER:
+                frontier.add(current)
+        self.revealed_count += opened
+        return opened
+
+    def flag(self, index):
+        """지뢰로 확정된 칸을 표시합니다."""
+        if self.flagged[index] or self.revealed[index]:
+            return
+        self.flagged[index] = 1
+        self.flagged_count += 1
+        hidden, flags = self.hidden_around, self.flags_around
+        for n in self.neighbors(index):
+            hidden[n] -= 1
+            flags[n] += 1
+            self._enqueue(n)
+
+    def propagate(self):
+        """작업 목록이 빌 때까지 단일 칸 규칙을 적용합니다. 진행이 있었으면 True."""
+        revealed, flagged, numbers = self.revealed, self.flagged, self.numbers
+        hidden_around, flags_around = self.hidden_around, self.flags_around
+        pending, queued = self._pending, self._queued
+        progress = False
+        while pending:
+            index = pending.popleft()
+            queued[index] = 0
+            hidden = hidden_around[index]
+            if not hidden:
+                continue
+
+            number = numbers[index]
+            flags = flags_around[index]
+            # 규칙 1: 주변 깃발 수 == 칸의 숫자 -> 나머지 칸은 안전
+            if number == flags:
+                for n in self.neighbors(index):
+                    if not revealed[n] and not flagged[n]:
+                        self.open(n)
+                progress = True
+            # 규칙 2: (주변의 닫힌 칸 수) == (칸의 숫자) -> 닫힌 칸은 모두 지뢰
+            elif number == flags + hidden:
+                for n in self.neighbors(index):
+                    if not revealed[n] and not flagged[n]:
+                        self.flag(n)
+                progress = True
+        return progress
+
+    def unknown_count(self):
+        """열리지도, 지뢰로 표시되지도 않은 칸의 수."""
+        return self.width * self.height - self.revealed_count - self.flagged_count
+
+    def is_complete(self):
+        """모든 안전한 칸이 열렸는지 (지뢰 수를 모르면 미확정 칸이 없는지) 반환합니다."""
+        if self.mine_count is not None:
+            return self.revealed_count == self.width * self.height - self.mine_count
+        return self.unknown_count() == 0
+
+    def solve(self):
+        """규칙 단계를 낮은 것부터 적용하며 더 이상 진행할 수 없을 때까지 풉니다.
+
+        높은 단계의 규칙은 낮은 단계가 모두 막혔을 때만 사용하며, 사용한 최고 단계를
+        `tier`에 기록합니다. 모든 안전한 칸을 열었으면 True를 반환합니다.
+        """
+        while True:
+            if self.propagate():
+                self.tier = max(self.tier, TIER_BASIC)
+            if self.is_complete():
+                return True
+
+            for tier, rule in ((TIER_SUBSET, self._apply_pair_rules),
+                               (TIER_GLOBAL, self._apply_global_rule),
+                               (TIER_ENUMERATION, self._apply_enumeration)):
+                if tier <= self.max_tier and rule():
+                    self.tier = max(self.tier, tier)
+                    break
+            else:
+                return False
+
+    def _apply(self, safe, mines):
+        """(내부용) 추론 결과를 반영합니다. 반영한 것이 있으면 True."""
+        for index in mines:
+            self.flag(index)
+        for index in safe:
+            self.open(index)
+        return bool(safe or mines)
+
+    def constraints(self):
+        """프런티어의 제약 목록 `[(닫힌 칸 튜플, 남은 지뢰 수), ...]`을 반환합니다."""
+        revealed, flagged, numbers = self.revealed, self.flagged, self.numbers
+        result = {}
+        for index in list(self._frontier):
+            if not self.hidden_around[index]:
+                self._frontier.discard(index)
+                continue
+            unknown = tuple(n for n in self.neighbors(index) if not revealed[n] and not flagged[n])
+            result[unknown] = numbers[index] - self.flags_around[index]
+        return list(result.items())
+
+    def _apply_pair_rules(self):
+        """(내부용) 칸을 공유하는 두 제약 사이의 부분집합/겹침 규칙을 적용합니다."""
+        constraints = [(frozenset(cells), remaining) for cells, remaining in self.constraints()]
+        by_cell = {}
+        for ci, (cells, _) in enumerate(constraints):
+            for c in cells:
+                by_cell.setdefault(c, []).append(ci)
+
+        safe, mines = set(), set()
+        for ai, (a, ra) in enumerate(constraints):
+            partners = set()
+            for c in a:
+                partners.update(by_cell[c])
+            for bi in partners:
+                if bi == ai:
+                    continue
+                b, rb = constraints[bi]
+                only_a = a - b
+                if not only_a:
+                    continue
+                only_b_size = len(b) - (len(a) - len(only_a))
+                # 겹치는 칸에 들어갈 수 있는 지뢰 수의 범위
+                overlap_max = min(len(a) - len(only_a), ra, rb)
+                overlap_min = max(0, ra - len(only_a), rb - only_b_size)
+                if overlap_min > overlap_max:
+                    continue
+                if ra - overlap_max == len(only_a):
+                    mines.update(only_a)
+                elif ra - overlap_min == 0:
+                    safe.update(only_a)
+        return self._apply(safe, mines)
+
+    def _apply_global_rule(self):
+        """(내부용) 남은 지뢰 수가 0이거나 미확정 칸 수와 같으면 전부를 확정합니다."""
+        if self.mine_count is None:
+            return False
+        remaining = self.mine_count - self.flagged_count
+        if remaining != 0 and remaining != self.unknown_count():
+            return False
+        unknown = [i for i in range(self.width * self.height)
+                   if not self.revealed[i] and not self.flagged[i]]
+        if remaining == 0:
+            return self._apply(unknown, ())
+        return self._apply((), unknown)
+
+    def components(self):
+        """프런티어 제약을 닫힌 칸 공유 관계로 묶은 독립 성분 목록을 반환합니다.
+
+        각 성분은 `(칸 목록, 제약 목록)`이며, 칸 목록은 열거 시 가지치기가 잘 되도록
+        제약을 따라 방문한 순서로 정렬되어 있습니다.
+        """
+        constraints = self.constraints()
+        by_cell = {}
+        for ci, (cells, _) in enumerate(constraints):
+            for c in cells:
+                by_cell.setdefault(c, []).append(ci)
+
+        seen_constraints = set()
+        result = []
+        for start in range(len(constraints)):
+            if start in seen_constraints:
+                continue
+            seen_constraints.add(start)
+            order, placed, members = [], set(), []
+            q = deque([start])
+            while q:
+                ci = q.popleft()
+                members.append(constraints[ci])
+                for c in constraints[ci][0]:
+                    if c in placed:
+                        continue
+                    placed.add(c)
+                    order.append(c)
+                    for other in by_cell[c]:
+                        if other not in seen_constraints:
+                            seen_constraints.add(other)
+                            q.append(other)
+            result.append((order, members))
+        return result
+
+    @staticmethod
+    def enumerate_component(cells, constraints, limit=ENUMERATION_LIMIT):
+        """성분의 모든 일관된 지뢰 배치를 세어 지뢰 수별로 요약합니다.
+
+        반환값은 `{지뢰 수: [배치 수, 칸별 지뢰 배치 수 목록]}`이며, 칸 수가 `limit`를
+        넘으면 None을 반환합니다.
+        """
+        n = len(cells)
+        if n > limit:
+            return None
+        position = {c: i for i, c in enumerate(cells)}
+        targets = [remaining for _, remaining in constraints]
+        cell_constraints = [[] for _ in range(n)]
+        left = []
+        for ci, (members, _) in enumerate(constraints):
+            for c in members:
+                cell_constraints[position[c]].append(ci)
+            left.append(len(members))
+        placed = [0] * len(constraints)
+        assignment = [0] * n
+        results = {}
+
+        def search(i, k):
+            if i == n:
+                entry = results.get(k)
+                if entry is None:
+                    entry = results[k] = [0, [0] * n]
+                entry[0] += 1
+                counts = entry[1]
+                for p in range(n):
+                    if assignment[p]:
+                        counts[p] += 1
+                return
+            related = cell_constraints[i]
+            for value in (0, 1):
+                if any(placed[ci] + value > targets[ci] or placed[ci] + value + left[ci] - 1 < targets[ci]
+                       for ci in related):
+                    continue
+                assignment[i] = value
+                for ci in related:
+                    placed[ci] += value
+                    left[ci] -= 1
+                search(i + 1, k + value)
+                for ci in related:
+                    placed[ci] -= value
+                    left[ci] += 1
+            assignment[i] = 0
+
+        search(0, 0)
+        return results
+
+    def _apply_enumeration(self):
+        """(내부용) 작은 성분을 완전 열거하고, 지뢰 수를 알면 전역 지뢰 수와 결합해 확정합니다."""
+        summaries = []
+        frontier_size = 0
+        for cells, constraints in self.components():
+            frontier_size += len(cells)
+            summaries.append((cells, self.enumerate_component(cells, constraints)))
+
+        rest_size = self.unknown_count() - frontier_size
+        remaining = None if self.mine_count is None else self.mine_count - self.flagged_count
+
+        # 성분별 가능한 지뢰 수를 비트 집합(int)으로 표현 (열거하지 못한 성분은 전체 범위)
+        options = []
+        for cells, summary in summaries:
+            if summary is None:
+                options.append((1 << (len(cells) + 1)) - 1)
+            else:
+                options.append(sum(1 << k for k in summary))
+        # prefix[j]: 0..j-1 성분 합의 가능한 값, suffix[j]: j.. 성분 합의 가능한 값
+        prefix, suffix = [1], [1] * (len(options) + 1)
+        for opts in options:
+            prefix.append(_add_sets(prefix[-1], opts))
+        for j in range(len(options) - 1, -1, -1):
+            suffix[j] = _add_sets(suffix[j + 1], options[j])
+
+        def fits(k, j):
+            """(내부용) j 성분이 k개를 가질 때 나머지와 합쳐 전역 지뢰 수를 맞출 수 있는지."""
+            if remaining is None:
+                return True
+            low, high = remaining - rest_size - k, remaining - k
+            if high < 0:
+                return False
+            before, after = prefix[j], suffix[j + 1]
+            while before:
+                p = (before & -before).bit_length() - 1
+                before &= before - 1
+                if p > high:
+                    break
+                start = max(low - p, 0)
+                if (after >> start) & ((1 << (high - p - start + 1)) - 1):
+                    return True
+            return False
+
+        safe, mines = set(), set()
+        for j, (cells, summary) in enumerate(summaries):
+            if summary is None:
+                continue
+            valid = [k for k in summary if fits(k, j)]
+            if not valid:
+                continue
+            solutions = sum(summary[k][0] for k in valid)
+            for p, c in enumerate(cells):
+                mine_solutions = sum(summary[k][1][p] for k in valid)
+                if mine_solutions == 0:
+                    safe.add(c)
+                elif mine_solutions == solutions:
+                    mines.add(c)
+
+        # 프런티어 밖의 칸: 남은 지뢰가 프런티어에 모두 들어가거나 전혀 남지 않는 경우
+        if remaining is not None and rest_size > 0:
+            totals = prefix[-1]
+            rest_options = {remaining - t for t in range(totals.bit_length()) if totals >> t & 1}
+            rest_options = {r for r in rest_options if 0 <= r <= rest_size}
+            if rest_options in ({0}, {rest_size}):
+                frontier = {c for cells, _ in summaries for c in cells}
+                rest = [i for i in range(self.width * self.height)
+                        if not self.revealed[i] and not self.flagged[i] and i not in frontier]
+                if rest_options == {0}:
+                    safe.update(rest)
+                else:
+                    mines.update(rest)
+        return self._apply(safe, mines)
+
+
+def _add_sets(a, b):
+    """(내부용) 비트 집합으로 표현한 두 정수 집합의 합 집합 {x + y}을 반환합니다."""
+    result = 0
+    while b:
+        low = b & -b
+        result |= a << (low.bit_length() - 1)
+        b ^= low
+    return result